@@ -0,0 +1,31 @@
+"""add evaluation listing indexes
+
+Revision ID: 20261018_01
+Revises: 20241102_01
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "20261018_01"
+down_revision: Union[str, None] = "20241102_01"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_evaluations_created_at_id", "evaluations", ["created_at", "id"])
+    op.create_index("ix_evaluations_status_created_at_id", "evaluations", ["status", "created_at", "id"])
+    op.create_index("ix_evaluations_owner_created_at_id", "evaluations", ["owner_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evaluations_owner_created_at_id", table_name="evaluations")
+    op.drop_index("ix_evaluations_status_created_at_id", table_name="evaluations")
+    op.drop_index("ix_evaluations_created_at_id", table_name="evaluations")
@@ -0,0 +1,29 @@
+"""add tool content hash
+
+Revision ID: 20261018_02
+Revises: 20261018_01
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018_02"
+down_revision: Union[str, None] = "20261018_01"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("tools", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("tools") as batch_op:
+        batch_op.drop_column("content_hash")
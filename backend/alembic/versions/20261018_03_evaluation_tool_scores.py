@@ -0,0 +1,63 @@
+"""add evaluation tool scores
+
+Revision ID: 20261018_03
+Revises: 20261018_02
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018_03"
+down_revision: Union[str, None] = "20261018_02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CRITERIA_COLUMNS = (
+    "ai_assistance",
+    "reporting",
+    "maintenance",
+    "execution",
+    "cross_browser",
+    "ci_cd",
+    "budget_fit",
+    "team_skill_fit",
+    "language_fit",
+    "analytics",
+    "community",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evaluation_tool_scores",
+        sa.Column(
+            "evaluation_id",
+            sa.String(length=36),
+            sa.ForeignKey("evaluations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("tool_id", sa.Integer(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("total_score", sa.Float(), nullable=False),
+        sa.Column("normalized_score", sa.Float(), nullable=False),
+        *[sa.Column(name, sa.Float(), nullable=False) for name in CRITERIA_COLUMNS],
+    )
+    op.create_index(
+        "ix_evaluation_tool_scores_tool_created_at", "evaluation_tool_scores", ["tool_id", "created_at"]
+    )
+    op.create_index("ix_evaluation_tool_scores_rank_created_at", "evaluation_tool_scores", ["rank", "created_at"])
+    # Existing evaluations are indexed by ``python -m app.services.score_index``.
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evaluation_tool_scores_rank_created_at", table_name="evaluation_tool_scores")
+    op.drop_index("ix_evaluation_tool_scores_tool_created_at", table_name="evaluation_tool_scores")
+    op.drop_table("evaluation_tool_scores")
@@ -0,0 +1,50 @@
+"""add shared evaluation results
+
+Revision ID: 20261018_04
+Revises: 20261018_03
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018_04"
+down_revision: Union[str, None] = "20261018_03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evaluation_results",
+        sa.Column("fingerprint", sa.String(length=64), primary_key=True),
+        sa.Column("snapshot", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    # Existing evaluations keep their inline snapshots.
+    with op.batch_alter_table("evaluations") as batch_op:
+        batch_op.add_column(sa.Column("result_fingerprint", sa.String(length=64), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_evaluations_result_fingerprint", "evaluation_results", ["result_fingerprint"], ["fingerprint"]
+        )
+        batch_op.create_index("ix_evaluations_result_fingerprint", ["result_fingerprint"])
+
+
+def downgrade() -> None:
+    # Copy shared results back inline before the table goes away.
+    op.execute(
+        "UPDATE evaluations SET results_snapshot = ("
+        "SELECT snapshot FROM evaluation_results WHERE fingerprint = evaluations.result_fingerprint"
+        ") WHERE result_fingerprint IS NOT NULL"
+    )
+    with op.batch_alter_table("evaluations") as batch_op:
+        batch_op.drop_index("ix_evaluations_result_fingerprint")
+        batch_op.drop_constraint("fk_evaluations_result_fingerprint", type_="foreignkey")
+        batch_op.drop_column("result_fingerprint")
+    op.drop_table("evaluation_results")
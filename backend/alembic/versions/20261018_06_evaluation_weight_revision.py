@@ -0,0 +1,34 @@
+"""keep reweighted profiles next to the original weight profile
+
+Revision ID: 20261018_06
+Revises: 20261018_05
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018_06"
+down_revision: Union[str, None] = "20261018_05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("evaluations") as batch_op:
+        batch_op.add_column(sa.Column("revised_weight_profile", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    # Earlier revisions stored a reweight by overwriting the profile.
+    op.execute(
+        "UPDATE evaluations SET weight_profile = revised_weight_profile WHERE revised_weight_profile IS NOT NULL"
+    )
+    with op.batch_alter_table("evaluations") as batch_op:
+        batch_op.drop_column("revised_weight_profile")
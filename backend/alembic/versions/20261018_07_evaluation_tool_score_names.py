@@ -0,0 +1,37 @@
+"""store tool names in evaluation tool scores
+
+Revision ID: 20261018_07
+Revises: 20261018_06
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018_07"
+down_revision: Union[str, None] = "20261018_06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("evaluation_tool_scores") as batch_op:
+        batch_op.add_column(sa.Column("tool_name", sa.String(length=100), nullable=True))
+    op.create_index(
+        "ix_evaluation_tool_scores_name_created_at", "evaluation_tool_scores", ["tool_name", "created_at"]
+    )
+    # Names come from the stored snapshots, not the current tools, whose ids
+    # may have been reused; existing rows are named by
+    # ``python -m app.services.score_index``.
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evaluation_tool_scores_name_created_at", table_name="evaluation_tool_scores")
+    with op.batch_alter_table("evaluation_tool_scores") as batch_op:
+        batch_op.drop_column("tool_name")
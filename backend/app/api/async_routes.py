@@ -0,0 +1,106 @@
+"""Async variants of the sync route handlers for the optional async database engine."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import Any, Callable
+
+from fastapi import APIRouter, Depends
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+
+
+def cpu_bound(handler: Callable[..., Any]) -> Callable[..., Any]:
+    """Keep a pure-compute handler on the threadpool with a sync session under ``async_router``.
+
+    Through ``run_sync`` a handler's Python work runs on the event loop, so
+    a handler that only computes over the cached catalogue would stall every
+    other request there. Handlers that also do database I/O get an
+    ``async_variant`` instead.
+    """
+
+    handler.cpu_bound = True
+    return handler
+
+
+def async_variant(handler: Callable[..., Any]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Register the decorated coroutine as ``handler``'s endpoint under ``async_router``.
+
+    Variants await their database I/O on an ``AsyncSession`` and send the
+    computation in between to the threadpool.
+    """
+
+    def register(variant: Callable[..., Any]) -> Callable[..., Any]:
+        handler.async_variant = variant
+        return variant
+
+    return register
+
+
+def _async_parameter(parameter: inspect.Parameter) -> inspect.Parameter:
+    if parameter.name == "session":
+        return parameter.replace(default=Depends(deps.get_async_db_session), annotation=AsyncSession)
+    if getattr(parameter.default, "dependency", None) is deps.get_current_user:
+        return parameter.replace(default=Depends(deps.get_current_user_async))
+    return parameter
+
+
+def async_endpoint(handler: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a sync handler taking ``session`` so it runs on an ``AsyncSession``.
+
+    The handler body executes through ``AsyncSession.run_sync``: its ORM calls
+    are unchanged, but database I/O awaits the async driver on the event loop
+    instead of blocking a threadpool worker. Authentication moves to the same
+    ``AsyncSession``.
+    """
+
+    signature = inspect.signature(handler, eval_str=True)
+    parameters = [_async_parameter(parameter) for parameter in signature.parameters.values()]
+
+    @functools.wraps(handler)
+    async def endpoint(**kwargs: Any) -> Any:
+        session: AsyncSession = kwargs.pop("session")
+        return await session.run_sync(lambda sync_session: handler(session=sync_session, **kwargs))
+
+    endpoint.__signature__ = signature.replace(parameters=parameters)
+    return endpoint
+
+
+def async_router(router: APIRouter) -> APIRouter:
+    """Copy a router, swapping each sync handler that uses ``session`` for an async endpoint.
+
+    A registered ``async_variant`` is used as is; other handlers are wrapped
+    by ``async_endpoint``. Handlers that are already coroutines (such as the
+    streaming imports) and handlers marked ``cpu_bound`` are kept as they are.
+    """
+
+    converted = APIRouter()
+    for route in router.routes:
+        if not isinstance(route, APIRoute):
+            converted.routes.append(route)
+            continue
+        endpoint = route.endpoint
+        convert = not inspect.iscoroutinefunction(endpoint) and not getattr(endpoint, "cpu_bound", False)
+        if hasattr(endpoint, "async_variant"):
+            endpoint = endpoint.async_variant
+        elif convert and "session" in inspect.signature(endpoint).parameters:
+            endpoint = async_endpoint(endpoint)
+        converted.add_api_route(
+            route.path,
+            endpoint,
+            response_model=route.response_model,
+            status_code=route.status_code,
+            tags=route.tags,
+            dependencies=route.dependencies,
+            summary=route.summary,
+            description=route.description,
+            responses=route.responses,
+            methods=route.methods,
+            name=route.name,
+            response_class=route.response_class,
+            include_in_schema=route.include_in_schema,
+        )
+    return converted
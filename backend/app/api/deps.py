@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
 
 from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
 from app.core.config import get_settings
 from app.models import User
 
@@ -16,11 +18,13 @@ def get_db_session() -> Generator[Session, None, None]:
     yield from get_db()
 
 
-def get_current_user(
-    request: Request,
-    session: Session = Depends(get_db),
-) -> User:
-    """Retrieve the demo user from the provided bearer token."""
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async for session in get_async_db():
+        yield session
+
+
+def _admin_email(request: Request) -> str:
+    """Check the bearer token and return the email of the user it authenticates."""
 
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.lower().startswith("bearer "):
@@ -32,8 +36,30 @@ def get_current_user(
     if token != settings.secret_key:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = session.query(User).filter(User.email == settings.default_admin_email).first()
+    return settings.default_admin_email
+
+
+def _initialised(user: Optional[User]) -> User:
     if not user:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User not initialised")
-
     return user
+
+
+def get_current_user(
+    request: Request,
+    session: Session = Depends(get_db),
+) -> User:
+    """Retrieve the demo user from the provided bearer token."""
+
+    email = _admin_email(request)
+    return _initialised(session.query(User).filter(User.email == email).first())
+
+
+async def get_current_user_async(
+    request: Request,
+    session: AsyncSession = Depends(get_async_db_session),
+) -> User:
+    """``get_current_user`` for async routes, looking the user up on the request's ``AsyncSession``."""
+
+    email = _admin_email(request)
+    return _initialised(await session.scalar(select(User).where(User.email == email).limit(1)))
@@ -0,0 +1,37 @@
+"""Conditional GET helpers: strong ETags, ``If-None-Match`` and ``Cache-Control``."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Dict
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: str) -> str:
+    """Return a strong, quoted ETag derived from the given version parts."""
+
+    digest = hashlib.sha256(":".join(parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's ``If-None-Match`` already names ``etag``.
+
+    ``If-None-Match`` uses weak comparison, so a ``W/`` prefix is ignored.
+    """
+
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def cache_headers(etag: str, cache_control: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag, cache_control))
@@ -0,0 +1,137 @@
+"""Cross-evaluation analytics over the per-tool score index."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.models import EvaluationToolScore, Tool
+from app.schemas.analytics import ToolPlacement, ToolPlacementReport, ToolScoreReport, ToolScoreStats
+from app.services.scoring_matrix import CRITERIA_KEYS
+
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+scores = EvaluationToolScore.__table__
+
+
+def _in_range(query: Any, created_after: Optional[datetime], created_before: Optional[datetime]) -> Any:
+    if created_after is not None:
+        query = query.where(scores.c.created_at >= created_after)
+    if created_before is not None:
+        query = query.where(scores.c.created_at < created_before)
+    return query
+
+
+def _named(query: Any) -> Any:
+    # Rows indexed before names were stored are left out until the backfill names them.
+    return query.where(scores.c.tool_name.is_not(None)).group_by(scores.c.tool_name)
+
+
+def _with_tool_ids(aggregate: Any) -> Any:
+    # History is grouped on the stored name, since a replace import reuses ids;
+    # the id is that of the current tool with the name, if it is still listed.
+    grouped = aggregate.subquery()
+    return select(grouped, Tool.id.label("tool_id")).outerjoin(Tool, Tool.name == grouped.c.tool_name), grouped
+
+
+@router.get("/tools/placements", response_model=ToolPlacementReport)
+def read_tool_placements(
+    depth: int = Query(default=3, ge=1, le=50),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    session: Session = Depends(deps.get_db_session),
+) -> ToolPlacementReport:
+    """Count how often each tool finished within the leading ``depth`` ranks."""
+
+    placements = func.count().label("placements")
+    aggregate = _in_range(
+        select(
+            scores.c.tool_name,
+            placements,
+            func.sum(case((scores.c.rank == 1, 1), else_=0)).label("first_places"),
+        ).where(scores.c.rank <= depth),
+        created_after,
+        created_before,
+    )
+    query, grouped = _with_tool_ids(_named(aggregate))
+    rows = session.execute(query.order_by(grouped.c.placements.desc(), grouped.c.tool_name).limit(limit)).all()
+
+    # Every indexed evaluation has exactly one first place.
+    evaluations = session.execute(
+        _in_range(select(func.count()).select_from(scores).where(scores.c.rank == 1), created_after, created_before)
+    ).scalar_one()
+
+    return ToolPlacementReport(
+        depth=depth,
+        created_after=created_after,
+        created_before=created_before,
+        evaluations=evaluations,
+        tools=[
+            ToolPlacement(
+                tool_id=row.tool_id,
+                tool_name=row.tool_name,
+                placements=row.placements,
+                first_places=row.first_places or 0,
+            )
+            for row in rows
+        ],
+    )
+
+
+@router.get("/tools/scores", response_model=ToolScoreReport)
+def read_tool_scores(
+    tool_id: Optional[List[int]] = Query(default=None),
+    tool_name: Optional[List[str]] = Query(default=None),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    session: Session = Depends(deps.get_db_session),
+) -> ToolScoreReport:
+    """Average scores, rank and criteria values per tool across evaluations.
+
+    ``tool_id`` selects current tools, whose history is found by name;
+    ``tool_name`` also reaches tools no longer in the catalogue.
+    """
+
+    aggregate = select(
+        scores.c.tool_name,
+        func.count().label("evaluations"),
+        func.avg(scores.c.total_score).label("average_total_score"),
+        func.avg(scores.c.normalized_score).label("average_normalized_score"),
+        func.avg(scores.c.rank).label("average_rank"),
+        func.min(scores.c.rank).label("best_rank"),
+        *[func.avg(scores.c[key]).label(key) for key in CRITERIA_KEYS],
+    )
+    if tool_id or tool_name:
+        names = select(Tool.name).where(Tool.id.in_(tool_id or []))
+        aggregate = aggregate.where(scores.c.tool_name.in_(names) | scores.c.tool_name.in_(tool_name or []))
+    aggregate = _in_range(aggregate, created_after, created_before)
+    query, grouped = _with_tool_ids(_named(aggregate))
+    rows = session.execute(
+        query.order_by(grouped.c.average_normalized_score.desc(), grouped.c.tool_name).limit(limit)
+    ).all()
+
+    return ToolScoreReport(
+        created_after=created_after,
+        created_before=created_before,
+        tools=[
+            ToolScoreStats(
+                tool_id=row.tool_id,
+                tool_name=row.tool_name,
+                evaluations=row.evaluations,
+                average_total_score=round(row.average_total_score, 2),
+                average_normalized_score=round(row.average_normalized_score, 2),
+                average_rank=round(row.average_rank, 2),
+                best_rank=row.best_rank,
+                criteria={key: round(getattr(row, key), 2) for key in CRITERIA_KEYS},
+            )
+            for row in rows
+        ],
+    )
@@ -2,44 +2,319 @@
 
 from __future__ import annotations
 
-from typing import List
+import base64
+import binascii
+import csv
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 
 from app.api import deps
+from app.api.async_routes import async_variant, cpu_bound
+from app.api.http_cache import cache_headers, etag_matches, make_etag, not_modified
+from app.core.config import get_settings
+from app.core.metrics import stage
+from app.core.database import SessionLocal
 from app.models import Evaluation
 from app.schemas.evaluation import (
+    EvaluationBatchItem,
+    EvaluationBatchRequest,
+    EvaluationBatchResponse,
     EvaluationOut,
+    EvaluationPage,
     EvaluationRequest,
     EvaluationResultPayload,
+    EvaluationSummary,
+    ResultCacheStats,
+    ReweightRequest,
+    ReweightResult,
+    RobustnessReport,
+    RobustnessRequest,
+    SensitivityReport,
+    SensitivityRequest,
 )
-from app.services.evaluation_service import EvaluationEngine
+from app.schemas.job import EvaluationBatchJobItem, EvaluationBatchJobResult, JobToolScore
+from app.services.catalogue_cache import CatalogueSnapshot, get_catalogue
+from app.services.evaluation_service import (
+    EvaluationEngine,
+    apply_weight_overrides,
+    load_catalogue,
+    resolve_weights,
+    weight_table,
+)
+from app.services.jobs import JobContext, job_runner
+from app.services.result_cache import result_cache
+from app.services.result_store import (
+    SHARED_SNAPSHOT,
+    evaluation_snapshot,
+    join_shared_results,
+    load_result,
+    release_result,
+    result_fingerprint,
+    reweighted_fingerprint,
+    store_result,
+)
+from app.services.score_index import tool_score_rows, unindex_evaluation, write_tool_scores
+from app.services.scoring_matrix import CRITERIA_KEYS
+from app.services.sensitivity import analyse_sensitivity
+from app.services.snapshots import decode_snapshot, encode_snapshot, snapshot_matrix
 
 
 router = APIRouter(prefix="/evaluations", tags=["evaluations"])
 
 
 def _snapshot_payload(payload: EvaluationResultPayload) -> dict:
+    return encode_snapshot(payload)
+
+
+def _evaluation_out(source: Any, snapshot: Optional[dict] = None) -> EvaluationOut:
+    """Serialise an evaluation row (ORM object or dict) with its snapshot in API shape."""
+
+    evaluation = EvaluationOut.model_validate(source, from_attributes=True)
+    evaluation.results_snapshot = snapshot if snapshot is not None else decode_snapshot(evaluation_snapshot(source))
+    return evaluation
+
+
+def _evaluation_record(
+    request: EvaluationRequest, result: EvaluationResultPayload, fingerprint: str, now: datetime
+) -> dict:
+    # Ids and timestamps are assigned up front so score rows can be derived before the insert.
     return {
-        "default_weights": payload.default_weights,
-        "scored_tools": [item.model_dump() for item in payload.scored_tools],
-        "recommended_tool_ids": payload.recommended_tool_ids,
-        "radar_categories": payload.radar_categories,
-        "bar_chart_data": payload.bar_chart_data,
+        "id": str(uuid.uuid4()),
+        "title": request.title or "Untitled Evaluation",
+        "summary": request.summary,
+        "answers": request.answers.dict(),
+        "weight_profile": result.default_weights,
+        "results_snapshot": {},
+        "result_fingerprint": fingerprint,
+        "status": "completed",
+        "created_at": now,
+        "updated_at": now,
     }
 
 
-def _build_payload(evaluation: Evaluation) -> EvaluationResultPayload:
-    snapshot = evaluation.results_snapshot or {}
-    payload = EvaluationResultPayload(
-        evaluation=EvaluationOut.from_orm(evaluation),
-        default_weights=snapshot.get("default_weights", {}),
-        scored_tools=snapshot.get("scored_tools", []),
-        recommended_tool_ids=snapshot.get("recommended_tool_ids", []),
-        radar_categories=snapshot.get("radar_categories", []),
-        bar_chart_data=snapshot.get("bar_chart_data", []),
+def _scenario_fingerprint(catalogue: CatalogueSnapshot, request: EvaluationRequest) -> str:
+    weights = resolve_weights(request.answers, request.weight_overrides)
+    return result_fingerprint(request.answers.dict(), weights, request.top_k, catalogue.fingerprint)
+
+
+def _current_weights(evaluation: Evaluation) -> Dict[str, float]:
+    """Return the weights of an evaluation's current result: its latest revision or the original profile."""
+
+    return evaluation.revised_weight_profile or evaluation.weight_profile or {}
+
+
+def _stored_payload(decoded: dict) -> EvaluationResultPayload:
+    """Rebuild an engine result from a decoded snapshot."""
+
+    return EvaluationResultPayload(
+        evaluation=None,
+        default_weights=decoded.get("default_weights", {}),
+        scored_tools=decoded.get("scored_tools", []),
+        recommended_tool_ids=decoded.get("recommended_tool_ids", []),
+        radar_categories=decoded.get("radar_categories", []),
+        bar_chart_data=decoded.get("bar_chart_data", []),
+    )
+
+
+def _with_result(evaluation_id: str) -> Any:
+    """Select an evaluation with its shared result, so reading its snapshot needs no lazy load."""
+
+    return select(Evaluation).options(joinedload(Evaluation.result)).where(Evaluation.id == evaluation_id)
+
+
+def _run_request(catalogue: CatalogueSnapshot, request: EvaluationRequest) -> EvaluationResultPayload:
+    return EvaluationEngine.run(
+        catalogue,
+        answers=request.answers,
+        weight_overrides=request.weight_overrides,
+        top_k=request.top_k,
+        include_aggregate_scores=request.include_aggregate_scores,
+        include_pareto=request.include_pareto,
+    )
+
+
+def _score_or_reuse(
+    catalogue: CatalogueSnapshot, request: EvaluationRequest, stored: Optional[dict]
+) -> Tuple[EvaluationResultPayload, dict]:
+    """Score a request that will be persisted, reusing an identical stored result.
+
+    Returns the payload and the snapshot to store under the request's
+    fingerprint: ``stored`` if there is one, else the encoded payload.
+    """
+
+    # Aggregates and the Pareto front are not stored, so those requests still score.
+    if stored is not None and not (request.include_aggregate_scores or request.include_pareto):
+        return _stored_payload(decode_snapshot(stored)), stored
+    result = _run_request(catalogue, request)
+    return result, stored if stored is not None else _snapshot_payload(result)
+
+
+def _score_for_storage(
+    session: Session, request: EvaluationRequest
+) -> Tuple[EvaluationResultPayload, str, dict]:
+    """Score a request that will be persisted; returns the payload, its fingerprint and snapshot.
+
+    The fingerprint and the scores come from the same catalogue snapshot.
+    """
+
+    catalogue = load_catalogue(session)
+    fingerprint = _scenario_fingerprint(catalogue, request)
+    result, snapshot = _score_or_reuse(catalogue, request, load_result(session, fingerprint))
+    return result, fingerprint, snapshot
+
+
+def _persisted_out(evaluation: Any, snapshot: dict) -> EvaluationOut:
+    return _evaluation_out(evaluation, decode_snapshot(snapshot))
+
+
+def _insert_evaluation(session: Session, record: dict, snapshot: dict, rows: List[dict]) -> Evaluation:
+    """Store a new evaluation with its shared result and score rows, and commit."""
+
+    store_result(session, record["result_fingerprint"], snapshot)
+    evaluation = Evaluation(**record)
+    session.add(evaluation)
+    session.flush()
+    write_tool_scores(session, evaluation.id, rows, replace=False)
+    session.commit()
+    session.refresh(evaluation)
+    return evaluation
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
     )
+
+
+# Columns needed to list evaluations; the snapshot and answers are never loaded.
+SUMMARY_COLUMNS = (
+    Evaluation.id,
+    Evaluation.title,
+    Evaluation.summary,
+    Evaluation.status,
+    Evaluation.owner_id,
+    Evaluation.created_at,
+    Evaluation.updated_at,
+)
+
+
+# Summary columns plus the payload columns written by the bulk export; the
+# shared snapshot needs ``join_shared_results``.
+EXPORT_COLUMNS = SUMMARY_COLUMNS + (
+    Evaluation.answers,
+    Evaluation.weight_profile,
+    Evaluation.revised_weight_profile,
+    Evaluation.results_snapshot,
+    SHARED_SNAPSHOT,
+)
+
+EXPORT_BATCH_SIZE = 500
+# Leading scored tools kept per item in a batch job's result.
+JOB_RESULT_TOP_TOOLS = 5
+STREAM_CHUNK_SIZE = 65536
+
+
+class _Echo:
+    """File-like sink that hands each written line back, for ``csv.writer``."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _chunked(lines: Iterable[str]) -> Iterator[str]:
+    """Join streamed lines into ~64 KB chunks rather than one write per line."""
+
+    parts: List[str] = []
+    size = 0
+    for line in lines:
+        parts.append(line)
+        size += len(line)
+        if size >= STREAM_CHUNK_SIZE:
+            yield "".join(parts)
+            parts = []
+            size = 0
+    if parts:
+        yield "".join(parts)
+
+
+def _apply_filters(
+    query: Any,
+    status_filter: Optional[str],
+    owner_id: Optional[int],
+    created_after: Optional[datetime],
+    created_before: Optional[datetime],
+) -> Any:
+    if status_filter is not None:
+        query = query.where(Evaluation.status == status_filter)
+    if owner_id is not None:
+        query = query.where(Evaluation.owner_id == owner_id)
+    if created_after is not None:
+        query = query.where(Evaluation.created_at >= created_after)
+    if created_before is not None:
+        query = query.where(Evaluation.created_at < created_before)
+    return query
+
+
+def _export_record(evaluation: Any) -> dict:
+    return {
+        "id": evaluation.id,
+        "title": evaluation.title,
+        "summary": evaluation.summary,
+        "answers": evaluation.answers,
+        "weight_profile": evaluation.weight_profile,
+        "revised_weight_profile": evaluation.revised_weight_profile,
+        "results": decode_snapshot(evaluation_snapshot(evaluation)),
+        "created_at": evaluation.created_at.isoformat(),
+        "updated_at": evaluation.updated_at.isoformat(),
+    }
+
+
+def _export_tool_rows(evaluation: Any) -> Iterator[dict]:
+    """Yield one flat row per scored tool of an evaluation."""
+
+    snapshot = decode_snapshot(evaluation_snapshot(evaluation))
+    for tool in snapshot.get("scored_tools", []):
+        row = {
+            "evaluation_id": evaluation.id,
+            "created_at": evaluation.created_at.isoformat(),
+            "tool_id": tool["tool_id"],
+            "tool_name": tool["tool_name"],
+            "rank": tool["rank"],
+            "total_score": tool["total_score"],
+            "normalized_score": tool["normalized_score"],
+        }
+        row.update({key: tool["criteria"][key]["value"] for key in CRITERIA_KEYS})
+        yield row
+
+
+def _encode_cursor(created_at: datetime, evaluation_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), evaluation_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, evaluation_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(evaluation_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from None
+
+
+def _build_payload(evaluation: Evaluation) -> EvaluationResultPayload:
+    snapshot = decode_snapshot(evaluation_snapshot(evaluation))
+    payload = _stored_payload(snapshot)
+    payload.evaluation = _evaluation_out(evaluation, snapshot)
     return payload
 
 
@@ -49,68 +324,690 @@ def run_evaluation(
     session: Session = Depends(deps.get_db_session),
     _: object = Depends(deps.get_current_user),
 ) -> EvaluationResultPayload:
-    """Execute the scoring engine and optionally persist the evaluation."""
-
-    result = EvaluationEngine.run(session, answers=request.answers, weight_overrides=request.weight_overrides)
-
-    if request.persist:
-        evaluation = Evaluation(
-            title=request.title or "Untitled Evaluation",
-            summary=request.summary,
-            answers=request.answers.dict(),
-            weight_profile=result.default_weights,
-            results_snapshot=_snapshot_payload(result),
-            status="completed",
-        )
-        session.add(evaluation)
-        session.commit()
-        session.refresh(evaluation)
-        result.evaluation = EvaluationOut.from_orm(evaluation)
-    else:
+    """Execute the scoring engine and optionally persist the evaluation.
+
+    Persisted runs of a scenario that is already stored reuse its result
+    instead of scoring and storing it again.
+    """
+
+    if not request.persist:
+        result = _run_request(load_catalogue(session), request)
+        result.evaluation = None
+        return result
+
+    result, fingerprint, snapshot = _score_for_storage(session, request)
+    with stage("persist"):
+        record = _evaluation_record(request, result, fingerprint, datetime.utcnow())
+        rows = tool_score_rows(record["id"], record["created_at"], snapshot)
+        evaluation = _insert_evaluation(session, record, snapshot, rows)
+    result.evaluation = _persisted_out(evaluation, snapshot)
+    return result
+
+
+@async_variant(run_evaluation)
+async def run_evaluation_async(
+    request: EvaluationRequest,
+    session: AsyncSession = Depends(deps.get_async_db_session),
+    _: object = Depends(deps.get_current_user_async),
+) -> EvaluationResultPayload:
+    catalogue = await session.run_sync(load_catalogue)
+    if not request.persist:
+        result = await run_in_threadpool(_run_request, catalogue, request)
         result.evaluation = None
+        return result
 
+    fingerprint = _scenario_fingerprint(catalogue, request)
+    stored = await session.run_sync(load_result, fingerprint)
+    result, snapshot = await run_in_threadpool(_score_or_reuse, catalogue, request, stored)
+    with stage("persist"):
+        record = _evaluation_record(request, result, fingerprint, datetime.utcnow())
+        rows = await run_in_threadpool(tool_score_rows, record["id"], record["created_at"], snapshot)
+        evaluation = await session.run_sync(_insert_evaluation, record, snapshot, rows)
+    result.evaluation = await run_in_threadpool(_persisted_out, evaluation, snapshot)
     return result
 
 
-@router.get("/", response_model=List[EvaluationOut])
-def list_evaluations(session: Session = Depends(deps.get_db_session)) -> List[EvaluationOut]:
-    evaluations = session.query(Evaluation).order_by(Evaluation.created_at.desc()).all()
-    return [EvaluationOut.from_orm(item) for item in evaluations]
+def _score_items(
+    catalogue: CatalogueSnapshot, raw_items: Sequence[Dict[str, Any]], offset: int = 0
+) -> Tuple[List[EvaluationBatchItem], List[Tuple[int, dict]]]:
+    """Validate and score batch items; returns the items and the records of those to persist.
+
+    Item indexes start at ``offset``.
+    """
+
+    items = [EvaluationBatchItem(index=offset + index) for index in range(len(raw_items))]
+    valid: List[Tuple[int, EvaluationRequest]] = []
+    for index, raw in enumerate(raw_items):
+        try:
+            valid.append((index, EvaluationRequest.model_validate(raw)))
+        except ValidationError as exc:
+            items[index].error = _format_validation_error(exc)
+
+    results = EvaluationEngine.run_batch(catalogue, [request for _, request in valid])
+
+    now = datetime.utcnow()
+    persisted: List[Tuple[int, dict]] = []
+    for (index, request), result in zip(valid, results):
+        items[index].result = result
+        if request.persist:
+            fingerprint = _scenario_fingerprint(catalogue, request)
+            persisted.append((index, _evaluation_record(request, result, fingerprint, now)))
+    return items, persisted
+
+
+def _load_results(session: Session, persisted: List[Tuple[int, dict]]) -> Dict[str, Optional[dict]]:
+    fingerprints = {record["result_fingerprint"] for _, record in persisted}
+    return {fingerprint: load_result(session, fingerprint) for fingerprint in fingerprints}
+
+
+def _batch_snapshots(
+    items: List[EvaluationBatchItem], persisted: List[Tuple[int, dict]], stored: Dict[str, Optional[dict]]
+) -> Tuple[Dict[str, dict], Dict[str, List[dict]]]:
+    """Return the snapshot to store per fingerprint and the score rows per evaluation id."""
+
+    # Identical scenarios, in this batch or already stored, share one result row.
+    snapshots: Dict[str, dict] = {}
+    rows: Dict[str, List[dict]] = {}
+    for index, record in persisted:
+        fingerprint = record["result_fingerprint"]
+        if fingerprint not in snapshots:
+            snapshot = stored[fingerprint]
+            snapshots[fingerprint] = snapshot if snapshot is not None else _snapshot_payload(items[index].result)
+        rows[record["id"]] = tool_score_rows(record["id"], record["created_at"], snapshots[fingerprint])
+    return snapshots, rows
+
+
+def _insert_batch(
+    session: Session, persisted: List[Tuple[int, dict]], snapshots: Dict[str, dict], rows: Dict[str, List[dict]]
+) -> bool:
+    """Write a batch's results, evaluations and score rows in one transaction; ``False`` if it was rolled back."""
+
+    try:
+        for fingerprint, snapshot in snapshots.items():
+            store_result(session, fingerprint, snapshot)
+        session.execute(insert(Evaluation), [record for _, record in persisted])
+        for _, record in persisted:
+            write_tool_scores(session, record["id"], rows[record["id"]], replace=False)
+        session.commit()
+    except SQLAlchemyError:
+        session.rollback()
+        return False
+    return True
+
+
+def _attach_evaluations(
+    items: List[EvaluationBatchItem], persisted: List[Tuple[int, dict]], snapshots: Dict[str, dict], written: bool
+) -> None:
+    for index, record in persisted:
+        if written:
+            items[index].result.evaluation = _persisted_out(record, snapshots[record["result_fingerprint"]])
+        else:
+            items[index].error = "Evaluation scored but could not be persisted"
+
+
+def _score_batch(
+    session: Session, raw_items: Sequence[Dict[str, Any]], offset: int = 0
+) -> List[EvaluationBatchItem]:
+    """Validate, score and persist batch items; item indexes start at ``offset``."""
+
+    items, persisted = _score_items(load_catalogue(session), raw_items, offset)
+    if persisted:
+        snapshots, rows = _batch_snapshots(items, persisted, _load_results(session, persisted))
+        _attach_evaluations(items, persisted, snapshots, _insert_batch(session, persisted, snapshots, rows))
+    return items
+
+
+def _check_batch_size(batch: EvaluationBatchRequest) -> None:
+    settings = get_settings()
+    if len(batch.items) > settings.evaluation_batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch exceeds {settings.evaluation_batch_max_items} items",
+        )
+
+
+def _batch_response(items: List[EvaluationBatchItem]) -> EvaluationBatchResponse:
+    failed = sum(1 for item in items if item.error)
+    return EvaluationBatchResponse(items=items, succeeded=len(items) - failed, failed=failed)
+
+
+@router.post("/run/batch", response_model=EvaluationBatchResponse)
+def run_evaluation_batch(
+    batch: EvaluationBatchRequest,
+    session: Session = Depends(deps.get_db_session),
+    _: object = Depends(deps.get_current_user),
+) -> EvaluationBatchResponse:
+    """Score many answer sets in one pass and persist them with a single bulk insert."""
+
+    _check_batch_size(batch)
+    return _batch_response(_score_batch(session, batch.items))
+
+
+@async_variant(run_evaluation_batch)
+async def run_evaluation_batch_async(
+    batch: EvaluationBatchRequest,
+    session: AsyncSession = Depends(deps.get_async_db_session),
+    _: object = Depends(deps.get_current_user_async),
+) -> EvaluationBatchResponse:
+    _check_batch_size(batch)
+    catalogue = await session.run_sync(load_catalogue)
+    items, persisted = await run_in_threadpool(_score_items, catalogue, batch.items)
+    if persisted:
+        stored = await session.run_sync(_load_results, persisted)
+        snapshots, rows = await run_in_threadpool(_batch_snapshots, items, persisted, stored)
+        written = await session.run_sync(_insert_batch, persisted, snapshots, rows)
+        await run_in_threadpool(_attach_evaluations, items, persisted, snapshots, written)
+    return _batch_response(items)
+
+
+def _job_item(item: EvaluationBatchItem) -> EvaluationBatchJobItem:
+    """Reduce a batch item to what the job row keeps: ids and the leading scores."""
+
+    compact = EvaluationBatchJobItem(index=item.index, error=item.error)
+    if item.result is not None:
+        compact.evaluation_id = item.result.evaluation.id if item.result.evaluation is not None else None
+        compact.recommended_tool_ids = item.result.recommended_tool_ids
+        compact.top_tools = [
+            JobToolScore(
+                tool_id=tool.tool_id,
+                rank=tool.rank,
+                total_score=tool.total_score,
+                normalized_score=tool.normalized_score,
+            )
+            for tool in item.result.scored_tools[:JOB_RESULT_TOP_TOOLS]
+        ]
+    return compact
+
+
+def _evaluation_batch_job(session: Session, payload: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """Run a queued batch in chunks, reporting progress and checking for cancellation in between.
+
+    Every chunk is persisted as it completes, so a cancelled job keeps the
+    evaluations of the chunks that finished. The job row keeps only compact
+    per-item results; full payloads are read through ``/evaluations/{id}``.
+    """
+
+    raw_items = payload["items"]
+    chunk_size = get_settings().job_batch_chunk_size
+    items: List[EvaluationBatchJobItem] = []
+    for start in range(0, len(raw_items), chunk_size):
+        context.check_cancelled()
+        chunk = _score_batch(session, raw_items[start : start + chunk_size], offset=start)
+        items += [_job_item(item) for item in chunk]
+        context.report(len(items), len(raw_items))
+
+    failed = sum(1 for item in items if item.error)
+    return EvaluationBatchJobResult(items=items, succeeded=len(items) - failed, failed=failed).model_dump(mode="json")
+
+
+job_runner.register("evaluation_batch", _evaluation_batch_job)
+
+
+@router.post("/sensitivity", response_model=SensitivityReport)
+@cpu_bound
+def analyse_evaluation_sensitivity(
+    request: SensitivityRequest,
+    session: Session = Depends(deps.get_db_session),
+) -> SensitivityReport:
+    """Report weight intervals keeping the leading ranking stable for ad-hoc answers."""
+
+    return EvaluationEngine.sensitivity(
+        load_catalogue(session),
+        answers=request.answers,
+        weight_overrides=request.weight_overrides,
+        max_weight=request.max_weight,
+        depth=request.depth,
+    )
+
+
+@router.post("/robustness", response_model=RobustnessReport)
+@cpu_bound
+def analyse_evaluation_robustness(
+    request: RobustnessRequest,
+    session: Session = Depends(deps.get_db_session),
+) -> RobustnessReport:
+    """Monte Carlo rank probabilities under perturbed weight profiles."""
+
+    return EvaluationEngine.robustness(
+        load_catalogue(session),
+        answers=request.answers,
+        weight_overrides=request.weight_overrides,
+        samples=request.samples,
+        distribution=request.distribution,
+        spread=request.spread,
+        seed=request.seed,
+        depth=request.depth,
+    )
+
+
+@router.get("/", response_model=EvaluationPage)
+def list_evaluations(
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[str] = None,
+    status_filter: Optional[str] = Query(default=None, alias="status"),
+    owner_id: Optional[int] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    session: Session = Depends(deps.get_db_session),
+) -> EvaluationPage:
+    """List evaluations newest first, one keyset page at a time.
+
+    Pages are ordered by ``(created_at, id)`` and continue strictly after the
+    row encoded in ``cursor``, so each page is an index range scan regardless
+    of depth. Only summary columns are selected.
+    """
+
+    settings = get_settings()
+    limit = min(limit or settings.evaluation_page_size, settings.evaluation_page_size_max)
+
+    query = _apply_filters(session.query(*SUMMARY_COLUMNS), status_filter, owner_id, created_after, created_before)
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                Evaluation.created_at < cursor_created_at,
+                and_(Evaluation.created_at == cursor_created_at, Evaluation.id < cursor_id),
+            )
+        )
+
+    rows = query.order_by(Evaluation.created_at.desc(), Evaluation.id.desc()).limit(limit + 1).all()
+    items = [EvaluationSummary.model_validate(row, from_attributes=True) for row in rows[:limit]]
+    next_cursor = _encode_cursor(items[-1].created_at, items[-1].id) if len(rows) > limit else None
+    return EvaluationPage(items=items, next_cursor=next_cursor)
+
+
+@router.get("/export")
+def export_evaluations(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    flatten: bool = False,
+    status_filter: Optional[str] = Query(default=None, alias="status"),
+    owner_id: Optional[int] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+) -> StreamingResponse:
+    """Stream every matching evaluation, newest first, as NDJSON or CSV.
+
+    Rows are fetched in batches through ``yield_per`` (a server-side cursor
+    where the driver supports one), so memory stays flat with table size.
+    With ``flatten`` each scored tool becomes its own row. The stream opens
+    its own session because request-scoped dependencies close before the
+    body is sent.
+    """
+
+    statement = _apply_filters(
+        join_shared_results(select(*EXPORT_COLUMNS)), status_filter, owner_id, created_after, created_before
+    )
+    statement = statement.order_by(Evaluation.created_at.desc(), Evaluation.id.desc()).execution_options(
+        yield_per=EXPORT_BATCH_SIZE
+    )
+
+    def records() -> Iterator[dict]:
+        session = SessionLocal.session_factory()
+        try:
+            for evaluation in session.execute(statement):
+                if flatten:
+                    yield from _export_tool_rows(evaluation)
+                else:
+                    yield _export_record(evaluation)
+        finally:
+            session.close()
+
+    def lines() -> Iterator[str]:
+        if format == "ndjson":
+            for record in records():
+                yield json.dumps(record) + "\n"
+            return
+
+        writer = csv.writer(_Echo())
+        if flatten:
+            fields = ["evaluation_id", "created_at", "tool_id", "tool_name", "rank", "total_score", "normalized_score"]
+            yield writer.writerow([*fields, *CRITERIA_KEYS])
+            for record in records():
+                yield writer.writerow(list(record.values()))
+            return
+
+        fields = [
+            "id",
+            "title",
+            "summary",
+            "created_at",
+            "updated_at",
+            "answers",
+            "weight_profile",
+            "revised_weight_profile",
+            "recommended_tool_ids",
+        ]
+        yield writer.writerow(fields)
+        for record in records():
+            results = record["results"]
+            yield writer.writerow(
+                [
+                    record["id"],
+                    record["title"],
+                    record["summary"],
+                    record["created_at"],
+                    record["updated_at"],
+                    json.dumps(record["answers"]),
+                    json.dumps(record["weight_profile"]),
+                    json.dumps(record["revised_weight_profile"]),
+                    json.dumps(results.get("recommended_tool_ids", [])),
+                ]
+            )
+
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/csv"
+    return StreamingResponse(
+        _chunked(lines()),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="evaluations.{format}"'},
+    )
+
+
+@router.get("/cache/stats", response_model=ResultCacheStats)
+def read_result_cache_stats() -> ResultCacheStats:
+    """Return hit/miss/eviction counters of the evaluation result cache."""
+
+    return ResultCacheStats(**result_cache.stats())
+
+
+@router.get("/weight-profiles/export")
+def export_weight_profiles(format: Literal["csv", "ndjson"] = "csv") -> StreamingResponse:
+    """Stream every weight profile of the bucketed answer space for audit."""
+
+    def rows() -> Iterator[str]:
+        writer = csv.writer(_Echo())
+        for position, (bucket, weights) in enumerate(weight_table.profiles()):
+            if format == "ndjson":
+                yield json.dumps({"answers": bucket, "weights": weights}) + "\n"
+                continue
+            if position == 0:
+                yield writer.writerow([*bucket.keys(), *weights.keys()])
+            yield writer.writerow([*bucket.values(), *weights.values()])
+
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/csv"
+    return StreamingResponse(
+        _chunked(rows()),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="weight-profiles.{format}"'},
+    )
+
+
+def _evaluation_etag(evaluation_id: str, updated_at: datetime) -> str:
+    return make_etag("evaluation", evaluation_id, updated_at.isoformat())
 
 
 @router.get("/{evaluation_id}", response_model=EvaluationResultPayload)
-def get_evaluation(evaluation_id: str, session: Session = Depends(deps.get_db_session)) -> EvaluationResultPayload:
-    evaluation = session.query(Evaluation).filter(Evaluation.id == evaluation_id).first()
+def get_evaluation(
+    evaluation_id: str,
+    request: Request,
+    response: Response,
+    session: Session = Depends(deps.get_db_session),
+) -> EvaluationResultPayload:
+    # Only updated_at is read to answer a revalidation; the snapshot stays unloaded.
+    updated_at = session.query(Evaluation.updated_at).filter(Evaluation.id == evaluation_id).scalar()
+    if updated_at is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
+
+    etag = _evaluation_etag(evaluation_id, updated_at)
+    cache_control = get_settings().evaluation_cache_control
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+
+    evaluation = session.scalar(_with_result(evaluation_id))
     if not evaluation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
 
+    # Re-derived from the loaded row in case it changed since the first read.
+    response.headers.update(cache_headers(_evaluation_etag(evaluation.id, evaluation.updated_at), cache_control))
     return _build_payload(evaluation)
 
 
-@router.put("/{evaluation_id}", response_model=EvaluationResultPayload)
-def update_evaluation(
+@async_variant(get_evaluation)
+async def get_evaluation_async(
     evaluation_id: str,
-    request: EvaluationRequest,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(deps.get_async_db_session),
+) -> EvaluationResultPayload:
+    updated_at = await session.scalar(select(Evaluation.updated_at).where(Evaluation.id == evaluation_id))
+    if updated_at is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
+
+    etag = _evaluation_etag(evaluation_id, updated_at)
+    cache_control = get_settings().evaluation_cache_control
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+
+    evaluation = await session.scalar(_with_result(evaluation_id))
+    if not evaluation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
+
+    response.headers.update(cache_headers(_evaluation_etag(evaluation.id, evaluation.updated_at), cache_control))
+    return await run_in_threadpool(_build_payload, evaluation)
+
+
+def _stored_sensitivity(
+    evaluation: Evaluation, catalogue: CatalogueSnapshot, max_weight: float, depth: int
+) -> SensitivityReport:
+    tool_ids, _, values = snapshot_matrix(evaluation_snapshot(evaluation))
+    weights = _current_weights(evaluation)
+
+    # Stored tools are in rank order; ties are broken in catalogue order as a fresh run would.
+    order = catalogue.matrix.catalogue_order(tool_ids)
+    tool_ids = [tool_ids[index] for index in order.tolist()]
+    report = analyse_sensitivity(tool_ids, values[order], weights, max_weight=max_weight, depth=depth)
+    return SensitivityReport(evaluation_id=evaluation.id, weights=weights, **report)
+
+
+@router.get("/{evaluation_id}/sensitivity", response_model=SensitivityReport)
+def get_evaluation_sensitivity(
+    evaluation_id: str,
+    max_weight: float = Query(default=5.0, gt=0.1),
+    depth: int = Query(default=3, ge=1, le=10),
+    session: Session = Depends(deps.get_db_session),
+) -> SensitivityReport:
+    """Analyse a stored evaluation using the criteria values captured in its snapshot."""
+
+    evaluation = session.scalar(_with_result(evaluation_id))
+    if not evaluation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
+    return _stored_sensitivity(evaluation, get_catalogue(session), max_weight, depth)
+
+
+@async_variant(get_evaluation_sensitivity)
+async def get_evaluation_sensitivity_async(
+    evaluation_id: str,
+    max_weight: float = Query(default=5.0, gt=0.1),
+    depth: int = Query(default=3, ge=1, le=10),
+    session: AsyncSession = Depends(deps.get_async_db_session),
+) -> SensitivityReport:
+    evaluation = await session.scalar(_with_result(evaluation_id))
+    if not evaluation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
+    catalogue = await session.run_sync(get_catalogue)
+    return await run_in_threadpool(_stored_sensitivity, evaluation, catalogue, max_weight, depth)
+
+
+def _check_criteria(request: ReweightRequest) -> None:
+    unknown = sorted(set(request.weights) - set(CRITERIA_KEYS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown criteria: {', '.join(unknown)}",
+        )
+
+
+def _reweight(
+    evaluation: Evaluation, request: ReweightRequest, catalogue: CatalogueSnapshot
+) -> Tuple[Dict[str, float], List[dict], int, bool]:
+    """Re-rank a stored evaluation; returns the weights, ranked rows, unchanged count and whether to persist."""
+
+    current = _current_weights(evaluation)
+    weights = apply_weight_overrides(current, request.weights)
+    ranked, unchanged = EvaluationEngine.reweight(evaluation_snapshot(evaluation), weights, catalogue.matrix)
+    # Nothing is written when the weights leave the stored ranking as it is.
+    return weights, ranked, unchanged, request.persist and weights != current
+
+
+def _revision_snapshot(
+    evaluation: Evaluation, weights: Dict[str, float], ranked: List[dict], stored: Optional[dict]
+) -> Tuple[dict, List[dict]]:
+    """Return the snapshot of a reweighted revision and its score rows."""
+
+    snapshot = stored
+    if snapshot is None:
+        payload = EvaluationEngine.reweighted_payload(evaluation_snapshot(evaluation), weights, ranked)
+        snapshot = _snapshot_payload(payload)
+    return snapshot, tool_score_rows(evaluation.id, evaluation.created_at, snapshot)
+
+
+def _store_revision(
+    session: Session,
+    evaluation: Evaluation,
+    weights: Dict[str, float],
+    fingerprint: str,
+    snapshot: dict,
+    rows: List[dict],
+) -> None:
+    # Shared results are immutable: the new ranking is stored under its own fingerprint.
+    previous = evaluation.result_fingerprint
+    store_result(session, fingerprint, snapshot)
+    evaluation.revised_weight_profile = weights
+    evaluation.result_fingerprint = fingerprint
+    evaluation.results_snapshot = {}
+    session.add(evaluation)
+    write_tool_scores(session, evaluation.id, rows)
+    release_result(session, previous)
+    session.commit()
+
+
+def _reweight_result(
+    evaluation_id: str, weights: Dict[str, float], ranked: List[dict], unchanged: int, persisted: bool
+) -> ReweightResult:
+    return ReweightResult(
+        evaluation_id=evaluation_id,
+        weights=weights,
+        changes=[row for row in ranked if row["changed"]],
+        unchanged=unchanged,
+        persisted=persisted,
+    )
+
+
+@router.post("/{evaluation_id}/reweight", response_model=ReweightResult)
+def reweight_evaluation(
+    evaluation_id: str,
+    request: ReweightRequest,
     session: Session = Depends(deps.get_db_session),
     _: object = Depends(deps.get_current_user),
-) -> EvaluationResultPayload:
-    evaluation = session.query(Evaluation).filter(Evaluation.id == evaluation_id).first()
+) -> ReweightResult:
+    """Re-rank a stored evaluation under new weights using its stored criteria values.
+
+    Overrides apply on top of the current weights. Only tools whose score or
+    rank moved are returned. With ``persist`` the re-ranked result is stored
+    as a new revision: it replaces the evaluation's result and its weights are
+    kept as ``revised_weight_profile``, next to the original ``weight_profile``.
+    """
+
+    _check_criteria(request)
+    evaluation = session.scalar(_with_result(evaluation_id))
+    if not evaluation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
+
+    catalogue = get_catalogue(session)
+    weights, ranked, unchanged, persisted = _reweight(evaluation, request, catalogue)
+    if persisted:
+        fingerprint = reweighted_fingerprint(evaluation, weights, catalogue.fingerprint)
+        stored = load_result(session, fingerprint)
+        snapshot, rows = _revision_snapshot(evaluation, weights, ranked, stored)
+        _store_revision(session, evaluation, weights, fingerprint, snapshot, rows)
+
+    return _reweight_result(evaluation_id, weights, ranked, unchanged, persisted)
+
+
+@async_variant(reweight_evaluation)
+async def reweight_evaluation_async(
+    evaluation_id: str,
+    request: ReweightRequest,
+    session: AsyncSession = Depends(deps.get_async_db_session),
+    _: object = Depends(deps.get_current_user_async),
+) -> ReweightResult:
+    _check_criteria(request)
+    evaluation = await session.scalar(_with_result(evaluation_id))
     if not evaluation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
 
+    catalogue = await session.run_sync(get_catalogue)
+    weights, ranked, unchanged, persisted = await run_in_threadpool(_reweight, evaluation, request, catalogue)
+    if persisted:
+        fingerprint = reweighted_fingerprint(evaluation, weights, catalogue.fingerprint)
+        stored = await session.run_sync(load_result, fingerprint)
+        snapshot, rows = await run_in_threadpool(_revision_snapshot, evaluation, weights, ranked, stored)
+        await session.run_sync(_store_revision, evaluation, weights, fingerprint, snapshot, rows)
+
+    return _reweight_result(evaluation_id, weights, ranked, unchanged, persisted)
+
+
+def _store_update(
+    session: Session,
+    evaluation: Evaluation,
+    request: EvaluationRequest,
+    result: EvaluationResultPayload,
+    fingerprint: str,
+    snapshot: dict,
+    rows: List[dict],
+) -> None:
+    previous = evaluation.result_fingerprint
+    store_result(session, fingerprint, snapshot)
     evaluation.title = request.title or evaluation.title
     evaluation.summary = request.summary or evaluation.summary
     evaluation.answers = request.answers.dict()
-
-    result = EvaluationEngine.run(session, answers=request.answers, weight_overrides=request.weight_overrides)
     evaluation.weight_profile = result.default_weights
-    evaluation.results_snapshot = _snapshot_payload(result)
+    evaluation.revised_weight_profile = None
+    evaluation.result_fingerprint = fingerprint
+    evaluation.results_snapshot = {}
 
     session.add(evaluation)
+    write_tool_scores(session, evaluation.id, rows)
+    release_result(session, previous)
     session.commit()
     session.refresh(evaluation)
 
-    result.evaluation = EvaluationOut.from_orm(evaluation)
+
+@router.put("/{evaluation_id}", response_model=EvaluationResultPayload)
+def update_evaluation(
+    evaluation_id: str,
+    request: EvaluationRequest,
+    session: Session = Depends(deps.get_db_session),
+    _: object = Depends(deps.get_current_user),
+) -> EvaluationResultPayload:
+    evaluation = session.query(Evaluation).filter(Evaluation.id == evaluation_id).first()
+    if not evaluation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
+
+    result, fingerprint, snapshot = _score_for_storage(session, request)
+    rows = tool_score_rows(evaluation.id, evaluation.created_at, snapshot)
+    _store_update(session, evaluation, request, result, fingerprint, snapshot, rows)
+    result.evaluation = _persisted_out(evaluation, snapshot)
+    return result
+
+
+@async_variant(update_evaluation)
+async def update_evaluation_async(
+    evaluation_id: str,
+    request: EvaluationRequest,
+    session: AsyncSession = Depends(deps.get_async_db_session),
+    _: object = Depends(deps.get_current_user_async),
+) -> EvaluationResultPayload:
+    evaluation = await session.get(Evaluation, evaluation_id)
+    if not evaluation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
+
+    catalogue = await session.run_sync(load_catalogue)
+    fingerprint = _scenario_fingerprint(catalogue, request)
+    stored = await session.run_sync(load_result, fingerprint)
+    result, snapshot = await run_in_threadpool(_score_or_reuse, catalogue, request, stored)
+    rows = await run_in_threadpool(tool_score_rows, evaluation.id, evaluation.created_at, snapshot)
+    await session.run_sync(_store_update, evaluation, request, result, fingerprint, snapshot, rows)
+    result.evaluation = await run_in_threadpool(_persisted_out, evaluation, snapshot)
     return result
 
 
@@ -124,7 +1021,10 @@ def delete_evaluation(
     if not evaluation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
 
+    # SQLite does not enforce the cascade unless foreign keys are switched on.
+    unindex_evaluation(session, evaluation.id)
     session.delete(evaluation)
+    release_result(session, evaluation.result_fingerprint)
     session.commit()
 
 
@@ -132,17 +1032,19 @@ def delete_evaluation(
 def export_evaluation_json(evaluation_id: str, session: Session = Depends(deps.get_db_session)) -> dict:
     """Return a JSON snapshot of the evaluation data."""
 
-    evaluation = session.query(Evaluation).filter(Evaluation.id == evaluation_id).first()
+    evaluation = session.scalar(_with_result(evaluation_id))
     if not evaluation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
 
-    return {
-        "id": evaluation.id,
-        "title": evaluation.title,
-        "summary": evaluation.summary,
-        "answers": evaluation.answers,
-        "weight_profile": evaluation.weight_profile,
-        "results": evaluation.results_snapshot,
-        "created_at": evaluation.created_at.isoformat(),
-        "updated_at": evaluation.updated_at.isoformat(),
-    }
+    return _export_record(evaluation)
+
+
+@async_variant(export_evaluation_json)
+async def export_evaluation_json_async(
+    evaluation_id: str, session: AsyncSession = Depends(deps.get_async_db_session)
+) -> dict:
+    evaluation = await session.scalar(_with_result(evaluation_id))
+    if not evaluation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evaluation not found")
+
+    return await run_in_threadpool(_export_record, evaluation)
@@ -0,0 +1,108 @@
+"""Background job endpoints: submit, status, result and cancellation."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.core.config import get_settings
+from app.models import Job
+from app.schemas.evaluation import EvaluationBatchRequest
+from app.schemas.job import JobOut
+from app.services.jobs import JobQueueFull, job_runner
+from app.services.tool_import import catalogue_entries
+
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def _job_out(job: Job) -> JobOut:
+    out = JobOut.model_validate(job, from_attributes=True)
+    live = job_runner.live_progress(job.id)
+    if live is not None:
+        out.progress, out.total = live
+    return out
+
+
+def _get_job(session: Session, job_id: str) -> Job:
+    job = session.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
+
+
+def _submit(session: Session, kind: str, payload: Dict[str, Any], total: Optional[int]) -> JobOut:
+    try:
+        job = job_runner.submit(session, kind, payload, total=total)
+    except JobQueueFull:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="Too many queued jobs") from None
+    return _job_out(job)
+
+
+@router.post("/evaluations/batch", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+def submit_evaluation_batch(
+    batch: EvaluationBatchRequest,
+    session: Session = Depends(deps.get_db_session),
+    _: object = Depends(deps.get_current_user),
+) -> JobOut:
+    """Queue a batch run; items are validated as by ``/evaluations/run/batch``.
+
+    The job result keeps per-item evaluation ids and leading scores only.
+    """
+
+    settings = get_settings()
+    if len(batch.items) > settings.job_batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch exceeds {settings.job_batch_max_items} items",
+        )
+    return _submit(session, "evaluation_batch", {"items": batch.items}, len(batch.items))
+
+
+@router.post("/tools/import", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def submit_tool_import(
+    request: Request,
+    mode: Literal["replace", "upsert"] = "replace",
+    session: Session = Depends(deps.get_db_session),
+    _: object = Depends(deps.get_current_user),
+) -> JobOut:
+    """Queue a catalogue import; the upload is parsed and validated before it is accepted."""
+
+    entries = [entry.model_dump() async for entry in catalogue_entries(request)]
+    return await run_in_threadpool(_submit, session, "tool_import", {"mode": mode, "entries": entries}, len(entries))
+
+
+@router.get("/{job_id}", response_model=JobOut)
+def read_job(job_id: str, session: Session = Depends(deps.get_db_session)) -> JobOut:
+    return _job_out(_get_job(session, job_id))
+
+
+@router.get("/{job_id}/result")
+def read_job_result(job_id: str, session: Session = Depends(deps.get_db_session)) -> Dict[str, Any]:
+    """Return the result of a succeeded job; 409 while it is pending or if it did not succeed."""
+
+    job = _get_job(session, job_id)
+    if job.status == "succeeded":
+        return job.result or {}
+    if job.status == "failed":
+        detail = f"Job failed: {job.error}"
+    elif job.status == "cancelled":
+        detail = "Job was cancelled"
+    else:
+        detail = f"Job is {job.status}"
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+@router.post("/{job_id}/cancel", response_model=JobOut)
+def cancel_job(
+    job_id: str,
+    session: Session = Depends(deps.get_db_session),
+    _: object = Depends(deps.get_current_user),
+) -> JobOut:
+    """Cancel a queued job, or ask a running one to stop at its next checkpoint."""
+
+    return _job_out(job_runner.cancel(session, _get_job(session, job_id)))
@@ -2,23 +2,64 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.async_routes import async_variant
+from app.api.http_cache import cache_headers, etag_matches, make_etag, not_modified
+from app.core.config import get_settings
 from app.models import Tool
-from app.schemas.tool import ToolCreate, ToolOut, ToolUpdate
+from app.schemas.tool import ToolCreate, ToolImportResult, ToolOut, ToolSyncReport, ToolUpdate
+from app.services.catalogue_cache import bump_catalogue_version
+from app.services.catalogue_responses import EncodedCatalogue, encoded_catalogue, encoded_catalogue_async
+from app.services.jobs import JobContext, job_runner
+from app.services.tool_import import (
+    IMPORT_CHUNK_SIZE,
+    CatalogueSync,
+    catalogue_entries,
+    clear_catalogue,
+    stored_content_hash,
+    tool_content_hash,
+    write_tools,
+)
 
 
 router = APIRouter(prefix="/tools", tags=["tools"])
 
+CATALOGUE_CONFLICT = "Catalogue conflicts with existing tool names or slugs"
+
+
+def _catalogue_response(request: Request, encoded: EncodedCatalogue) -> Response:
+    """Serve the pre-encoded catalogue bytes, skipping per-request validation and encoding."""
+
+    coding = encoded.negotiate(request.headers.get("accept-encoding"))
+    etag = make_etag("tools", encoded.view, coding, encoded.fingerprint)
+    cache_control = get_settings().catalogue_cache_control
+    if etag_matches(request, etag):
+        response = not_modified(etag, cache_control)
+    else:
+        response = Response(content=encoded.bodies[coding], media_type="application/json")
+        response.headers.update(cache_headers(etag, cache_control))
+        if coding != "identity":
+            response.headers["Content-Encoding"] = coding
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
 
 @router.get("/", response_model=List[ToolOut])
-def list_tools(session: Session = Depends(deps.get_db_session)) -> List[ToolOut]:
-    tools = session.query(Tool).order_by(Tool.overall_score.desc()).all()
-    return tools
+def list_tools(request: Request, session: Session = Depends(deps.get_db_session)) -> Response:
+    return _catalogue_response(request, encoded_catalogue(session, "list"))
+
+
+@async_variant(list_tools)
+async def list_tools_async(request: Request, session: AsyncSession = Depends(deps.get_async_db_session)) -> Response:
+    return _catalogue_response(request, await encoded_catalogue_async(session, "list"))
 
 
 @router.get("/{tool_id}", response_model=ToolOut)
@@ -35,9 +76,10 @@ def create_tool(
     session: Session = Depends(deps.get_db_session),
     _: object = Depends(deps.get_current_user),
 ) -> ToolOut:
-    tool = Tool(**payload.dict())
+    tool = Tool(**payload.dict(), content_hash=tool_content_hash(payload))
     session.add(tool)
     session.commit()
+    bump_catalogue_version()
     session.refresh(tool)
     return tool
 
@@ -55,9 +97,11 @@ def update_tool(
 
     for key, value in payload.dict(exclude_unset=True).items():
         setattr(tool, key, value)
+    tool.content_hash = stored_content_hash(tool)
 
     session.add(tool)
     session.commit()
+    bump_catalogue_version()
     session.refresh(tool)
     return tool
 
@@ -74,34 +118,119 @@ def delete_tool(
 
     session.delete(tool)
     session.commit()
+    bump_catalogue_version()
 
 
 @router.get("/export/json", response_model=List[ToolOut])
-def export_tools(session: Session = Depends(deps.get_db_session)) -> List[ToolOut]:
+def export_tools(request: Request, session: Session = Depends(deps.get_db_session)) -> Response:
     """Export the current tool catalogue as JSON for client-side download."""
 
-    return session.query(Tool).order_by(Tool.name.asc()).all()
+    return _catalogue_response(request, encoded_catalogue(session, "export"))
 
 
-@router.post("/import/json", response_model=List[ToolOut])
-def import_tools(
-    catalogue: List[ToolCreate],
-    session: Session = Depends(deps.get_db_session),
-    _: object = Depends(deps.get_current_user),
-) -> List[ToolOut]:
-    """Replace the catalogue with the provided JSON payload."""
+@async_variant(export_tools)
+async def export_tools_async(
+    request: Request, session: AsyncSession = Depends(deps.get_async_db_session)
+) -> Response:
+    return _catalogue_response(request, await encoded_catalogue_async(session, "export"))
 
-    session.query(Tool).delete()
-    session.commit()
 
-    created = []
-    for entry in catalogue:
-        tool = Tool(**entry.dict())
-        session.add(tool)
-        created.append(tool)
+async def _catalogue_write_error(session: Session, exc: BaseException) -> HTTPException:
+    """Roll back a failed catalogue write and map the error to a response."""
 
-    session.commit()
-    for tool in created:
-        session.refresh(tool)
+    await run_in_threadpool(session.rollback)
+    if isinstance(exc, HTTPException):
+        return exc
+    if isinstance(exc, IntegrityError):
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=CATALOGUE_CONFLICT)
+    if isinstance(exc, ValueError):
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    raise exc
 
-    return created
+
+@router.post("/import/json", response_model=ToolImportResult)
+async def import_tools(
+    request: Request,
+    mode: Literal["replace", "upsert"] = "replace",
+    session: Session = Depends(deps.get_db_session),
+    _: object = Depends(deps.get_current_user),
+) -> ToolImportResult:
+    """Import a catalogue streamed as a JSON array or NDJSON, in one transaction.
+
+    ``replace`` swaps the whole catalogue, ``upsert`` inserts or updates tools
+    by slug. Entries are parsed as the body arrives and written in chunks of
+    executemany ``INSERT ... RETURNING``; any error rolls everything back.
+    """
+
+    pending: List[ToolCreate] = []
+    tool_ids: List[int] = []
+
+    try:
+        if mode == "replace":
+            await run_in_threadpool(clear_catalogue, session)
+        async for entry in catalogue_entries(request):
+            pending.append(entry)
+            if len(pending) >= IMPORT_CHUNK_SIZE:
+                tool_ids += await run_in_threadpool(write_tools, session, pending, mode)
+                pending = []
+        tool_ids += await run_in_threadpool(write_tools, session, pending, mode)
+        await run_in_threadpool(session.commit)
+    except Exception as exc:
+        raise await _catalogue_write_error(session, exc) from None
+
+    bump_catalogue_version()
+    return ToolImportResult(mode=mode, imported=len(tool_ids), tool_ids=tool_ids)
+
+
+def _import_job(session: Session, payload: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """Write a queued import in one transaction, checking for cancellation between chunks."""
+
+    mode, entries = payload["mode"], payload["entries"]
+    tool_ids: List[int] = []
+    # SQLite has one writer and this transaction holds it until the end.
+    context.flush_progress = session.get_bind().dialect.name != "sqlite"
+    try:
+        if mode == "replace":
+            clear_catalogue(session)
+        for start in range(0, len(entries), IMPORT_CHUNK_SIZE):
+            context.check_cancelled()
+            chunk = [ToolCreate.model_validate(entry) for entry in entries[start : start + IMPORT_CHUNK_SIZE]]
+            tool_ids += write_tools(session, chunk, mode)
+            context.report(start + len(chunk), len(entries))
+        session.commit()
+    except IntegrityError:
+        raise ValueError(CATALOGUE_CONFLICT) from None
+
+    bump_catalogue_version()
+    return ToolImportResult(mode=mode, imported=len(tool_ids), tool_ids=tool_ids).model_dump()
+
+
+job_runner.register("tool_import", _import_job)
+
+
+@router.post("/sync", response_model=ToolSyncReport)
+async def sync_tools(
+    request: Request,
+    session: Session = Depends(deps.get_db_session),
+    _: object = Depends(deps.get_current_user),
+) -> ToolSyncReport:
+    """Bring the catalogue in line with a full feed, writing only what changed.
+
+    Tools are matched by slug and compared by content hash; missing tools are
+    deleted. The catalogue version is only bumped when something changed, so
+    an identical feed leaves cached scoring structures in place.
+    """
+
+    try:
+        sync = await run_in_threadpool(CatalogueSync, session)
+        async for entry in catalogue_entries(request):
+            sync.add(entry)
+        report = await run_in_threadpool(sync.apply)
+        await run_in_threadpool(session.commit)
+    except Exception as exc:
+        raise await _catalogue_write_error(session, exc) from None
+
+    changed = bool(report["created"] or report["updated"] or report["deleted"])
+    if changed:
+        bump_catalogue_version()
+    return ToolSyncReport(**report, changed=changed)
@@ -2,7 +2,7 @@
 
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -15,9 +15,39 @@ class Settings(BaseSettings):
     secret_key: str = "development-secret-key"
     allowed_origins: List[str] = ["http://localhost:5173", "http://127.0.0.1:5173"]
     database_url: str = "sqlite:///" + str(Path(__file__).resolve().parent.parent.parent / "data" / "app.db")
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: Optional[int] = None
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 268435456
+    use_async_database: bool = False
+    async_database_url: Optional[str] = None
     alembic_ini_path: Path = Path(__file__).resolve().parent.parent.parent / "alembic.ini"
     default_admin_email: str = "qa.lead@example.com"
     default_admin_password: str = "qa-team"
+    result_cache_max_entries: int = 4096
+    result_cache_ttl_seconds: float = 900.0
+    evaluation_batch_max_items: int = 1000
+    weight_table_self_check: bool = True
+    snapshot_codec: str = "zlib"
+    scoring_backend: str = "inline"
+    scoring_processes: Optional[int] = None
+    scoring_process_min_cells: int = 2_000_000
+    evaluation_page_size: int = 50
+    evaluation_page_size_max: int = 200
+    catalogue_cache_control: str = "public, max-age=0, must-revalidate"
+    evaluation_cache_control: str = "private, max-age=0, must-revalidate"
+    job_workers: int = 2
+    job_max_queued: int = 100
+    job_batch_max_items: int = 20000
+    job_batch_chunk_size: int = 100
+    job_progress_interval_seconds: float = 2.0
+    job_heartbeat_interval_seconds: float = 15.0
+    job_stale_after_seconds: float = 120.0
 
     class Config:
         env_file = ".env"
@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, scoped_session, sessionmaker
 
 from .config import get_settings
+from .metrics import instrument_engine
+from .pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    async_database_pool_metrics,
+    database_pool_metrics,
+)
 
 
 settings = get_settings()
@@ -18,14 +27,81 @@ class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
 
 
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {},
-)
+def _engine_options(url: URL, is_async: bool = False) -> Dict[str, Any]:
+    """Pool and connection options for an engine on ``url``."""
+
+    if url.get_backend_name() == "sqlite":
+        options: Dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+        # In-memory databases keep SQLAlchemy's single-connection pool.
+        if url.database and url.database != ":memory:":
+            options["poolclass"] = InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool
+        return options
+
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if settings.db_statement_timeout_ms and url.get_backend_name() == "postgresql":
+        timeout = str(settings.db_statement_timeout_ms)
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, _: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    finally:
+        cursor.close()
+
+
+_url = make_url(settings.database_url)
+engine = create_engine(_url, **_engine_options(_url))
+database_pool_metrics.attach(engine)
+instrument_engine(engine, "database")
+if _url.get_backend_name() == "sqlite":
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
 
 SessionLocal = scoped_session(sessionmaker(bind=engine, autocommit=False, autoflush=False))
 
 
+def _async_database_url() -> Optional[str]:
+    """Return the URL for the optional async engine, or ``None`` to stay on the sync path.
+
+    Without an explicit ``async_database_url`` a PostgreSQL ``database_url`` is
+    reused with the asyncpg driver; SQLite keeps the sync engine.
+    """
+
+    if not settings.use_async_database:
+        return None
+    if settings.async_database_url:
+        return settings.async_database_url
+    url = make_url(settings.database_url)
+    if url.get_backend_name() != "postgresql":
+        return None
+    return url.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+_async_url = _async_database_url()
+async_engine: Optional[AsyncEngine] = None
+if _async_url:
+    async_engine = create_async_engine(_async_url, **_engine_options(make_url(_async_url), is_async=True))
+    async_database_pool_metrics.attach(async_engine.sync_engine)
+    instrument_engine(async_engine.sync_engine, "async_database")
+    if async_engine.dialect.name == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False) if async_engine is not None else None
+
+
 @contextmanager
 def session_scope() -> Generator:
     """Provide a transactional scope around operations."""
@@ -44,8 +120,20 @@ def session_scope() -> Generator:
 def get_db() -> Generator:
     """FastAPI dependency that yields a database session."""
 
-    db = SessionLocal()
+    # Not the thread-scoped session: a request's dependency, handler and
+    # cleanup run on whichever threadpool workers are free, so concurrent
+    # requests would otherwise share one session.
+    db = SessionLocal.session_factory()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator:
+    """FastAPI dependency that yields an async database session."""
+
+    if AsyncSessionLocal is None:
+        raise RuntimeError("The async database engine is not enabled")
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,253 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Counters and histograms live in this process only; ``render`` produces the
+body of the ``/metrics`` endpoint without any client library or push
+gateway.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(zip(names, values))
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets) + (float("inf"),)
+        self._lock = threading.Lock()
+        self._series: Dict[LabelValues, List[Any]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for position, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][position] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, hits in zip(self.buckets, counts):
+                    cumulative += hits
+                    le = ("le", _format_value(bound))
+                    lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+                label_text = _format_labels(self.labelnames, labels)
+                lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+                lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+def sample_lines(
+    name: str,
+    documentation: str,
+    kind: str,
+    samples: Sequence[Tuple[Dict[str, str], Optional[float]]],
+) -> List[str]:
+    """Render a gauge or counter from values read at scrape time, skipping missing ones."""
+
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        if value is not None:
+            lines.append(f"{name}{_format_labels(list(labels), list(labels.values()))} {_format_value(value)}")
+    return lines
+
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route", "status")
+)
+REQUEST_SQL_QUERIES = Histogram(
+    "http_request_sql_queries", "SQL statements executed per HTTP request.", ("method", "route"), COUNT_BUCKETS
+)
+REQUEST_SQL_SECONDS = Histogram(
+    "http_request_sql_duration_seconds", "Time spent in SQL per HTTP request.", ("method", "route")
+)
+SQL_QUERIES = Counter("db_queries_total", "SQL statements executed.", ("engine",))
+SQL_SECONDS = Histogram("db_query_duration_seconds", "SQL statement latency.", ("engine",))
+STAGE_SECONDS = Histogram(
+    "evaluation_stage_duration_seconds", "Time spent in each evaluation engine stage.", ("stage",)
+)
+
+
+class RequestSqlStats:
+    """SQL statements and time accumulated by the current request."""
+
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# The middleware installs one object per request; engine listeners running
+# in the request's context (including threadpool workers, which copy it)
+# add to it.
+_request_sql: ContextVar[Optional[RequestSqlStats]] = ContextVar("request_sql", default=None)
+
+
+def begin_request() -> Tuple[RequestSqlStats, Any]:
+    stats = RequestSqlStats()
+    return stats, _request_sql.set(stats)
+
+
+def end_request(token: Any) -> None:
+    _request_sql.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block of the evaluation hot path."""
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, name)
+
+
+def instrument_engine(engine: Engine, label: str) -> None:
+    """Count and time every statement executed on ``engine``, including failed ones.
+
+    The start time lives on the statement's execution context, so a statement
+    that raises cannot leave a stale entry behind on the pooled connection.
+    """
+
+    def record(context: Any) -> None:
+        started = vars(context).pop("_metrics_started", None) if context is not None else None
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        SQL_QUERIES.inc(1, label)
+        SQL_SECONDS.observe(elapsed, label)
+        stats = _request_sql.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+    def before(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        if context is not None:
+            context._metrics_started = time.perf_counter()
+
+    def after(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        record(context)
+
+    def failed(exception_context: Any) -> None:
+        record(exception_context.execution_context)
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    event.listen(engine, "handle_error", failed)
+
+
+def pool_lines(pools: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Render ``PoolMetrics.snapshot`` results keyed by pool name."""
+
+    lines: List[str] = []
+    for field, kind, documentation in (
+        ("size", "gauge", "Configured pool size."),
+        ("checked_in", "gauge", "Idle connections in the pool."),
+        ("checked_out", "gauge", "Connections currently checked out."),
+        ("overflow", "gauge", "Current overflow beyond the pool size."),
+        ("checkouts", "counter", "Connection checkouts."),
+        ("connects", "counter", "New DBAPI connections opened."),
+        ("invalidations", "counter", "Connections invalidated, e.g. by a failed pre-ping."),
+    ):
+        name = f"db_pool_{field}" + ("_total" if kind == "counter" else "")
+        lines += sample_lines(name, documentation, kind, [({"pool": pool}, data[field]) for pool, data in pools.items()])
+
+    for name, field, documentation in (
+        ("db_pool_checkout_wait_seconds", "checkout_wait", "Time spent waiting for an idle pooled connection."),
+        ("db_pool_connect_seconds", "connect_time", "Time spent opening new DBAPI connections."),
+    ):
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} histogram"]
+        for pool, data in pools.items():
+            histogram = data[field]
+            for bucket in histogram["buckets"]:
+                lines.append(f"{name}_bucket{_format_labels(('pool', 'le'), (pool, bucket['le']))} {bucket['count']}")
+            lines.append(f"{name}_sum{_format_labels(('pool',), (pool,))} {_format_value(histogram['sum_seconds'])}")
+            lines.append(f"{name}_count{_format_labels(('pool',), (pool,))} {histogram['count']}")
+    return lines
+
+
+def cache_lines(stats: Dict[str, int]) -> List[str]:
+    """Render ``ResultCache.stats`` counters and size."""
+
+    lines: List[str] = []
+    for field in ("hits", "misses", "evictions", "expirations"):
+        lines += sample_lines(f"result_cache_{field}_total", f"Evaluation result cache {field}.", "counter", [({}, stats[field])])
+    lines += sample_lines("result_cache_entries", "Entries in the evaluation result cache.", "gauge", [({}, stats["size"])])
+    return lines
+
+
+def render(extra: Sequence[str] = ()) -> str:
+    lines: List[str] = []
+    for metric in (REQUEST_LATENCY, REQUEST_SQL_QUERIES, REQUEST_SQL_SECONDS, SQL_QUERIES, SQL_SECONDS, STAGE_SECONDS):
+        lines.extend(metric.render())
+    lines.extend(extra)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,162 @@
+"""Connection pool instrumentation: checkout waits, connect times and pool event counters."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue, Queue
+
+
+# Upper bounds (seconds) of the checkout wait and connect time histogram buckets.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+
+class _Histogram:
+    """Cumulative-bucket histogram of durations; callers hold the metrics lock."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.buckets: List[int] = [0] * len(WAIT_BUCKETS)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        for position, bound in enumerate(WAIT_BUCKETS):
+            if seconds <= bound:
+                self.buckets[position] += 1
+                break
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = []
+        for bound, hits in zip(WAIT_BUCKETS, self.buckets):
+            cumulative += hits
+            buckets.append({"le": "+Inf" if bound == float("inf") else bound, "count": cumulative})
+        return {"count": self.count, "sum_seconds": self.sum, "max_seconds": self.max, "buckets": buckets}
+
+
+class PoolMetrics:
+    """Thread-safe counters for one engine's connection pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait = _Histogram()
+        self.connect_time = _Histogram()
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait.observe(seconds)
+
+    def observe_connect(self, seconds: float) -> None:
+        with self._lock:
+            self.connect_time.observe(seconds)
+
+    def attach(self, target: Any) -> None:
+        """Count connects, checkouts and invalidations on an engine's pool."""
+
+        def count(name: str) -> Any:
+            def listener(*_: Any) -> None:
+                with self._lock:
+                    setattr(self, name, getattr(self, name) + 1)
+
+            return listener
+
+        event.listen(target, "connect", count("connects"))
+        event.listen(target, "checkout", count("checkouts"))
+        event.listen(target, "invalidate", count("invalidations"))
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """Return the counters together with the pool's current occupancy."""
+
+        with self._lock:
+            counters = {
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "checkout_wait": self.wait.snapshot(),
+                "connect_time": self.connect_time.snapshot(),
+            }
+        occupancy = {
+            name: getattr(pool, name)() if hasattr(pool, name) else None
+            for name in ("size", "checkedin", "checkedout", "overflow")
+        }
+        return {
+            "pool": type(pool).__name__,
+            "size": occupancy["size"],
+            "checked_in": occupancy["checkedin"],
+            "checked_out": occupancy["checkedout"],
+            "overflow": occupancy["overflow"],
+            **counters,
+        }
+
+
+database_pool_metrics = PoolMetrics()
+async_database_pool_metrics = PoolMetrics()
+
+
+class _TimedQueue(Queue):
+    """Pool queue recording how long each ``get`` waited for a returned connection."""
+
+    metrics = database_pool_metrics
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - started)
+
+
+class _TimedAsyncQueue(AsyncAdaptedQueue):
+    """Async-adapted counterpart of ``_TimedQueue``."""
+
+    metrics = async_database_pool_metrics
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` recording checkout waits and connection setup separately.
+
+    The wait is timed on the pool's queue, so it covers only waiting for an
+    idle connection; opening a new one is timed by ``_create_connection``.
+    """
+
+    _queue_class = _TimedQueue
+    metrics = database_pool_metrics
+
+    def _create_connection(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            self.metrics.observe_connect(time.perf_counter() - started)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async-adapted counterpart of ``InstrumentedQueuePool``."""
+
+    _queue_class = _TimedAsyncQueue
+    metrics = async_database_pool_metrics
+
+    def _create_connection(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            self.metrics.observe_connect(time.perf_counter() - started)
@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.v1 import auth, evaluations, tools
+from app.api.async_routes import async_router
+from app.api.v1 import analytics, auth, evaluations, jobs, tools
+from app.core import metrics
 from app.core.config import get_settings
+from app.core.database import async_engine, engine
+from app.core.pool_metrics import async_database_pool_metrics, database_pool_metrics
 from app.seeds.bootstrap import ensure_seed_data
+from app.services.evaluation_service import weight_table
+from app.services.jobs import job_runner
+from app.services.result_cache import result_cache
+from app.services.scoring_pool import shutdown_scoring_backend
+
+
+def _pool_snapshots() -> Dict[str, Dict[str, Any]]:
+    pools = {"database": database_pool_metrics.snapshot(engine.pool)}
+    if async_engine is not None:
+        pools["async_database"] = async_database_pool_metrics.snapshot(async_engine.sync_engine.pool)
+    return pools
 
 
 def create_app() -> FastAPI:
@@ -22,18 +40,68 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    @app.middleware("http")
+    async def record_request_metrics(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """Record latency and SQL usage per route template (time to response start)."""
+
+        stats, token = metrics.begin_request()
+        started = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - started
+            route = getattr(request.scope.get("route"), "path", "unmatched")
+            metrics.REQUEST_LATENCY.observe(elapsed, request.method, route, str(status_code))
+            metrics.REQUEST_SQL_QUERIES.observe(stats.queries, request.method, route)
+            metrics.REQUEST_SQL_SECONDS.observe(stats.seconds, request.method, route)
+            metrics.end_request(token)
+
     app.include_router(auth.router, prefix="/api/v1")
-    app.include_router(tools.router, prefix="/api/v1")
-    app.include_router(evaluations.router, prefix="/api/v1")
+    app.include_router(jobs.router, prefix="/api/v1")
+    # With the async engine enabled, tool, evaluation and analytics handlers await the
+    # async driver instead of holding a threadpool worker per request; handlers marked
+    # ``cpu_bound`` (scoring, large payloads) stay on the threadpool.
+    for router in (tools.router, evaluations.router, analytics.router):
+        app.include_router(async_router(router) if async_engine is not None else router, prefix="/api/v1")
 
     @app.on_event("startup")
     def startup_event() -> None:  # pragma: no cover - executed at runtime
         ensure_seed_data()
+        if settings.weight_table_self_check:
+            mismatches = weight_table.verify()
+            if mismatches:
+                raise RuntimeError(f"Weight profile table disagrees with calculate_weights: {mismatches[0]}")
+        job_runner.start()
+
+    @app.on_event("shutdown")
+    async def shutdown_event() -> None:  # pragma: no cover - executed at runtime
+        job_runner.shutdown()
+        shutdown_scoring_backend()
+        if async_engine is not None:
+            await async_engine.dispose()
 
     @app.get("/health")
     def healthcheck() -> dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/health/pool")
+    def pool_health() -> dict[str, Any]:
+        """Report connection pool occupancy, checkout waits and event counters."""
+
+        return _pool_snapshots()
+
+    @app.get("/metrics", include_in_schema=False)
+    def prometheus_metrics() -> Response:
+        """Expose request, SQL, evaluation-stage, pool and cache metrics for Prometheus."""
+
+        extra = metrics.pool_lines(_pool_snapshots()) + metrics.cache_lines(result_cache.stats())
+        return Response(content=metrics.render(extra), media_type="text/plain; version=0.0.4; charset=utf-8")
+
     return app
 
 
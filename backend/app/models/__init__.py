@@ -1,8 +1,9 @@
 
 """SQLAlchemy model exports."""
 
-from .evaluation import Evaluation
+from .evaluation import Evaluation, EvaluationResult, EvaluationToolScore
+from .job import Job
 from .tool import Tool
 from .user import User
 
-__all__ = ["Tool", "Evaluation", "User"]
\ No newline at end of file
+__all__ = ["Tool", "Evaluation", "EvaluationResult", "EvaluationToolScore", "Job", "User"]
\ No newline at end of file
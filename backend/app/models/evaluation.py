@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -16,17 +16,78 @@ class Evaluation(Base):
     """Stores questionnaire responses and scoring outcomes."""
 
     __tablename__ = "evaluations"
+    __table_args__ = (
+        Index("ix_evaluations_created_at_id", "created_at", "id"),
+        Index("ix_evaluations_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_evaluations_owner_created_at_id", "owner_id", "created_at", "id"),
+    )
 
     id: str = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title: str = Column(String(150), nullable=False, default="Untitled Evaluation")
     summary: Optional[str] = Column(Text)
     answers: Dict[str, Any] = Column(JSON, nullable=False, default=dict)
     weight_profile: Dict[str, Any] = Column(JSON, nullable=False, default=dict)
+    # Weights of the latest persisted reweight; ``weight_profile`` keeps the profile it was scored with.
+    revised_weight_profile: Optional[Dict[str, Any]] = Column(JSON, nullable=True)
     results_snapshot: Dict[str, Any] = Column(JSON, nullable=False, default=dict)
     created_at: datetime = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at: datetime = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     status: str = Column(String(30), nullable=False, default="draft")
     owner_id: Optional[int] = Column(ForeignKey("users.id"), nullable=True)
+    # Set for results kept in the shared table; ``results_snapshot`` is then empty.
+    result_fingerprint: Optional[str] = Column(ForeignKey("evaluation_results.fingerprint"), nullable=True, index=True)
 
     owner = relationship("User", back_populates="evaluations")
+    result = relationship("EvaluationResult")
 
+
+class EvaluationResult(Base):
+    """Encoded scoring outcome shared by every evaluation with the same inputs.
+
+    Rows are keyed by a fingerprint of what produced them and never change
+    once written; see ``app.services.result_store``.
+    """
+
+    __tablename__ = "evaluation_results"
+
+    fingerprint: str = Column(String(64), primary_key=True)
+    snapshot: Dict[str, Any] = Column(JSON, nullable=False)
+    created_at: datetime = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class EvaluationToolScore(Base):
+    """One scored tool of a persisted evaluation, indexed for cross-evaluation analytics.
+
+    Rows are derived from ``Evaluation.results_snapshot`` and rewritten
+    whenever the snapshot changes. ``tool_id`` is not a foreign key so the
+    history outlives tools removed from the catalogue. Ids are reused when a
+    catalogue import replaces the tools, so rows also keep the name the tool
+    was scored under and analytics group on it.
+    """
+
+    __tablename__ = "evaluation_tool_scores"
+    __table_args__ = (
+        Index("ix_evaluation_tool_scores_tool_created_at", "tool_id", "created_at"),
+        Index("ix_evaluation_tool_scores_rank_created_at", "rank", "created_at"),
+        Index("ix_evaluation_tool_scores_name_created_at", "tool_name", "created_at"),
+    )
+
+    evaluation_id: str = Column(String(36), ForeignKey("evaluations.id", ondelete="CASCADE"), primary_key=True)
+    tool_id: int = Column(Integer, primary_key=True)
+    # NULL only on rows indexed before names were stored; the backfill rewrites them.
+    tool_name: Optional[str] = Column(String(100), nullable=True)
+    created_at: datetime = Column(DateTime, nullable=False)
+    rank: int = Column(Integer, nullable=False)
+    total_score: float = Column(Float, nullable=False)
+    normalized_score: float = Column(Float, nullable=False)
+    ai_assistance: float = Column(Float, nullable=False)
+    reporting: float = Column(Float, nullable=False)
+    maintenance: float = Column(Float, nullable=False)
+    execution: float = Column(Float, nullable=False)
+    cross_browser: float = Column(Float, nullable=False)
+    ci_cd: float = Column(Float, nullable=False)
+    budget_fit: float = Column(Float, nullable=False)
+    team_skill_fit: float = Column(Float, nullable=False)
+    language_fit: float = Column(Float, nullable=False)
+    analytics: float = Column(Float, nullable=False)
+    community: float = Column(Float, nullable=False)
@@ -0,0 +1,34 @@
+"""Background job persistence model."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import JSON, Boolean, Column, DateTime, Index, Integer, String, Text
+
+from app.core.database import Base
+
+
+class Job(Base):
+    """Work queued by the API and executed by the in-process job runner."""
+
+    __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_status_created_at", "status", "created_at"),)
+
+    id: str = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    kind: str = Column(String(50), nullable=False)
+    status: str = Column(String(20), nullable=False, default="queued")
+    payload: Dict[str, Any] = Column(JSON, nullable=False, default=dict)
+    result: Optional[Dict[str, Any]] = Column(JSON)
+    error: Optional[str] = Column(Text)
+    progress: int = Column(Integer, nullable=False, default=0)
+    total: Optional[int] = Column(Integer)
+    cancel_requested: bool = Column(Boolean, nullable=False, default=False)
+    # Set on claim; the owning runner refreshes the heartbeat while the job runs.
+    runner_id: Optional[str] = Column(String(64))
+    heartbeat_at: Optional[datetime] = Column(DateTime)
+    created_at: datetime = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at: Optional[datetime] = Column(DateTime)
+    finished_at: Optional[datetime] = Column(DateTime)
@@ -42,6 +42,7 @@ class Tool(Base):
     pros: List[str] = Column(JSON, nullable=False, default=list)
     cons: List[str] = Column(JSON, nullable=False, default=list)
     additional_metadata: Dict[str, Any] = Column(JSON, nullable=False, default=dict)
+    content_hash: Optional[str] = Column(String(64))
 
     def as_dict(self) -> Dict[str, Any]:
         """Return a serialisable dictionary representation."""
@@ -3,20 +3,30 @@
 from .auth import LoginRequest, LoginResponse
 from .evaluation import (
     EvaluationAnswerSet,
+    EvaluationBatchRequest,
+    EvaluationBatchResponse,
     EvaluationOut,
+    EvaluationPage,
     EvaluationRequest,
     EvaluationResultPayload,
+    EvaluationSummary,
 )
-from .tool import ToolCreate, ToolOut, ToolUpdate
+from .tool import ToolCreate, ToolImportResult, ToolOut, ToolSyncReport, ToolUpdate
 
 __all__ = [
     "LoginRequest",
     "LoginResponse",
     "EvaluationAnswerSet",
+    "EvaluationBatchRequest",
+    "EvaluationBatchResponse",
     "EvaluationOut",
+    "EvaluationPage",
     "EvaluationRequest",
     "EvaluationResultPayload",
+    "EvaluationSummary",
     "ToolCreate",
+    "ToolImportResult",
     "ToolOut",
+    "ToolSyncReport",
     "ToolUpdate",
 ]
\ No newline at end of file
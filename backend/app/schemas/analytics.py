@@ -0,0 +1,40 @@
+"""Pydantic schemas for cross-evaluation analytics."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class ToolPlacement(BaseModel):
+    tool_id: Optional[int]
+    tool_name: str
+    placements: int
+    first_places: int
+
+
+class ToolPlacementReport(BaseModel):
+    depth: int
+    created_after: Optional[datetime]
+    created_before: Optional[datetime]
+    evaluations: int
+    tools: List[ToolPlacement]
+
+
+class ToolScoreStats(BaseModel):
+    tool_id: Optional[int]
+    tool_name: str
+    evaluations: int
+    average_total_score: float
+    average_normalized_score: float
+    average_rank: float
+    best_rank: int
+    criteria: Dict[str, float]
+
+
+class ToolScoreReport(BaseModel):
+    created_after: Optional[datetime]
+    created_before: Optional[datetime]
+    tools: List[ToolScoreStats]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -55,6 +55,25 @@ class ToolScoreBreakdown(BaseModel):
     recommended_use_cases: List[str]
 
 
+class ToolAggregateScore(BaseModel):
+    tool_id: int
+    tool_name: str
+    total_score: float
+    normalized_score: float
+    rank: int
+
+
+class ParetoDominance(BaseModel):
+    tool_id: int
+    nearest_dominator_id: int
+    distance: float
+
+
+class ParetoFront(BaseModel):
+    tool_ids: List[int]
+    dominated: List[ParetoDominance]
+
+
 class EvaluationBase(BaseModel):
     title: str = Field(default="Untitled Evaluation", max_length=150)
     summary: Optional[str] = None
@@ -79,6 +98,7 @@ class EvaluationUpdate(BaseModel):
 
 class EvaluationOut(EvaluationBase):
     id: str
+    revised_weight_profile: Optional[Dict[str, float]] = None
     created_at: datetime
     updated_at: datetime
 
@@ -86,6 +106,24 @@ class EvaluationOut(EvaluationBase):
         orm_mode = True
 
 
+class EvaluationSummary(BaseModel):
+    id: str
+    title: str
+    summary: Optional[str] = None
+    status: str
+    owner_id: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
+class EvaluationPage(BaseModel):
+    items: List[EvaluationSummary]
+    next_cursor: Optional[str] = None
+
+
 class EvaluationResultPayload(BaseModel):
     evaluation: Optional[EvaluationOut]
     default_weights: Dict[str, float]
@@ -93,6 +131,8 @@ class EvaluationResultPayload(BaseModel):
     recommended_tool_ids: List[int]
     radar_categories: List[str]
     bar_chart_data: List[Dict[str, Any]]
+    aggregate_scores: Optional[List[ToolAggregateScore]] = None
+    pareto: Optional[ParetoFront] = None
 
 
 class EvaluationRequest(BaseModel):
@@ -101,4 +141,115 @@ class EvaluationRequest(BaseModel):
     answers: EvaluationAnswerSet
     weight_overrides: Optional[Dict[str, float]] = None
     persist: bool = True
+    top_k: Optional[int] = Field(default=None, ge=1)
+    include_aggregate_scores: bool = False
+    include_pareto: bool = False
+
+
+class EvaluationBatchRequest(BaseModel):
+    # Items are validated one by one so a malformed entry is reported in its
+    # slot instead of rejecting the whole batch.
+    items: List[Dict[str, Any]] = Field(..., min_length=1)
+
+
+class EvaluationBatchItem(BaseModel):
+    index: int
+    result: Optional[EvaluationResultPayload] = None
+    error: Optional[str] = None
+
+
+class EvaluationBatchResponse(BaseModel):
+    items: List[EvaluationBatchItem]
+    succeeded: int
+    failed: int
 
+
+class ResultCacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_entries: int
+    ttl_seconds: float
+
+
+class SensitivityRequest(BaseModel):
+    answers: EvaluationAnswerSet
+    weight_overrides: Optional[Dict[str, float]] = None
+    max_weight: float = Field(default=5.0, gt=0.1)
+    depth: int = Field(default=3, ge=1, le=10)
+
+
+class SensitivityBreakpoint(BaseModel):
+    weight: float
+    ranking_below: List[int]
+    ranking_above: List[int]
+    swapped_tool_ids: List[int]
+
+
+class CriterionSensitivity(BaseModel):
+    criterion: str
+    current_weight: float
+    stable_min: float
+    stable_max: float
+    breakpoints: List[SensitivityBreakpoint]
+
+
+class SensitivityReport(BaseModel):
+    evaluation_id: Optional[str] = None
+    weights: Dict[str, float]
+    top_tool_ids: List[int]
+    min_weight: float
+    max_weight: float
+    criteria: List[CriterionSensitivity]
+
+
+class ReweightRequest(BaseModel):
+    weights: Dict[str, float]
+    persist: bool = False
+
+
+class ToolReweight(BaseModel):
+    tool_id: int
+    total_score: float
+    normalized_score: float
+    rank: int
+
+
+class ReweightResult(BaseModel):
+    evaluation_id: str
+    weights: Dict[str, float]
+    changes: List[ToolReweight]
+    unchanged: int
+    persisted: bool
+
+
+class RobustnessRequest(BaseModel):
+    answers: EvaluationAnswerSet
+    weight_overrides: Optional[Dict[str, float]] = None
+    samples: int = Field(default=10_000, ge=1, le=1_000_000)
+    distribution: Literal["normal", "uniform", "dirichlet"] = "normal"
+    spread: float = Field(default=0.15, gt=0, le=1)
+    seed: Optional[int] = None
+    depth: int = Field(default=3, ge=1, le=10)
+
+
+class ToolRobustness(BaseModel):
+    tool_id: int
+    tool_name: str
+    baseline_rank: int
+    probability_first: float
+    probability_top: float
+    rank_distribution: List[float]
+    mean_total_score: float
+
+
+class RobustnessReport(BaseModel):
+    weights: Dict[str, float]
+    samples: int
+    distribution: str
+    spread: float
+    seed: Optional[int]
+    depth: int
+    tools: List[ToolRobustness]
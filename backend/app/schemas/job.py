@@ -0,0 +1,47 @@
+"""Pydantic schemas for background jobs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class JobOut(BaseModel):
+    id: str
+    kind: str
+    status: str
+    progress: int
+    total: Optional[int] = None
+    cancel_requested: bool
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+
+class JobToolScore(BaseModel):
+    tool_id: int
+    rank: int
+    total_score: float
+    normalized_score: float
+
+
+class EvaluationBatchJobItem(BaseModel):
+    """Compact outcome of one batch job item; the full result of a persisted item is read by ``evaluation_id``."""
+
+    index: int
+    evaluation_id: Optional[str] = None
+    recommended_tool_ids: List[int] = []
+    top_tools: List[JobToolScore] = []
+    error: Optional[str] = None
+
+
+class EvaluationBatchJobResult(BaseModel):
+    items: List[EvaluationBatchJobItem]
+    succeeded: int
+    failed: int
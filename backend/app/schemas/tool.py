@@ -76,3 +76,22 @@ class ToolOut(ToolBase):
 
     class Config:
         orm_mode = True
+
+
+class ToolImportResult(BaseModel):
+    mode: str
+    imported: int
+    tool_ids: List[int]
+
+
+class ToolChange(BaseModel):
+    tool_id: int
+    slug: str
+
+
+class ToolSyncReport(BaseModel):
+    created: List[ToolChange]
+    updated: List[ToolChange]
+    deleted: List[ToolChange]
+    unchanged: int
+    changed: bool
@@ -7,6 +7,7 @@ from sqlalchemy import inspect
 from app.core.config import get_settings
 from app.core.database import Base, engine, session_scope
 from app.models import Tool, User
+from app.services.catalogue_cache import bump_catalogue_version
 from app.utils.security import hash_password
 from .tool_data import SEED_TOOLS
 
@@ -38,3 +39,5 @@ def ensure_seed_data() -> None:
         if tool_count == 0:
             for tool in SEED_TOOLS:
                 session.add(Tool(**tool))
+
+    bump_catalogue_version()
@@ -0,0 +1,153 @@
+"""Versioned in-process snapshot of the scoring catalogue."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import Tool
+from app.services.scoring_matrix import ScoringMatrix
+from app.services.tool_import import stored_content_hash
+
+
+# Only the columns the scoring engine reads; pros/cons and the other JSON
+# columns are never hydrated for evaluation requests.
+SCORING_COLUMNS = (
+    Tool.id,
+    Tool.name,
+    Tool.summary,
+    Tool.pricing_tier,
+    Tool.ai_capability,
+    Tool.ci_cd_support,
+    Tool.supports_cross_browser,
+    Tool.maintenance_effort,
+    Tool.reporting_quality,
+    Tool.execution_speed,
+    Tool.analytics_depth,
+    Tool.community_strength,
+    Tool.recommended_team_skill,
+    Tool.languages_supported,
+    Tool.criteria_scores,
+    Tool.additional_metadata,
+    Tool.content_hash,
+)
+
+
+class CatalogueSnapshot:
+    """Compiled catalogue tagged with the version it was built from.
+
+    ``fingerprint`` is a content hash of the same rows the matrix was compiled
+    from, so results scored on a snapshot can be stored under its fingerprint.
+    """
+
+    def __init__(self, version: int, matrix: ScoringMatrix, fingerprint: str) -> None:
+        self.version = version
+        self.matrix = matrix
+        self.fingerprint = fingerprint
+        self.built_at = datetime.utcnow()
+        self._derived: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def cached(self, key: Hashable) -> Any:
+        """Return a structure memoized under ``key``, or ``None`` if it was not built yet."""
+
+        with self._lock:
+            return self._derived.get(key)
+
+    def memoize(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return a structure derived from this snapshot, computing it once per version.
+
+        ``factory`` runs outside the lock, as it may query the database (see
+        ``CatalogueCache.get``); concurrent misses may each build the value,
+        and the first one stored is returned to all of them.
+        """
+
+        with self._lock:
+            if key in self._derived:
+                return self._derived[key]
+        value = factory()
+        with self._lock:
+            return self._derived.setdefault(key, value)
+
+
+class CatalogueCache:
+    """Holds the latest snapshot and rebuilds it lazily after a version bump."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot: Optional[CatalogueSnapshot] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump(self) -> int:
+        """Mark the catalogue as changed; the next read rebuilds the snapshot."""
+
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def get(self, session: Session) -> CatalogueSnapshot:
+        version = self._version
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        # The query runs outside the lock: on the async engine it yields to
+        # the event loop, where another request blocking on a thread lock
+        # would stop it from ever resuming. Concurrent misses may each build a
+        # snapshot; the first one installed for a version is kept and served. Writers
+        # bump only after committing, so a write that lands while this query
+        # runs leaves the snapshot stale and it is rebuilt on the next read.
+        rows = session.query(*SCORING_COLUMNS).order_by(Tool.overall_score.desc()).all()
+        built = CatalogueSnapshot(version, ScoringMatrix.from_tools(rows), _content_fingerprint(session, rows))
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version < version:
+                self._snapshot = built
+            return self._snapshot
+
+
+catalogue_cache = CatalogueCache()
+
+
+def get_catalogue(session: Session) -> CatalogueSnapshot:
+    """Return the compiled catalogue, rebuilding it if tools changed."""
+
+    return catalogue_cache.get(session)
+
+
+def bump_catalogue_version() -> int:
+    """Invalidate the compiled catalogue after a tool write."""
+
+    return catalogue_cache.bump()
+
+
+def _content_fingerprint(session: Session, rows: Iterable[Any]) -> str:
+    hashes = {row.id: row.content_hash for row in rows}
+    # Rows written before content hashes were stored are hashed from their columns.
+    unhashed = [tool_id for tool_id, content_hash in hashes.items() if content_hash is None]
+    if unhashed:
+        for tool in session.query(Tool).filter(Tool.id.in_(unhashed)):
+            hashes[tool.id] = stored_content_hash(tool)
+
+    digest = hashlib.sha256()
+    for tool_id in sorted(hashes):
+        digest.update(f"{tool_id}:{hashes[tool_id]};".encode("ascii"))
+    return digest.hexdigest()
+
+
+def catalogue_fingerprint(session: Session) -> str:
+    """Return a content fingerprint of the whole catalogue, computed once per version.
+
+    Unlike the in-process version counter it is stable across restarts and
+    worker processes, so it can back HTTP validators. Callers that also score
+    should read ``fingerprint`` from the snapshot they score on instead.
+    """
+
+    return get_catalogue(session).fingerprint
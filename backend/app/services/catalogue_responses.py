@@ -0,0 +1,111 @@
+"""Pre-encoded catalogue responses, built once per catalogue version."""
+
+from __future__ import annotations
+
+import gzip
+from typing import Any, Dict, Iterable, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import Tool
+from app.schemas.tool import ToolOut
+from app.services.catalogue_cache import get_catalogue
+
+try:  # optional dependency
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+
+# Each variant is compressed once per version, so favour ratio over speed,
+# short of brotli's slowest levels.
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+VIEWS = {
+    "list": Tool.overall_score.desc(),
+    "export": Tool.name.asc(),
+}
+
+
+class EncodedCatalogue:
+    """Serialized catalogue JSON and its compressed variants, keyed by content coding."""
+
+    def __init__(self, body: bytes, fingerprint: str, view: str) -> None:
+        self.bodies: Dict[str, bytes] = {"identity": body, "gzip": gzip.compress(body, GZIP_LEVEL, mtime=0)}
+        if brotli is not None:
+            self.bodies["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+        self.fingerprint = fingerprint
+        self.view = view
+
+    def negotiate(self, accept_encoding: Optional[str]) -> str:
+        """Pick the smallest acceptable variant, falling back to uncompressed JSON."""
+
+        accepted = set()
+        for item in (accept_encoding or "").split(","):
+            coding, _, params = item.strip().partition(";")
+            quality = params.strip().removeprefix("q=") if params.strip().startswith("q=") else "1"
+            try:
+                if float(quality) > 0:
+                    accepted.add(coding.strip().lower())
+            except ValueError:
+                continue
+        for coding in ("br", "gzip"):
+            if coding in self.bodies and (coding in accepted or "*" in accepted):
+                return coding
+        return "identity"
+
+
+SERIALIZE_BATCH_SIZE = 1000
+
+
+def _statement(view: str) -> Any:
+    return select(Tool).order_by(VIEWS[view]).execution_options(yield_per=SERIALIZE_BATCH_SIZE)
+
+
+def _encode_tools(tools: Iterable[Tool]) -> List[bytes]:
+    return [ToolOut.model_validate(tool, from_attributes=True).model_dump_json().encode("utf-8") for tool in tools]
+
+
+def _body(parts: List[bytes]) -> bytes:
+    return b"[" + b",".join(parts) + b"]"
+
+
+def _serialize(session: Session, view: str) -> bytes:
+    parts: List[bytes] = []
+    for tools in session.scalars(_statement(view)).partitions():
+        parts += _encode_tools(tools)
+    return _body(parts)
+
+
+def encoded_catalogue(session: Session, view: str) -> EncodedCatalogue:
+    """Return the encoded catalogue for a view, rebuilt only after a version bump."""
+
+    catalogue = get_catalogue(session)
+    return catalogue.memoize(
+        ("encoded", view), lambda: EncodedCatalogue(_serialize(session, view), catalogue.fingerprint, view)
+    )
+
+
+async def encoded_catalogue_async(session: AsyncSession, view: str) -> EncodedCatalogue:
+    """``encoded_catalogue`` on an ``AsyncSession``.
+
+    Rows are streamed with awaited fetches; encoding and compression run on
+    the threadpool.
+    """
+
+    catalogue = await session.run_sync(get_catalogue)
+    encoded = catalogue.cached(("encoded", view))
+    if encoded is not None:
+        return encoded
+
+    parts: List[bytes] = []
+    result = await session.stream_scalars(_statement(view))
+    async for tools in result.partitions():
+        parts += await run_in_threadpool(_encode_tools, tools)
+    return await run_in_threadpool(
+        catalogue.memoize, ("encoded", view), lambda: EncodedCatalogue(_body(parts), catalogue.fingerprint, view)
+    )
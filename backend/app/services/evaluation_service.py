@@ -2,31 +2,55 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from sqlalchemy.orm import Session
 
+from app.core.metrics import stage
 from app.models import Tool
 from app.schemas.evaluation import (
     CriteriaScore,
     EvaluationAnswerSet,
+    EvaluationRequest,
     EvaluationResultPayload,
+    ParetoFront,
+    RobustnessReport,
+    SensitivityReport,
+    ToolRobustness,
     ToolScoreBreakdown,
 )
-
-
-CRITERIA_KEYS = [
-    "ai_assistance",
-    "reporting",
-    "maintenance",
-    "execution",
-    "cross_browser",
-    "ci_cd",
-    "budget_fit",
-    "team_skill_fit",
-    "language_fit",
-    "analytics",
-    "community",
+from app.services.catalogue_cache import CatalogueSnapshot, get_catalogue
+from app.services.pareto import pareto_front
+from app.services.result_cache import result_cache, result_cache_key
+from app.services.robustness import simulate_rankings
+from app.services.scoring_matrix import (
+    CRITERIA_KEYS,
+    MatrixScores,
+    RankedScores,
+    ScoringMatrix,
+    accumulate_totals,
+    max_possible_score,
+    weight_vector,
+)
+from app.services.scoring_pool import score_batch
+from app.services.sensitivity import analyse_sensitivity
+from app.services.snapshots import decode_snapshot, snapshot_scores
+from app.services.weight_profiles import WeightProfileTable
+
+
+RADAR_CATEGORIES = [
+    "AI Assistance",
+    "Reporting",
+    "Maintenance",
+    "Execution",
+    "Cross Browser",
+    "CI/CD",
+    "Budget Fit",
+    "Team Fit",
+    "Language Fit",
+    "Analytics",
+    "Community",
 ]
 
 
@@ -126,6 +150,9 @@ def calculate_weights(answers: EvaluationAnswerSet) -> Dict[str, float]:
     return weights
 
 
+weight_table = WeightProfileTable(calculate_weights)
+
+
 def _scale(value: float, min_value: float = 0, max_value: float = 5) -> float:
     clipped = min(max(value, min_value), max_value)
     return round(clipped, 2)
@@ -165,7 +192,11 @@ def compute_scores(
     answers: EvaluationAnswerSet,
     weights: Dict[str, float],
 ) -> Tuple[List[ToolScoreBreakdown], List[int], List[str], List[Dict[str, Any]]]:
-    """Compute scores for each tool and return ranking and chart data."""
+    """Compute scores for each tool and return ranking and chart data.
+
+    This is the reference implementation; the engine scores through
+    :func:`compute_matrix_scores`, which must produce identical results.
+    """
 
     scored: List[ToolScoreBreakdown] = []
 
@@ -241,20 +272,23 @@ def compute_scores(
     for idx, entry in enumerate(scored, start=1):
         entry.rank = idx
 
-    radar_categories = [
-        "AI Assistance",
-        "Reporting",
-        "Maintenance",
-        "Execution",
-        "Cross Browser",
-        "CI/CD",
-        "Budget Fit",
-        "Team Fit",
-        "Language Fit",
-        "Analytics",
-        "Community",
-    ]
+    return _summarise(scored)
+
 
+def compute_matrix_scores(
+    matrix: ScoringMatrix,
+    answers: EvaluationAnswerSet,
+    weights: Dict[str, float],
+) -> Tuple[List[ToolScoreBreakdown], List[int], List[str], List[Dict[str, Any]]]:
+    """Compiled equivalent of :func:`compute_scores` operating on a scoring matrix."""
+
+    scored = matrix.score(answers, weights).breakdowns()
+    return _summarise(scored)
+
+
+def _summarise(
+    scored: List[ToolScoreBreakdown],
+) -> Tuple[List[ToolScoreBreakdown], List[int], List[str], List[Dict[str, Any]]]:
     bar_chart: List[Dict[str, Any]] = []
     for entry in scored[:5]:
         bar_chart.append(
@@ -269,29 +303,314 @@ def compute_scores(
 
     top_ids = [entry.tool_id for entry in scored[:3]]
 
-    return scored, top_ids, radar_categories, bar_chart
+    return scored, top_ids, list(RADAR_CATEGORIES), bar_chart
+
+
+def resolve_weights(answers: EvaluationAnswerSet, weight_overrides: Dict[str, float] | None = None) -> Dict[str, float]:
+    """Return the questionnaire weight profile with user overrides applied."""
+
+    return apply_weight_overrides(weight_table.lookup(answers), weight_overrides)
+
+
+def apply_weight_overrides(weights: Dict[str, float], overrides: Dict[str, float] | None) -> Dict[str, float]:
+    """Return a copy of ``weights`` with overrides for known criteria clamped and applied."""
+
+    weights = dict(weights)
+    if overrides:
+        for key, value in overrides.items():
+            if key in weights:
+                weights[key] = round(max(value, 0.1), 2)
+
+    return weights
+
+
+def load_catalogue(session: Session) -> CatalogueSnapshot:
+    """Take the catalogue snapshot a request is scored and fingerprinted on."""
+
+    with stage("catalogue_load"):
+        return get_catalogue(session)
+
+
+def _breakdown_limit(top_k: Optional[int]) -> Optional[int]:
+    # Charts always need the top 5, so at least that many breakdowns are built.
+    return max(top_k, 5) if top_k else None
+
+
+def _ranking_depth(request: EvaluationRequest) -> Optional[int]:
+    """How many ranked tools the payload of ``request`` reads; ``None`` for all."""
+
+    return None if request.include_aggregate_scores else _breakdown_limit(request.top_k)
+
+
+def _result_payload(
+    scores: MatrixScores | RankedScores,
+    weights: Dict[str, float],
+    top_k: Optional[int] = None,
+    include_aggregate_scores: bool = False,
+    pareto: Optional[ParetoFront] = None,
+) -> EvaluationResultPayload:
+    scored, top_ids, radar_categories, bar_chart = _summarise(scores.breakdowns(_breakdown_limit(top_k)))
+
+    return EvaluationResultPayload(
+        evaluation=None,  # to be filled by caller once persisted
+        default_weights=weights,
+        scored_tools=scored[:top_k] if top_k else scored,
+        recommended_tool_ids=top_ids,
+        radar_categories=radar_categories,
+        bar_chart_data=bar_chart,
+        aggregate_scores=scores.aggregates() if include_aggregate_scores else None,
+        pareto=pareto,
+    )
+
+
+def _pareto(
+    catalogue: CatalogueSnapshot, answers: EvaluationAnswerSet, scores: MatrixScores | RankedScores
+) -> ParetoFront:
+    # The front only depends on the answer-dependent columns, so it is shared
+    # by every answer set with the same signature until the catalogue changes.
+    # Signatures come from a small fixed set (languages no tool supports share
+    # one), which bounds the memo per catalogue version.
+    matrix = catalogue.matrix
+    return catalogue.memoize(
+        ("pareto", matrix.answer_signature(answers)),
+        lambda: ParetoFront(**pareto_front(matrix.tool_ids, scores.values)),
+    )
 
 
 class EvaluationEngine:
     """Facade for executing evaluation workflows."""
 
     @staticmethod
-    def run(session: Session, answers: EvaluationAnswerSet, weight_overrides: Dict[str, float] | None = None) -> EvaluationResultPayload:
-        tools = session.query(Tool).order_by(Tool.overall_score.desc()).all()
-        weights = calculate_weights(answers)
+    def run(
+        catalogue: CatalogueSnapshot,
+        answers: EvaluationAnswerSet,
+        weight_overrides: Dict[str, float] | None = None,
+        top_k: Optional[int] = None,
+        include_aggregate_scores: bool = False,
+        include_pareto: bool = False,
+    ) -> EvaluationResultPayload:
+        """Score a catalogue snapshot; with ``top_k`` only the winners get full breakdowns.
+
+        The caller takes the snapshot (see ``load_catalogue``) so that anything
+        else it derives for the request, such as the result fingerprint, comes
+        from the same catalogue.
+        """
+
+        with stage("cache_lookup"):
+            cache_key = result_cache_key(
+                answers,
+                weight_overrides,
+                catalogue.version,
+                top_k=top_k,
+                include_aggregate_scores=include_aggregate_scores,
+                include_pareto=include_pareto,
+            )
+            cached = result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        with stage("calculate_weights"):
+            weights = resolve_weights(answers, weight_overrides)
+        with stage("compute_scores"):
+            scores = catalogue.matrix.score(answers, weights)
+        pareto = None
+        if include_pareto:
+            with stage("pareto"):
+                pareto = _pareto(catalogue, answers, scores)
+        with stage("payload_build"):
+            payload = _result_payload(scores, weights, top_k, include_aggregate_scores, pareto)
+        result_cache.put(cache_key, payload)
+        return payload
+
+    @staticmethod
+    def run_batch(
+        catalogue: CatalogueSnapshot, requests: Sequence[EvaluationRequest]
+    ) -> List[EvaluationResultPayload]:
+        """Score many requests against one catalogue snapshot, preserving input order."""
+
+        results: List[Optional[EvaluationResultPayload]] = [None] * len(requests)
+        pending: List[Tuple[int, str, Dict[str, float]]] = []
+
+        for index, request in enumerate(requests):
+            cache_key = result_cache_key(
+                request.answers,
+                request.weight_overrides,
+                catalogue.version,
+                top_k=request.top_k,
+                include_aggregate_scores=request.include_aggregate_scores,
+                include_pareto=request.include_pareto,
+            )
+            cached = result_cache.get(cache_key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, cache_key, resolve_weights(request.answers, request.weight_overrides)))
 
-        if weight_overrides:
-            for key, value in weight_overrides.items():
-                if key in weights:
-                    weights[key] = round(max(value, 0.1), 2)
+        batch_scores = score_batch(
+            catalogue.matrix,
+            [requests[index].answers for index, _, _ in pending],
+            [weights for _, _, weights in pending],
+            [_ranking_depth(requests[index]) for index, _, _ in pending],
+        )
+        for (index, cache_key, weights), scores in zip(pending, batch_scores):
+            request = requests[index]
+            pareto = _pareto(catalogue, request.answers, scores) if request.include_pareto else None
+            payload = _result_payload(scores, weights, request.top_k, request.include_aggregate_scores, pareto)
+            result_cache.put(cache_key, payload)
+            results[index] = payload
 
-        scored, top_ids, radar_categories, bar_chart = compute_scores(tools, answers, weights)
+        return results
 
+    @staticmethod
+    def reweight(
+        snapshot: Dict[str, Any] | None, weights: Dict[str, float], matrix: ScoringMatrix
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Re-rank the tools stored in an evaluation snapshot under new weights.
+
+        Only the stored criteria values are used, so no breakdown object is
+        built. Returns every stored tool in its new rank order and how many of
+        them kept their stored scores and rank. Ties are broken in the order
+        of ``matrix``, as a fresh run with the same weights would break them.
+        """
+
+        stored = snapshot_scores(snapshot)
+        order = matrix.catalogue_order(stored["tool_id"])
+        values = stored["values"][order]
+        scores = MatrixScores(None, values, accumulate_totals(values, weight_vector(weights)), max_possible_score(weights))
+        totals = scores.rounded_totals.tolist()
+        normalized = scores.normalized_scores().tolist()
+        order = order.tolist()
+
+        ranked: List[Dict[str, Any]] = []
+        unchanged = 0
+        for rank, position in enumerate(scores.ranking().tolist(), start=1):
+            index = order[position]
+            row = {
+                "tool_id": stored["tool_id"][index],
+                "total_score": totals[position],
+                "normalized_score": normalized[position],
+                "rank": rank,
+            }
+            if (
+                row["total_score"] == stored["total_score"][index]
+                and row["normalized_score"] == stored["normalized_score"][index]
+                and rank == stored["rank"][index]
+            ):
+                row["changed"] = False
+                unchanged += 1
+            else:
+                row["changed"] = True
+            ranked.append(row)
+        return ranked, unchanged
+
+    @staticmethod
+    def reweighted_payload(
+        snapshot: Dict[str, Any] | None, weights: Dict[str, float], ranked: Sequence[Dict[str, Any]]
+    ) -> EvaluationResultPayload:
+        """Rebuild a stored result with the scores and order produced by ``reweight``."""
+
+        stored = {item["tool_id"]: item for item in decode_snapshot(snapshot).get("scored_tools", [])}
+        tools = [
+            ToolScoreBreakdown.model_validate(
+                dict(
+                    stored[row["tool_id"]],
+                    total_score=row["total_score"],
+                    normalized_score=row["normalized_score"],
+                    rank=row["rank"],
+                )
+            )
+            for row in ranked
+        ]
+        scored, top_ids, radar_categories, bar_chart = _summarise(tools)
         return EvaluationResultPayload(
-            evaluation=None,  # to be filled by caller once persisted
+            evaluation=None,
             default_weights=weights,
             scored_tools=scored,
             recommended_tool_ids=top_ids,
             radar_categories=radar_categories,
             bar_chart_data=bar_chart,
         )
+
+    @staticmethod
+    def sensitivity(
+        catalogue: CatalogueSnapshot,
+        answers: EvaluationAnswerSet,
+        weight_overrides: Dict[str, float] | None = None,
+        max_weight: float = 5.0,
+        depth: int = 3,
+    ) -> SensitivityReport:
+        """Analyse how far each weight can move before the leading ranking changes."""
+
+        matrix = catalogue.matrix
+        weights = resolve_weights(answers, weight_overrides)
+        report = analyse_sensitivity(
+            matrix.tool_ids,
+            matrix.criteria_values(answers),
+            weights,
+            max_weight=max_weight,
+            depth=depth,
+        )
+        return SensitivityReport(weights=weights, **report)
+
+    @staticmethod
+    def robustness(
+        catalogue: CatalogueSnapshot,
+        answers: EvaluationAnswerSet,
+        weight_overrides: Dict[str, float] | None = None,
+        samples: int = 10_000,
+        distribution: str = "normal",
+        spread: float = 0.15,
+        seed: Optional[int] = None,
+        depth: int = 3,
+    ) -> RobustnessReport:
+        """Estimate rank probabilities under random perturbations of the weight profile.
+
+        Only tools that reached the leading ``depth`` ranks in at least one
+        sample, or hold one of them in the deterministic ranking, are reported.
+        """
+
+        matrix = catalogue.matrix
+        weights = resolve_weights(answers, weight_overrides)
+        scores = matrix.score(answers, weights)
+        simulation = simulate_rankings(
+            scores.values,
+            weight_vector(weights),
+            samples,
+            distribution=distribution,
+            spread=spread,
+            seed=seed,
+            depth=depth,
+        )
+
+        baseline_ranks = np.empty(len(matrix), dtype=np.int64)
+        baseline_ranks[scores.ranking()] = np.arange(1, len(matrix) + 1)
+        rank_counts = simulation["rank_counts"]
+        mean_totals = simulation["mean_totals"]
+        depth = rank_counts.shape[1]
+
+        candidates = np.flatnonzero((rank_counts.sum(axis=1) > 0) | (baseline_ranks <= depth))
+        tools = []
+        for index in candidates.tolist():
+            distribution_row = (rank_counts[index] / samples).tolist()
+            tools.append(
+                ToolRobustness(
+                    tool_id=matrix.tool_ids[index],
+                    tool_name=matrix.tool_names[index],
+                    baseline_rank=int(baseline_ranks[index]),
+                    probability_first=distribution_row[0] if distribution_row else 0.0,
+                    probability_top=float(sum(distribution_row)),
+                    rank_distribution=distribution_row,
+                    mean_total_score=round(float(mean_totals[index]), 2),
+                )
+            )
+        tools.sort(key=lambda item: (-item.probability_first, -item.probability_top, item.baseline_rank))
+
+        return RobustnessReport(
+            weights=weights,
+            samples=samples,
+            distribution=distribution,
+            spread=spread,
+            seed=seed,
+            depth=depth,
+            tools=tools,
+        )
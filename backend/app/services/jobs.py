@@ -0,0 +1,279 @@
+"""In-process background jobs backed by the ``jobs`` table.
+
+Handlers are registered per job kind and run on a bounded thread pool; the
+table is the queue, so no broker is needed and queued work survives a
+restart. Each handler gets its own session and a ``JobContext`` for
+progress reporting and cooperative cancellation. Several API processes may
+share the database: a runner stamps the jobs it claims with its id and keeps
+their heartbeat fresh, and a running job is only failed once its heartbeat is
+older than ``job_stale_after_seconds``, i.e. its process has gone away.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal
+from app.models import Job
+
+
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler once cancellation of its job was requested."""
+
+
+class JobQueueFull(Exception):
+    """Raised when ``job_max_queued`` jobs are already waiting."""
+
+
+class JobContext:
+    """Progress and cancellation hooks handed to a running job."""
+
+    def __init__(self, runner: "JobRunner", job_id: str, total: Optional[int]) -> None:
+        self._runner = runner
+        self.job_id = job_id
+        self.progress = 0
+        self.total = total
+        self._flushed_at = time.monotonic()
+        # Handlers holding a write transaction on SQLite switch this off: the
+        # update would wait on their own lock.
+        self.flush_progress = True
+
+    def report(self, progress: int, total: Optional[int] = None) -> None:
+        """Record progress; it is served live and written to the row at most every ``job_progress_interval_seconds``."""
+
+        self.progress = progress
+        if total is not None:
+            self.total = total
+        self._runner._live[self.job_id] = (self.progress, self.total)
+
+        now = time.monotonic()
+        if not self.flush_progress or now - self._flushed_at < get_settings().job_progress_interval_seconds:
+            return
+        self._flushed_at = now
+        # Other processes and a restarted runner only see what is on the row.
+        session = SessionLocal.session_factory()
+        try:
+            session.execute(update(Job).where(Job.id == self.job_id).values(progress=self.progress, total=self.total))
+            session.commit()
+        finally:
+            session.close()
+
+    def check_cancelled(self) -> None:
+        """Raise ``JobCancelled`` if cancellation was requested; call between units of work."""
+
+        if self.job_id in self._runner._cancelled:
+            raise JobCancelled()
+        # The flag may have been set by another process sharing the database.
+        session = SessionLocal.session_factory()
+        try:
+            if session.scalar(select(Job.cancel_requested).where(Job.id == self.job_id)):
+                raise JobCancelled()
+        finally:
+            session.close()
+
+
+JobHandler = Callable[[Session, Dict[str, Any], JobContext], Dict[str, Any]]
+
+
+def _error_message(exc: Exception) -> str:
+    if isinstance(exc, HTTPException):
+        return str(exc.detail)
+    return str(exc) or type(exc).__name__
+
+
+class JobRunner:
+    """Executes queued jobs on a thread pool of ``job_workers`` threads."""
+
+    def __init__(self) -> None:
+        self._handlers: Dict[str, JobHandler] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+        self._live: Dict[str, Tuple[int, Optional[int]]] = {}
+        self._cancelled: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+        self.runner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"[-64:]
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    def start(self) -> None:
+        """Create the worker pool, fail stale jobs and pick up the queued ones."""
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=get_settings().job_workers, thread_name_prefix="job")
+        if self._heartbeat is None:
+            self._stopping.clear()
+            self._heartbeat = threading.Thread(target=self._beat_forever, name="job-heartbeat", daemon=True)
+            self._heartbeat.start()
+
+        session = SessionLocal.session_factory()
+        try:
+            self._fail_stale(session)
+            session.commit()
+            queued = session.scalars(select(Job.id).where(Job.status == "queued").order_by(Job.created_at)).all()
+        finally:
+            session.close()
+        # Other processes schedule the same jobs; ``_claim`` lets only one run each.
+        for job_id in queued:
+            self._schedule(job_id)
+
+    def shutdown(self) -> None:
+        self._stopping.set()
+        self._heartbeat = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    def _fail_stale(session: Session) -> None:
+        """Fail running jobs whose runner stopped refreshing their heartbeat.
+
+        Jobs claimed before heartbeats were recorded have none and count as stale.
+        """
+
+        now = datetime.utcnow()
+        cutoff = now - timedelta(seconds=get_settings().job_stale_after_seconds)
+        session.execute(
+            update(Job)
+            .where(Job.status == "running", or_(Job.heartbeat_at.is_(None), Job.heartbeat_at < cutoff))
+            .values(status="failed", error="Interrupted: the process running it stopped", finished_at=now)
+        )
+
+    def _beat_forever(self) -> None:
+        while not self._stopping.wait(get_settings().job_heartbeat_interval_seconds):
+            session = SessionLocal.session_factory()
+            try:
+                running = list(self._live)
+                if running:
+                    session.execute(
+                        update(Job)
+                        .where(Job.id.in_(running), Job.runner_id == self.runner_id)
+                        .values(heartbeat_at=datetime.utcnow())
+                    )
+                # Jobs of a process that died while this one keeps serving.
+                self._fail_stale(session)
+                session.commit()
+            except SQLAlchemyError:
+                # A job holding the SQLite write lock; the next beat retries.
+                session.rollback()
+            finally:
+                session.close()
+
+    def submit(self, session: Session, kind: str, payload: Dict[str, Any], total: Optional[int] = None) -> Job:
+        """Persist a queued job and schedule it; commits the caller's session."""
+
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind '{kind}'")
+        queued = session.query(Job).filter(Job.status == "queued").count()
+        if queued >= get_settings().job_max_queued:
+            raise JobQueueFull()
+
+        job = Job(kind=kind, payload=payload, total=total)
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+        self._schedule(job.id)
+        return job
+
+    def cancel(self, session: Session, job: Job) -> Job:
+        """Cancel a queued job at once, or ask a running one to stop at its next check."""
+
+        if job.status in FINISHED_STATUSES:
+            return job
+        job.cancel_requested = True
+        with self._lock:
+            future = self._futures.get(job.id)
+            self._cancelled.add(job.id)
+        if job.status == "queued" and (future is None or future.cancel()):
+            job.status = "cancelled"
+            job.finished_at = datetime.utcnow()
+            self._cancelled.discard(job.id)
+        session.commit()
+        session.refresh(job)
+        return job
+
+    def live_progress(self, job_id: str) -> Optional[Tuple[int, Optional[int]]]:
+        """Return the progress of a job running in this process, if any."""
+
+        return self._live.get(job_id)
+
+    def _schedule(self, job_id: str) -> None:
+        if self._executor is None:
+            return  # picked up by ``start``
+        with self._lock:
+            future = self._executor.submit(self._run, job_id)
+            self._futures[job_id] = future
+        future.add_done_callback(lambda _: self._futures.pop(job_id, None))
+
+    def _claim(self, session: Session, job_id: str) -> Optional[Job]:
+        """Move a queued job to running; only one claimant can win."""
+
+        now = datetime.utcnow()
+        queued = (Job.id == job_id, Job.status == "queued")
+        claimed = session.execute(
+            update(Job)
+            .where(*queued, Job.cancel_requested.is_(False))
+            .values(status="running", started_at=now, runner_id=self.runner_id, heartbeat_at=now)
+        ).rowcount
+        if not claimed:
+            # Cancelled after it was scheduled but before it started.
+            session.execute(
+                update(Job)
+                .where(*queued, Job.cancel_requested.is_(True))
+                .values(status="cancelled", finished_at=datetime.utcnow())
+            )
+        session.commit()
+        return session.get(Job, job_id) if claimed else None
+
+    def _run(self, job_id: str) -> None:
+        session = SessionLocal.session_factory()
+        work = SessionLocal.session_factory()
+        try:
+            job = self._claim(session, job_id)
+            if job is None:
+                return
+            handler, payload = self._handlers[job.kind], job.payload
+            context = JobContext(self, job.id, job.total)
+            self._live[job.id] = (0, job.total)
+            # Release the job row's read transaction while the handler works.
+            session.commit()
+            try:
+                result = handler(work, payload, context)
+                work.commit()
+            except JobCancelled:
+                work.rollback()
+                job.status, job.result = "cancelled", None
+            except Exception as exc:
+                work.rollback()
+                job.status, job.error = "failed", _error_message(exc)
+            else:
+                job.status, job.result = "succeeded", result
+            job.progress, job.total = context.progress, context.total
+            job.finished_at = datetime.utcnow()
+            session.commit()
+        finally:
+            self._live.pop(job_id, None)
+            self._cancelled.discard(job_id)
+            work.close()
+            session.close()
+
+
+job_runner = JobRunner()
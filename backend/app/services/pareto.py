@@ -0,0 +1,104 @@
+"""Pareto-front (non-dominated set) filtering over the criteria matrix."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+
+# Candidates compared against the front per step; bounds the block x front buffers.
+BLOCK_SIZE = 256
+
+
+def _dominance(candidates: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """Return a ``candidates x others`` mask of which ``others`` rows dominate each candidate.
+
+    Built one criterion at a time to avoid a ``candidates x others x criteria``
+    temporary.
+    """
+
+    at_least = np.ones((candidates.shape[0], others.shape[0]), dtype=bool)
+    better = np.zeros_like(at_least)
+    for column in range(candidates.shape[1]):
+        other_column = others[None, :, column]
+        candidate_column = candidates[:, column, None]
+        at_least &= other_column >= candidate_column
+        better |= other_column > candidate_column
+    return at_least & better
+
+
+def _dominated_by_any(candidates: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """Return which ``candidates`` rows are dominated by at least one ``others`` row."""
+
+    result = np.zeros(candidates.shape[0], dtype=bool)
+    if others.shape[0] == 0:
+        return result
+    step = max(1, BLOCK_SIZE * BLOCK_SIZE // max(1, others.shape[0]))
+    for start in range(0, candidates.shape[0], step):
+        result[start : start + step] = _dominance(candidates[start : start + step], others).any(axis=1)
+    return result
+
+
+def non_dominated_mask(values: np.ndarray) -> np.ndarray:
+    """Return a mask of rows not dominated on every criterion by another row.
+
+    A row can only be dominated by rows with a strictly larger sum, so rows
+    are visited in descending-sum order in blocks and each block is compared
+    against the front found so far and against itself. Dominated rows never
+    join the front, keeping the work proportional to ``rows x front size``
+    rather than all pairs.
+    """
+
+    count = values.shape[0]
+    mask = np.zeros(count, dtype=bool)
+    order = np.argsort(-values.sum(axis=1), kind="stable")
+    front = np.empty((0, values.shape[1]), dtype=values.dtype)
+
+    for start in range(0, count, BLOCK_SIZE):
+        indices = order[start : start + BLOCK_SIZE]
+        block = values[indices]
+        survivors = ~_dominated_by_any(block, front)
+        survivors &= ~_dominated_by_any(block, block[survivors])
+        mask[indices[survivors]] = True
+        front = np.concatenate([front, block[survivors]])
+
+    return mask
+
+
+def pareto_front(tool_ids: Sequence[int], values: np.ndarray) -> Dict[str, Any]:
+    """Return the non-dominated tools and, for every other tool, its nearest dominator.
+
+    The nearest dominator is the front member dominating the tool with the
+    smallest Euclidean distance over raw criteria values, so the whole result
+    is independent of the weight profile.
+    """
+
+    mask = non_dominated_mask(values)
+    front_indices = np.flatnonzero(mask)
+    front = values[front_indices]
+
+    dominated: List[Dict[str, Any]] = []
+    step = max(1, BLOCK_SIZE * BLOCK_SIZE // max(1, front.shape[0]))
+    dominated_indices = np.flatnonzero(~mask)
+    for start in range(0, dominated_indices.shape[0], step):
+        indices = dominated_indices[start : start + step]
+        block = values[indices]
+        squared = np.zeros((block.shape[0], front.shape[0]), dtype=np.float64)
+        for column in range(block.shape[1]):
+            squared += (front[None, :, column] - block[:, column, None]) ** 2
+        distances = np.where(_dominance(block, front), np.sqrt(squared), np.inf)
+        nearest = distances.argmin(axis=1)
+        for offset, index in enumerate(indices.tolist()):
+            dominated.append(
+                {
+                    "tool_id": tool_ids[index],
+                    "nearest_dominator_id": tool_ids[int(front_indices[nearest[offset]])],
+                    "distance": round(float(distances[offset, nearest[offset]]), 4),
+                }
+            )
+
+    return {
+        "tool_ids": [tool_ids[index] for index in front_indices.tolist()],
+        "dominated": dominated,
+    }
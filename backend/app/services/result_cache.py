@@ -0,0 +1,103 @@
+"""Bounded LRU/TTL cache of evaluation results keyed by canonical answers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import get_settings
+from app.schemas.evaluation import EvaluationAnswerSet, EvaluationResultPayload
+
+
+def result_cache_key(
+    answers: EvaluationAnswerSet,
+    weight_overrides: Optional[Dict[str, float]],
+    catalogue_version: int,
+    **options: Any,
+) -> str:
+    """Return a stable hash of everything that determines an engine result."""
+
+    canonical = json.dumps(
+        {
+            "answers": answers.model_dump(),
+            "weight_overrides": weight_overrides or {},
+            "catalogue_version": catalogue_version,
+            "options": options,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU cache whose entries also expire after a TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, EvaluationResultPayload]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[EvaluationResultPayload]:
+        """Return a copy of the cached payload, safe for the caller to fill in."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, payload = entry
+            if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return payload.model_copy(update={"evaluation": None})
+
+    def put(self, key: str, payload: EvaluationResultPayload) -> None:
+        if self.max_entries <= 0:
+            return
+
+        stored = payload.model_copy(update={"evaluation": None})
+        with self._lock:
+            self._entries[key] = (time.monotonic(), stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+_settings = get_settings()
+result_cache = ResultCache(
+    max_entries=_settings.result_cache_max_entries,
+    ttl_seconds=_settings.result_cache_ttl_seconds,
+)
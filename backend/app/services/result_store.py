@@ -0,0 +1,116 @@
+"""Content-addressed storage of persisted evaluation results.
+
+Evaluations scored from the same canonical answers, weight profile and
+result size against the same catalogue content produce the same snapshot,
+so it is stored once in ``evaluation_results`` under a fingerprint of those
+inputs and every such evaluation references it. Rows are immutable: an
+evaluation that changes its result points at another row (copy-on-write),
+and rows nothing references any more are released.
+
+Evaluations written before the table existed keep their snapshot inline;
+``evaluation_snapshot`` reads either kind.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import Evaluation, EvaluationResult
+
+
+_UPSERT_DIALECTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# Select next to ``Evaluation.results_snapshot`` after ``join_shared_results``.
+SHARED_SNAPSHOT = EvaluationResult.snapshot.label("shared_snapshot")
+
+
+def _digest(document: Any) -> str:
+    canonical = json.dumps(document, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def result_fingerprint(
+    answers: Dict[str, Any], weights: Dict[str, float], top_k: Optional[int], catalogue_fingerprint: str
+) -> str:
+    """Fingerprint everything a stored engine result depends on.
+
+    The catalogue enters through its content fingerprint rather than the
+    in-process version counter, so identical scenarios match across
+    restarts and workers.
+    """
+
+    return _digest({"answers": answers, "weights": weights, "top_k": top_k, "catalogue": catalogue_fingerprint})
+
+
+def reweighted_fingerprint(evaluation: Any, weights: Dict[str, float], catalogue_fingerprint: str) -> str:
+    """Fingerprint a result re-ranked from an evaluation's stored values.
+
+    Ties are broken in catalogue order, so the catalogue is part of it too.
+    """
+
+    parent = evaluation.result_fingerprint or _digest(evaluation.results_snapshot)
+    return _digest({"reweighted": parent, "weights": weights, "catalogue": catalogue_fingerprint})
+
+
+def load_result(session: Session, fingerprint: str) -> Optional[Dict[str, Any]]:
+    return session.scalar(select(EvaluationResult.snapshot).where(EvaluationResult.fingerprint == fingerprint))
+
+
+def store_result(session: Session, fingerprint: str, snapshot: Dict[str, Any]) -> None:
+    """Insert a result, or claim the row if it is already stored.
+
+    Call this before inserting an evaluation that references ``fingerprint``,
+    even when the row was just loaded: an existing row is touched rather than
+    skipped, so it stays locked against a concurrent ``release_result`` until
+    the caller commits.
+    """
+
+    row = {"fingerprint": fingerprint, "snapshot": snapshot}
+    dialect = session.get_bind().dialect.name
+    if dialect in _UPSERT_DIALECTS:
+        statement = _UPSERT_DIALECTS[dialect](EvaluationResult)
+        statement = statement.on_conflict_do_update(
+            index_elements=["fingerprint"], set_={"fingerprint": statement.excluded.fingerprint}
+        )
+        session.execute(statement, [row])
+    elif load_result(session, fingerprint) is None:
+        session.execute(insert(EvaluationResult), [row])
+
+
+def release_result(session: Session, fingerprint: Optional[str]) -> None:
+    """Delete a stored result once no evaluation references it."""
+
+    if fingerprint is None:
+        return
+    session.flush()
+    referenced = select(Evaluation.id).where(Evaluation.result_fingerprint == fingerprint).exists()
+    try:
+        with session.begin_nested():
+            session.execute(delete(EvaluationResult).where(EvaluationResult.fingerprint == fingerprint, ~referenced))
+    except IntegrityError:
+        pass  # an evaluation referencing it committed while the delete waited
+
+
+def join_shared_results(statement: Any) -> Any:
+    return statement.outerjoin(EvaluationResult, EvaluationResult.fingerprint == Evaluation.result_fingerprint)
+
+
+def evaluation_snapshot(evaluation: Any) -> Dict[str, Any]:
+    """Return an evaluation's encoded snapshot, whether shared or stored inline.
+
+    ``evaluation`` is an ``Evaluation`` or a row that selected
+    ``SHARED_SNAPSHOT`` through ``join_shared_results``.
+    """
+
+    if isinstance(evaluation, Evaluation):
+        shared = evaluation.result.snapshot if evaluation.result is not None else None
+    else:
+        shared = evaluation.shared_snapshot
+    return shared if shared is not None else evaluation.results_snapshot
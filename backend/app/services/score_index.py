@@ -0,0 +1,128 @@
+"""Per-tool score rows of persisted evaluations, kept for SQL analytics.
+
+``evaluation_tool_scores`` mirrors the scored tools of every stored
+``results_snapshot`` so aggregate reports run as indexed GROUP BYs instead of
+parsing snapshots. Existing evaluations are indexed with::
+
+    python -m app.services.score_index [--rebuild] [--batch-size 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.database import session_scope
+from app.models import Evaluation, EvaluationToolScore
+from app.services.result_store import SHARED_SNAPSHOT, evaluation_snapshot, join_shared_results
+from app.services.scoring_matrix import CRITERIA_KEYS
+from app.services.snapshots import snapshot_scores
+
+
+# Rows written per executemany INSERT.
+INDEX_CHUNK_SIZE = 1000
+
+
+def tool_score_rows(evaluation_id: str, created_at: datetime, snapshot: Dict[str, Any] | None) -> List[Dict[str, Any]]:
+    """Return one ``evaluation_tool_scores`` row per tool stored in a snapshot."""
+
+    stored = snapshot_scores(snapshot)
+    rows = []
+    for position, values in enumerate(stored["values"].tolist()):
+        row = {
+            "evaluation_id": evaluation_id,
+            "tool_id": stored["tool_id"][position],
+            "tool_name": stored["tool_name"][position],
+            "created_at": created_at,
+            "rank": stored["rank"][position],
+            "total_score": stored["total_score"][position],
+            "normalized_score": stored["normalized_score"][position],
+        }
+        row.update(zip(CRITERIA_KEYS, values))
+        rows.append(row)
+    return rows
+
+
+def unindex_evaluation(session: Session, evaluation_id: str) -> None:
+    session.execute(delete(EvaluationToolScore).where(EvaluationToolScore.evaluation_id == evaluation_id))
+
+
+def write_tool_scores(
+    session: Session, evaluation_id: str, rows: List[Dict[str, Any]], replace: bool = True
+) -> int:
+    """Write prepared ``tool_score_rows`` of one evaluation inside the caller's transaction.
+
+    With ``replace`` any rows from an earlier snapshot are removed first.
+    Returns the number of rows written.
+    """
+
+    if replace:
+        unindex_evaluation(session, evaluation_id)
+    for start in range(0, len(rows), INDEX_CHUNK_SIZE):
+        session.execute(insert(EvaluationToolScore), rows[start : start + INDEX_CHUNK_SIZE])
+    return len(rows)
+
+
+def index_evaluation(
+    session: Session, evaluation_id: str, created_at: datetime, snapshot: Dict[str, Any] | None, replace: bool = True
+) -> int:
+    """Derive and write the score rows of one evaluation; see ``write_tool_scores``."""
+
+    return write_tool_scores(session, evaluation_id, tool_score_rows(evaluation_id, created_at, snapshot), replace)
+
+
+def backfill_tool_scores(session: Session, rebuild: bool = False, batch_size: int = 200) -> Dict[str, int]:
+    """Index stored evaluations, committing every ``batch_size`` evaluations.
+
+    Unless ``rebuild`` is set, only evaluations without score rows, or with
+    rows indexed before tool names were stored, are indexed.
+    """
+
+    query = select(Evaluation.id).order_by(Evaluation.created_at, Evaluation.id)
+    unnamed: Set[str] = set()
+    if not rebuild:
+        indexed = select(EvaluationToolScore.evaluation_id).where(EvaluationToolScore.evaluation_id == Evaluation.id)
+        unnamed = set(
+            session.scalars(
+                select(EvaluationToolScore.evaluation_id).where(EvaluationToolScore.tool_name.is_(None)).distinct()
+            )
+        )
+        query = query.where(~indexed.exists() | Evaluation.id.in_(unnamed))
+    # Only ids are held; snapshots are loaded one batch at a time.
+    pending = list(session.scalars(query))
+
+    rows = 0
+    for start in range(0, len(pending), batch_size):
+        batch = join_shared_results(
+            select(Evaluation.id, Evaluation.created_at, Evaluation.results_snapshot, SHARED_SNAPSHOT)
+        ).where(Evaluation.id.in_(pending[start : start + batch_size]))
+        for evaluation in session.execute(batch).all():
+            rows += index_evaluation(
+                session,
+                evaluation.id,
+                evaluation.created_at,
+                evaluation_snapshot(evaluation),
+                replace=rebuild or evaluation.id in unnamed,
+            )
+        session.commit()
+    return {"evaluations": len(pending), "rows": rows}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Index stored evaluations into evaluation_tool_scores.")
+    parser.add_argument("--rebuild", action="store_true", help="re-index evaluations that already have rows")
+    parser.add_argument("--batch-size", type=int, default=200, help="evaluations per commit")
+    args = parser.parse_args(argv)
+
+    with session_scope() as session:
+        result = backfill_tool_scores(session, rebuild=args.rebuild, batch_size=args.batch_size)
+    print(f"Indexed {result['evaluations']} evaluations ({result['rows']} tool rows)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,554 @@
+"""Compiled tools x criteria matrix used by the scoring engine.
+
+The catalogue is compiled once into a dense float array holding every
+answer-independent criterion value. Scoring an answer set then only fills the
+three answer-dependent columns (budget, team skill and language fit) and
+accumulates the weighted columns, which keeps the per-request cost independent
+of ORM attribute access and pydantic construction.
+
+Results are identical to :func:`app.services.evaluation_service.compute_scores`:
+static values are scaled with the same helper at compile time and totals are
+accumulated column by column in ``CRITERIA_KEYS`` order, so every tool sees the
+exact same sequence of floating point operations as the reference loop.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from app.schemas.evaluation import EvaluationAnswerSet, ToolScoreBreakdown
+
+
+CRITERIA_KEYS = [
+    "ai_assistance",
+    "reporting",
+    "maintenance",
+    "execution",
+    "cross_browser",
+    "ci_cd",
+    "budget_fit",
+    "team_skill_fit",
+    "language_fit",
+    "analytics",
+    "community",
+]
+
+CRITERIA_RATIONALES = {
+    "ai_assistance": "AI-driven authoring and maintenance support",
+    "reporting": "Depth of reporting, analytics, and insights",
+    "maintenance": "Expected maintenance effort from seed data",
+    "execution": "Execution speed benchmarks",
+    "cross_browser": "Cross-browser/device coverage capabilities",
+    "ci_cd": "Strength of CI/CD integrations",
+    "budget_fit": "Alignment with stated budget",
+    "team_skill_fit": "Fit for team scripting proficiency",
+    "language_fit": "Support for preferred language",
+    "analytics": "Analytics depth and dashboards",
+    "community": "Ecosystem maturity and community strength",
+}
+
+CRITERIA_INDEX = {key: idx for idx, key in enumerate(CRITERIA_KEYS)}
+
+BUDGET_COLUMN = CRITERIA_INDEX["budget_fit"]
+TEAM_SKILL_COLUMN = CRITERIA_INDEX["team_skill_fit"]
+LANGUAGE_COLUMN = CRITERIA_INDEX["language_fit"]
+
+BUDGET_TIERS = {
+    "free": 5,
+    "< $500": 4,
+    "> $500": 2,
+    "enterprise": 1,
+}
+DESIRED_SKILL_LEVELS = {"low": 1, "medium": 3, "high": 5}
+TOOL_SKILL_LEVELS = {"low": 2, "medium": 3, "high": 4}
+
+# Answer sets scored together per pass; bounds the tools x answers buffers.
+BATCH_CHUNK_SIZE = 256
+
+
+def scale_value(value: float, min_value: float = 0, max_value: float = 5) -> float:
+    """Clip a criterion value into the 0-5 range and round it."""
+
+    clipped = min(max(value, min_value), max_value)
+    return round(clipped, 2)
+
+
+def weight_vector(weights: Dict[str, float]) -> np.ndarray:
+    """Return the weights as an array aligned with ``CRITERIA_KEYS``."""
+
+    return np.array([weights.get(key, 1.0) for key in CRITERIA_KEYS], dtype=np.float64)
+
+
+def max_possible_score(weights: Dict[str, float]) -> float:
+    """Return the best achievable total for a weight profile."""
+
+    max_possible = 0.0
+    for key in CRITERIA_KEYS:
+        max_possible += 5 * weights.get(key, 1.0)
+    return max_possible
+
+
+def accumulate_totals(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Sum weighted criteria column by column.
+
+    ``values`` is ``tools x criteria``; ``weights`` is either a single weight
+    vector or a ``criteria x samples`` array, in which case the result is
+    ``tools x samples``. Accumulating in criteria order (instead of calling
+    ``values @ weights``) keeps the result bit-identical to the reference loop.
+    """
+
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.ndim == 1:
+        total = np.zeros(values.shape[0], dtype=np.float64)
+        for column in range(len(CRITERIA_KEYS)):
+            total += values[:, column] * weights[column]
+        return total
+
+    total = np.zeros((values.shape[0], weights.shape[1]), dtype=np.float64)
+    for column in range(len(CRITERIA_KEYS)):
+        total += values[:, column, None] * weights[column][None, :]
+    return total
+
+
+def round_scores(values: np.ndarray) -> np.ndarray:
+    """Element-wise equivalent of ``round(value, 2)``.
+
+    ``np.round`` works on the binary product ``value * 100`` and can disagree
+    with Python's correctly rounded ``round`` for values sitting on a decimal
+    half-way point, so those few elements are re-rounded in Python.
+    """
+
+    scaled = np.asarray(values, dtype=np.float64) * 100
+    rounded = np.rint(scaled) / 100
+    ambiguous = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if ambiguous.any():
+        flat_values = np.asarray(values, dtype=np.float64).reshape(-1)
+        flat_rounded = rounded.reshape(-1)
+        for index in np.flatnonzero(ambiguous.reshape(-1)).tolist():
+            flat_rounded[index] = round(float(flat_values[index]), 2)
+    return rounded
+
+
+def stable_ranking(rounded_totals: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+    """Return tool indices ordered by descending score, ties kept in catalogue order.
+
+    When ``limit`` is given only the best ``limit`` indices are returned; they
+    are selected with ``argpartition`` and only the winners are sorted.
+    """
+
+    count = rounded_totals.shape[0]
+    if limit is None or limit >= count:
+        return np.argsort(-rounded_totals, kind="stable")
+    if limit <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    threshold = -np.partition(-rounded_totals, limit - 1)[limit - 1]
+    above = np.flatnonzero(rounded_totals > threshold)
+    ties = np.flatnonzero(rounded_totals == threshold)[: limit - above.shape[0]]
+    candidates = np.concatenate([above, ties])
+    candidates.sort()
+    return candidates[np.argsort(-rounded_totals[candidates], kind="stable")]
+
+
+class ScoringMatrix:
+    """Answer-independent snapshot of the catalogue in matrix form."""
+
+    def __init__(
+        self,
+        tool_ids: Sequence[int],
+        tool_names: Sequence[str],
+        summaries: Sequence[str],
+        use_cases: Sequence[List[str]],
+        static_values: np.ndarray,
+        pricing_levels: np.ndarray,
+        team_skill_levels: np.ndarray,
+        languages: Sequence[frozenset],
+        language_overrides: np.ndarray,
+    ) -> None:
+        self.tool_ids = list(tool_ids)
+        self.tool_names = list(tool_names)
+        self.summaries = list(summaries)
+        self.use_cases = list(use_cases)
+        self.static_values = static_values
+        self.pricing_levels = pricing_levels
+        self.team_skill_levels = team_skill_levels
+        self.languages = list(languages)
+        self.language_overrides = language_overrides
+        self._known_languages = frozenset().union(*self.languages)
+        self._language_masks: Dict[str, np.ndarray] = {}
+        self._positions: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return self.static_values.shape[0]
+
+    @classmethod
+    def from_tools(cls, tools: Iterable[Any]) -> "ScoringMatrix":
+        """Compile tools (ORM objects or projected rows) into a matrix."""
+
+        tool_ids: List[int] = []
+        tool_names: List[str] = []
+        summaries: List[str] = []
+        use_cases: List[List[str]] = []
+        rows: List[List[float]] = []
+        pricing_levels: List[int] = []
+        team_skill_levels: List[int] = []
+        languages: List[frozenset] = []
+        language_overrides: List[float] = []
+
+        for tool in tools:
+            criteria_map = tool.criteria_scores or {}
+            maintenance_value = 6 - (tool.maintenance_effort or 3)
+
+            row = [0.0] * len(CRITERIA_KEYS)
+            row[CRITERIA_INDEX["ai_assistance"]] = scale_value(criteria_map.get("ai_assistance", tool.ai_capability))
+            row[CRITERIA_INDEX["reporting"]] = scale_value(criteria_map.get("reporting_quality", tool.reporting_quality))
+            row[CRITERIA_INDEX["maintenance"]] = scale_value(criteria_map.get("maintenance", maintenance_value))
+            row[CRITERIA_INDEX["execution"]] = scale_value(criteria_map.get("execution_speed", tool.execution_speed))
+            row[CRITERIA_INDEX["cross_browser"]] = scale_value(
+                criteria_map.get("cross_browser_support", 5 if tool.supports_cross_browser else 3)
+            )
+            row[CRITERIA_INDEX["ci_cd"]] = scale_value(criteria_map.get("ci_cd", 5 if tool.ci_cd_support else 3))
+            row[CRITERIA_INDEX["analytics"]] = scale_value(criteria_map.get("analytics_depth", tool.analytics_depth))
+            row[CRITERIA_INDEX["community"]] = scale_value(criteria_map.get("community_strength", tool.community_strength))
+
+            if "language_fit" in criteria_map:
+                language_overrides.append(scale_value(criteria_map["language_fit"]))
+            else:
+                language_overrides.append(np.nan)
+
+            tool_ids.append(tool.id)
+            tool_names.append(tool.name)
+            summaries.append(tool.summary or "")
+            use_cases.append((tool.additional_metadata or {}).get("best_for", []))
+            rows.append(row)
+            pricing_levels.append(BUDGET_TIERS.get(tool.pricing_tier, 3))
+            team_skill_levels.append(TOOL_SKILL_LEVELS.get(tool.recommended_team_skill.lower(), 3))
+            languages.append(frozenset(lang.lower() for lang in tool.languages_supported or []))
+
+        return cls(
+            tool_ids=tool_ids,
+            tool_names=tool_names,
+            summaries=summaries,
+            use_cases=use_cases,
+            static_values=np.array(rows, dtype=np.float64).reshape(len(rows), len(CRITERIA_KEYS)),
+            pricing_levels=np.array(pricing_levels, dtype=np.int64),
+            team_skill_levels=np.array(team_skill_levels, dtype=np.int64),
+            languages=languages,
+            language_overrides=np.array(language_overrides, dtype=np.float64),
+        )
+
+    def language_key(self, language: str) -> Optional[str]:
+        """Return ``language`` as far as scoring can tell it apart; ``None`` if no tool supports it.
+
+        Every language outside the catalogue yields the same column, so they
+        share one key and answers cannot grow per-language caches.
+        """
+
+        language = language.lower()
+        if language == "other" or language in self._known_languages:
+            return language
+        return None
+
+    def _language_mask(self, language: str) -> np.ndarray:
+        if language not in self._known_languages:
+            return np.zeros(len(self), dtype=bool)
+        mask = self._language_masks.get(language)
+        if mask is None:
+            mask = np.array([language in supported for supported in self.languages], dtype=bool)
+            self._language_masks[language] = mask
+        return mask
+
+    def catalogue_order(self, tool_ids: Sequence[int]) -> np.ndarray:
+        """Return the permutation putting ``tool_ids`` in catalogue order, the order ties are ranked in.
+
+        Tools no longer in the catalogue follow the others in their given order.
+        """
+
+        if self._positions is None:
+            self._positions = {tool_id: position for position, tool_id in enumerate(self.tool_ids)}
+        missing = len(self.tool_ids)
+        positions = np.array([self._positions.get(tool_id, missing) for tool_id in tool_ids], dtype=np.int64)
+        return np.argsort(positions, kind="stable")
+
+    def budget_column(self, budget: str) -> np.ndarray:
+        desired = BUDGET_TIERS.get(budget, 3)
+        return np.clip(5 - np.abs(desired - self.pricing_levels), 0, 5).astype(np.float64)
+
+    def team_skill_column(self, skill: str) -> np.ndarray:
+        desired = DESIRED_SKILL_LEVELS.get(skill.lower(), 3)
+        return np.clip(5 - np.abs(desired - self.team_skill_levels), 0, 5).astype(np.float64)
+
+    def language_column(self, language: str) -> np.ndarray:
+        language = language.lower()
+        if language == "other":
+            column = np.full(len(self), 3.0, dtype=np.float64)
+        else:
+            column = np.where(self._language_mask(language), 5.0, 2.5)
+        overridden = ~np.isnan(self.language_overrides)
+        column[overridden] = self.language_overrides[overridden]
+        return column
+
+    def answer_signature(self, answers: EvaluationAnswerSet) -> tuple:
+        """Return the parts of an answer set that the value matrix depends on."""
+
+        return (
+            BUDGET_TIERS.get(answers.budget, 3),
+            DESIRED_SKILL_LEVELS.get(answers.team_scripting_skill.lower(), 3),
+            self.language_key(answers.primary_language),
+        )
+
+    def criteria_values(self, answers: EvaluationAnswerSet) -> np.ndarray:
+        """Return the full ``tools x criteria`` value matrix for an answer set."""
+
+        values = self.static_values.copy()
+        values[:, BUDGET_COLUMN] = self.budget_column(answers.budget)
+        values[:, TEAM_SKILL_COLUMN] = self.team_skill_column(answers.team_scripting_skill)
+        values[:, LANGUAGE_COLUMN] = self.language_column(answers.primary_language)
+        return values
+
+    def score(self, answers: EvaluationAnswerSet, weights: Dict[str, float]) -> "MatrixScores":
+        """Score every tool for an answer set and weight profile."""
+
+        values = self.criteria_values(answers)
+        totals = accumulate_totals(values, weight_vector(weights))
+        return MatrixScores(self, values, totals, max_possible_score(weights))
+
+    def score_batch(
+        self,
+        answer_sets: Sequence[EvaluationAnswerSet],
+        weight_profiles: Sequence[Dict[str, float]],
+    ) -> Iterator["MatrixScores"]:
+        """Score many answer sets together, yielding results in input order.
+
+        Totals for a chunk of answer sets are accumulated as one
+        ``tools x answers`` array; the per-answer value matrices are only
+        materialised while their result is being consumed.
+        """
+
+        for start in range(0, len(answer_sets), BATCH_CHUNK_SIZE):
+            answers_chunk = answer_sets[start : start + BATCH_CHUNK_SIZE]
+            weights_chunk = weight_profiles[start : start + BATCH_CHUNK_SIZE]
+
+            dynamic = self.dynamic_columns(answers_chunk)
+            totals = self.batch_totals(dynamic, np.stack([weight_vector(profile) for profile in weights_chunk], axis=1))
+            yield from self.batch_scores(dynamic, weights_chunk, totals, round_scores(totals))
+
+    def dynamic_columns(self, answer_sets: Sequence[EvaluationAnswerSet]) -> Dict[int, np.ndarray]:
+        """Return the answer-dependent columns of many answer sets as ``tools x answers`` arrays."""
+
+        return {
+            BUDGET_COLUMN: np.stack([self.budget_column(item.budget) for item in answer_sets], axis=1),
+            TEAM_SKILL_COLUMN: np.stack(
+                [self.team_skill_column(item.team_scripting_skill) for item in answer_sets], axis=1
+            ),
+            LANGUAGE_COLUMN: np.stack([self.language_column(item.primary_language) for item in answer_sets], axis=1),
+        }
+
+    def batch_totals(self, dynamic: Dict[int, np.ndarray], weights: np.ndarray) -> np.ndarray:
+        """Accumulate ``tools x answers`` totals for ``criteria x answers`` weights, column by column."""
+
+        totals = np.zeros((len(self), weights.shape[1]), dtype=np.float64)
+        for column in range(len(CRITERIA_KEYS)):
+            source = dynamic.get(column)
+            if source is None:
+                source = self.static_values[:, column, None]
+            totals += source * weights[column][None, :]
+        return totals
+
+    def batch_scores(
+        self,
+        dynamic: Dict[int, np.ndarray],
+        weight_profiles: Sequence[Dict[str, float]],
+        totals: np.ndarray,
+        rounded: np.ndarray,
+    ) -> Iterator["MatrixScores"]:
+        """Wrap ``batch_totals`` output per answer set, materialising each value matrix lazily."""
+
+        for offset, profile in enumerate(weight_profiles):
+            values = self.static_values.copy()
+            for column, source in dynamic.items():
+                values[:, column] = source[:, offset]
+            yield MatrixScores(self, values, totals[:, offset], max_possible_score(profile), rounded[:, offset])
+
+    def rank_batch(
+        self,
+        answer_sets: Sequence[EvaluationAnswerSet],
+        weights: np.ndarray,
+        max_possible: np.ndarray,
+        rows: int,
+    ) -> Dict[str, np.ndarray]:
+        """Score and rank answer sets, keeping the best ``rows`` tools of each in rank order.
+
+        ``order``, ``totals`` (rounded) and ``normalized`` are ``rows x answers``
+        arrays and ``values`` is ``answers x rows x criteria``; together they
+        are everything ``RankedScores`` needs.
+        """
+
+        dynamic = self.dynamic_columns(answer_sets)
+        totals = self.batch_totals(dynamic, weights)
+        rounded = round_scores(totals)
+
+        count = len(answer_sets)
+        ranked = {
+            "order": np.empty((rows, count), dtype=np.int64),
+            "totals": np.empty((rows, count), dtype=np.float64),
+            "normalized": np.zeros((rows, count), dtype=np.float64),
+            "values": np.empty((count, rows, len(CRITERIA_KEYS)), dtype=np.float64),
+        }
+        for offset in range(count):
+            order = stable_ranking(rounded[:, offset], rows)
+            ranked["order"][:, offset] = order
+            ranked["totals"][:, offset] = rounded[order, offset]
+            if max_possible[offset]:
+                ranked["normalized"][:, offset] = round_scores((totals[order, offset] / max_possible[offset]) * 100)
+            values = ranked["values"][offset]
+            values[...] = self.static_values[order]
+            for column, source in dynamic.items():
+                values[:, column] = source[order, offset]
+        return ranked
+
+
+def tool_breakdown(
+    matrix: ScoringMatrix, index: int, rank: int, values: List[float], total: float, normalized: float
+) -> ToolScoreBreakdown:
+    """Build the breakdown of tool ``index``.
+
+    The nested criteria are passed as plain dicts so the whole breakdown is
+    built in one validation call rather than twelve.
+    """
+
+    return ToolScoreBreakdown.model_validate(
+        {
+            "tool_id": matrix.tool_ids[index],
+            "tool_name": matrix.tool_names[index],
+            "total_score": total,
+            "normalized_score": normalized,
+            "rank": rank,
+            "criteria": {
+                key: {"value": values[column], "rationale": CRITERIA_RATIONALES[key]}
+                for column, key in enumerate(CRITERIA_KEYS)
+            },
+            "summary": matrix.summaries[index],
+            "recommended_use_cases": matrix.use_cases[index],
+        }
+    )
+
+
+class MatrixScores:
+    """Scores of one answer set; breakdown objects are built on demand."""
+
+    def __init__(
+        self,
+        matrix: ScoringMatrix,
+        values: np.ndarray,
+        totals: np.ndarray,
+        max_possible: float,
+        rounded_totals: Optional[np.ndarray] = None,
+    ) -> None:
+        self.matrix = matrix
+        self.values = values
+        self.totals = totals
+        self.max_possible = max_possible
+        self.rounded_totals = round_scores(totals) if rounded_totals is None else rounded_totals
+
+    def ranking(self, limit: Optional[int] = None) -> np.ndarray:
+        return stable_ranking(self.rounded_totals, limit)
+
+    def normalized(self, index: int) -> float:
+        if not self.max_possible:
+            return 0.0
+        return round((float(self.totals[index]) / self.max_possible) * 100, 2)
+
+    def normalized_scores(self) -> np.ndarray:
+        if not self.max_possible:
+            return np.zeros_like(self.totals)
+        return round_scores((self.totals / self.max_possible) * 100)
+
+    def breakdown(self, index: int, rank: int) -> ToolScoreBreakdown:
+        total = float(self.rounded_totals[index])
+        return tool_breakdown(self.matrix, index, rank, self.values[index].tolist(), total, self.normalized(index))
+
+    def breakdowns(self, limit: Optional[int] = None) -> List[ToolScoreBreakdown]:
+        """Return ranked breakdowns, built only for the returned tools."""
+
+        return [self.breakdown(int(index), rank) for rank, index in enumerate(self.ranking(limit), start=1)]
+
+    def aggregates(self) -> List[Dict[str, Any]]:
+        """Return rank and totals of every tool without building breakdowns."""
+
+        order = self.ranking().tolist()
+        totals = self.rounded_totals.tolist()
+        normalized = self.normalized_scores().tolist()
+        return [
+            {
+                "tool_id": self.matrix.tool_ids[index],
+                "tool_name": self.matrix.tool_names[index],
+                "total_score": totals[index],
+                "normalized_score": normalized[index],
+                "rank": rank,
+            }
+            for rank, index in enumerate(order, start=1)
+        ]
+
+
+class RankedScores:
+    """The ranked head of one answer set's scores, as arrays in rank order.
+
+    Built from ``ScoringMatrix.rank_batch`` output by the process scoring
+    backend. It offers the parts of ``MatrixScores`` that result payloads use.
+    The full value matrix, needed only for Pareto fronts, is rebuilt on demand.
+    """
+
+    def __init__(
+        self,
+        matrix: ScoringMatrix,
+        answers: EvaluationAnswerSet,
+        order: np.ndarray,
+        totals: np.ndarray,
+        normalized: np.ndarray,
+        ranked_values: np.ndarray,
+    ) -> None:
+        self.matrix = matrix
+        self.answers = answers
+        self.order = order
+        self.totals = totals
+        self.normalized = normalized
+        self.ranked_values = ranked_values
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.matrix.criteria_values(self.answers)
+
+    def _depth(self, limit: Optional[int]) -> int:
+        depth = len(self.matrix) if limit is None else min(limit, len(self.matrix))
+        if depth > self.order.shape[0]:
+            raise ValueError(f"Only the best {self.order.shape[0]} tools were ranked")
+        return depth
+
+    def breakdowns(self, limit: Optional[int] = None) -> List[ToolScoreBreakdown]:
+        depth = self._depth(limit)
+        order = self.order[:depth].tolist()
+        totals = self.totals[:depth].tolist()
+        normalized = self.normalized[:depth].tolist()
+        values = self.ranked_values[:depth].tolist()
+        return [
+            tool_breakdown(self.matrix, index, position + 1, values[position], totals[position], normalized[position])
+            for position, index in enumerate(order)
+        ]
+
+    def aggregates(self) -> List[Dict[str, Any]]:
+        depth = self._depth(None)
+        totals = self.totals[:depth].tolist()
+        normalized = self.normalized[:depth].tolist()
+        return [
+            {
+                "tool_id": self.matrix.tool_ids[index],
+                "tool_name": self.matrix.tool_names[index],
+                "total_score": totals[position],
+                "normalized_score": normalized[position],
+                "rank": position + 1,
+            }
+            for position, index in enumerate(self.order[:depth].tolist())
+        ]
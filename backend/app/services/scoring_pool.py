@@ -0,0 +1,374 @@
+"""Optional multi-process backend for batch scoring.
+
+With ``scoring_backend = "process"`` large batches are scored and ranked in
+a ``ProcessPoolExecutor``. Each worker runs the whole numeric pipeline for
+its share of the answer sets: value columns, weighted totals and rounding,
+the ranking and normalised scores, and the criteria values of the ranked
+tools. The compiled catalogue arrays are published once per catalogue in a
+``multiprocessing.shared_memory`` segment that the workers map instead of
+receiving a pickled copy with every task, and workers write their results
+into a shared output block. The caller only wraps the ranked rows it needs
+in ``RankedScores``, so results match the in-process path exactly.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.schemas.evaluation import EvaluationAnswerSet
+from app.services.scoring_matrix import (
+    BATCH_CHUNK_SIZE,
+    CRITERIA_KEYS,
+    MatrixScores,
+    RankedScores,
+    ScoringMatrix,
+    max_possible_score,
+    weight_vector,
+)
+
+
+SCORING_BACKENDS = ("inline", "process")
+
+# Upper bound on the ranked criteria values one chunk returns (32 MB of floats).
+PROCESS_CHUNK_VALUES = 4_000_000
+
+# (name, dtype, shape, byte offset) of each array in a shared segment.
+Layout = List[Tuple[str, str, Tuple[int, ...], int]]
+
+
+def _layout(specs: Sequence[Tuple[str, np.dtype, Tuple[int, ...]]]) -> Tuple[Layout, int]:
+    layout: Layout = []
+    offset = 0
+    for name, dtype, shape in specs:
+        dtype = np.dtype(dtype)
+        layout.append((name, dtype.str, tuple(shape), offset))
+        # Keep every array 8-byte aligned.
+        offset += -(-int(np.prod(shape, dtype=np.int64)) * dtype.itemsize // 8) * 8
+    return layout, max(offset, 1)
+
+
+def _views(buffer: Any, layout: Layout) -> Dict[str, np.ndarray]:
+    return {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=buffer, offset=offset)
+        for name, dtype, shape, offset in layout
+    }
+
+
+class SharedCatalogue:
+    """The numeric arrays of a ``ScoringMatrix`` published in one shared memory segment.
+
+    ``users`` counts the ``rank_batch`` calls submitting work against the
+    segment; a retired segment is unlinked once the last of them is done.
+    """
+
+    def __init__(self, matrix: ScoringMatrix) -> None:
+        languages = sorted(set().union(*matrix.languages))
+        membership = np.zeros((len(matrix), len(languages)), dtype=bool)
+        for column, language in enumerate(languages):
+            membership[:, column] = matrix._language_mask(language)
+
+        arrays = {
+            "static_values": matrix.static_values,
+            "pricing_levels": matrix.pricing_levels,
+            "team_skill_levels": matrix.team_skill_levels,
+            "language_overrides": matrix.language_overrides,
+            "language_membership": membership,
+        }
+        layout, size = _layout([(name, array.dtype, array.shape) for name, array in arrays.items()])
+        self.shm = SharedMemory(create=True, size=size)
+        views = _views(self.shm.buf, layout)
+        for name, array in arrays.items():
+            views[name][...] = array
+        del views
+        self.descriptor = {"name": self.shm.name, "layout": layout, "languages": languages}
+        self.users = 0
+        self.retired = False
+
+    def release(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+
+class _SharedMatrix(ScoringMatrix):
+    """Worker-side matrix over the shared arrays, enough for ``batch_totals``."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], languages: Sequence[str]) -> None:
+        super().__init__(
+            tool_ids=[],
+            tool_names=[],
+            summaries=[],
+            use_cases=[],
+            static_values=arrays["static_values"],
+            pricing_levels=arrays["pricing_levels"],
+            team_skill_levels=arrays["team_skill_levels"],
+            languages=[],
+            language_overrides=arrays["language_overrides"],
+        )
+        self._membership = arrays["language_membership"]
+        self._language_columns = {language: column for column, language in enumerate(languages)}
+
+    def _language_mask(self, language: str) -> np.ndarray:
+        column = self._language_columns.get(language)
+        if column is None:
+            return np.zeros(len(self), dtype=bool)
+        return self._membership[:, column]
+
+
+# Per worker process: the attached catalogue segment and the matrix over it.
+_worker_catalogue: Optional[Tuple[str, SharedMemory, _SharedMatrix]] = None
+
+
+def _attach(descriptor: Dict[str, Any]) -> _SharedMatrix:
+    global _worker_catalogue
+
+    if _worker_catalogue is None or _worker_catalogue[0] != descriptor["name"]:
+        if _worker_catalogue is not None:
+            previous = _worker_catalogue[1]
+            _worker_catalogue = None
+            previous.close()
+        shm = SharedMemory(name=descriptor["name"])
+        matrix = _SharedMatrix(_views(shm.buf, descriptor["layout"]), descriptor["languages"])
+        _worker_catalogue = (descriptor["name"], shm, matrix)
+    return _worker_catalogue[2]
+
+
+def _ranked_layout(rows: int, count: int) -> Tuple[Layout, int]:
+    return _layout(
+        [
+            ("order", np.int64, (rows, count)),
+            ("totals", np.float64, (rows, count)),
+            ("normalized", np.float64, (rows, count)),
+            ("values", np.float64, (count, rows, len(CRITERIA_KEYS))),
+        ]
+    )
+
+
+def _rank_chunk(
+    catalogue: Dict[str, Any],
+    output: Dict[str, Any],
+    answer_sets: Sequence[EvaluationAnswerSet],
+    weights: np.ndarray,
+    max_possible: np.ndarray,
+) -> int:
+    """Worker task: rank a chunk of answer sets into the output block and return the worker's pid."""
+
+    matrix = _attach(catalogue)
+    ranked = matrix.rank_batch(answer_sets, weights, max_possible, output["rows"])
+    shm = SharedMemory(name=output["name"])
+    try:
+        views = _views(shm.buf, output["layout"])
+        for name in views:
+            views[name][...] = ranked[name]
+        del views
+    finally:
+        shm.close()
+    return os.getpid()
+
+
+class _PendingChunk:
+    """A chunk submitted to a worker and the shared block it writes into."""
+
+    def __init__(self, start: int, shm: SharedMemory, layout: Layout, future: Future) -> None:
+        self.start = start
+        self.shm = shm
+        self.layout = layout
+        self.future = future
+        self.worker: Optional[int] = None
+
+    def collect(self) -> Dict[str, np.ndarray]:
+        try:
+            self.worker = self.future.result()
+            views = _views(self.shm.buf, self.layout)
+            ranked = {name: view.copy() for name, view in views.items()}
+            del views
+            return ranked
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        self.future.cancel()
+        self.shm.close()
+        self.shm.unlink()
+
+
+class ProcessScoringBackend:
+    """Scores and ranks batches in worker processes sharing the compiled catalogue."""
+
+    def __init__(self, processes: int) -> None:
+        self.processes = processes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._published: Optional[Tuple[ScoringMatrix, SharedCatalogue]] = None
+        self._lock = threading.Lock()
+
+    def _acquire(self, matrix: ScoringMatrix) -> Tuple[SharedCatalogue, ProcessPoolExecutor]:
+        """Return the segment published for ``matrix`` and the pool, registering the caller as a user."""
+
+        with self._lock:
+            if self._published is None or self._published[0] is not matrix:
+                if self._published is not None:
+                    self._retire(self._published[1])
+                self._published = (matrix, SharedCatalogue(matrix))
+            if self._executor is None:
+                # Workers are spawned rather than forked from a threaded server.
+                self._executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=get_context("spawn"))
+            catalogue = self._published[1]
+            catalogue.users += 1
+            return catalogue, self._executor
+
+    def _release(self, catalogue: SharedCatalogue) -> None:
+        with self._lock:
+            catalogue.users -= 1
+            if catalogue.retired and not catalogue.users:
+                catalogue.release()
+
+    @staticmethod
+    def _retire(catalogue: SharedCatalogue) -> None:
+        # Workers may still attach to a segment other batches are using, so
+        # it is only unlinked once its last user is done.
+        catalogue.retired = True
+        if not catalogue.users:
+            catalogue.release()
+
+    @staticmethod
+    def _submit(
+        executor: ProcessPoolExecutor,
+        catalogue: SharedCatalogue,
+        start: int,
+        rows: int,
+        answer_sets: Sequence[EvaluationAnswerSet],
+        weight_profiles: Sequence[Dict[str, float]],
+    ) -> _PendingChunk:
+        weights = np.stack([weight_vector(profile) for profile in weight_profiles], axis=1)
+        max_possible = np.array([max_possible_score(profile) for profile in weight_profiles], dtype=np.float64)
+        layout, size = _ranked_layout(rows, len(answer_sets))
+        shm = SharedMemory(create=True, size=size)
+        output = {"name": shm.name, "layout": layout, "rows": rows}
+        try:
+            future = executor.submit(_rank_chunk, catalogue.descriptor, output, answer_sets, weights, max_possible)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return _PendingChunk(start, shm, layout, future)
+
+    def chunk_size(self, count: int, rows: int) -> int:
+        """Answer sets per task: enough tasks to occupy every worker, within the memory bound."""
+
+        per_worker = math.ceil(count / self.processes)
+        memory_bound = PROCESS_CHUNK_VALUES // max(rows * len(CRITERIA_KEYS), 1)
+        return max(1, min(per_worker, BATCH_CHUNK_SIZE, memory_bound))
+
+    def rank_batch(
+        self,
+        matrix: ScoringMatrix,
+        answer_sets: Sequence[EvaluationAnswerSet],
+        weight_profiles: Sequence[Dict[str, float]],
+        depths: Sequence[Optional[int]],
+    ) -> Iterator[RankedScores]:
+        """Rank each answer set to its ``depth`` best tools (``None`` for all), in input order.
+
+        The batch is split into chunks of at most ``chunk_size`` answer sets,
+        one worker task each, and one chunk more than there are workers is
+        kept in flight: workers compute values, totals, rankings and
+        normalised scores while the caller wraps the chunk at the head.
+        """
+
+        tools = len(matrix)
+        rows = tools if None in depths else min(max(depths, default=0), tools)
+        chunk_size = self.chunk_size(len(answer_sets), rows)
+        starts = iter(range(0, len(answer_sets), chunk_size))
+        in_flight: Deque[_PendingChunk] = deque()
+
+        catalogue, executor = self._acquire(matrix)
+
+        def top_up() -> None:
+            while len(in_flight) <= self.processes:
+                start = next(starts, None)
+                if start is None:
+                    return
+                end = start + chunk_size
+                in_flight.append(
+                    self._submit(executor, catalogue, start, rows, answer_sets[start:end], weight_profiles[start:end])
+                )
+
+        try:
+            top_up()
+            while in_flight:
+                chunk = in_flight.popleft()
+                ranked = chunk.collect()
+                top_up()
+                for offset, answers in enumerate(answer_sets[chunk.start : chunk.start + chunk_size]):
+                    yield RankedScores(
+                        matrix,
+                        answers,
+                        ranked["order"][:, offset],
+                        ranked["totals"][:, offset],
+                        ranked["normalized"][:, offset],
+                        ranked["values"][offset],
+                    )
+        finally:
+            for chunk in in_flight:
+                chunk.release()
+            self._release(catalogue)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+            if self._published is not None:
+                self._retire(self._published[1])
+                self._published = None
+
+
+_process_backend: Optional[ProcessScoringBackend] = None
+_backend_lock = threading.Lock()
+
+
+def process_backend() -> ProcessScoringBackend:
+    global _process_backend
+
+    with _backend_lock:
+        if _process_backend is None:
+            _process_backend = ProcessScoringBackend(get_settings().scoring_processes or os.cpu_count() or 1)
+        return _process_backend
+
+
+def score_batch(
+    matrix: ScoringMatrix,
+    answer_sets: Sequence[EvaluationAnswerSet],
+    weight_profiles: Sequence[Dict[str, float]],
+    depths: Sequence[Optional[int]],
+) -> Iterator[Union[MatrixScores, RankedScores]]:
+    """Score a batch with the configured backend, yielding results in input order.
+
+    ``depths`` gives how many ranked tools each result must offer (``None`` for
+    all). Batches under ``scoring_process_min_cells`` answer-tool pairs stay
+    in-process, where they finish faster than a round trip to the workers.
+    """
+
+    settings = get_settings()
+    if settings.scoring_backend not in SCORING_BACKENDS:
+        raise ValueError(f"Unknown scoring backend '{settings.scoring_backend}'")
+    if settings.scoring_backend == "inline" or len(answer_sets) * len(matrix) < settings.scoring_process_min_cells:
+        return matrix.score_batch(answer_sets, weight_profiles)
+    return process_backend().rank_batch(matrix, answer_sets, weight_profiles, depths)
+
+
+def shutdown_scoring_backend() -> None:
+    global _process_backend
+
+    with _backend_lock:
+        if _process_backend is not None:
+            _process_backend.close()
+            _process_backend = None
@@ -0,0 +1,216 @@
+"""Analytic weight-sensitivity analysis for evaluation rankings.
+
+Totals are linear in each weight: with every other weight fixed, a tool's
+total is ``intercept + value * weight``. The engine ranks totals rounded to
+cents, so the leading ranking can only change where one of these lines
+crosses a rounding boundary while it is within a cent of another. The stable
+interval and every breakpoint of a criterion follow from those weights
+instead of re-scoring the catalogue over a grid of weights.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from app.services.scoring_matrix import CRITERIA_KEYS, accumulate_totals, round_scores, stable_ranking, weight_vector
+
+
+# Guard against pathological inputs; each step passes at least one rounding boundary.
+MAX_SWEEP_STEPS = 10_000
+
+# Totals are ranked after rounding to cents, so two tools can only compare
+# differently from their exact totals while those are within one step.
+ROUNDING_STEP = 0.01
+ORDER_WINDOW = ROUNDING_STEP * (1 + 1e-6)
+
+
+def _leading(totals: np.ndarray, depth: int) -> List[int]:
+    """Return the ``depth`` best indices as the engine ranks them: rounded totals, ties in given order."""
+
+    # Only totals within a rounding step of the ``depth``-th best can reach the top once rounded.
+    near = np.arange(totals.shape[0])
+    if 0 < depth < totals.shape[0]:
+        near = np.flatnonzero(totals >= np.partition(totals, -depth)[-depth] - ORDER_WINDOW)
+    return near[stable_ranking(round_scores(totals[near]), depth)].tolist()
+
+
+def _probe(weight: float, direction: int) -> float:
+    return weight + direction * 1e-9 * max(1.0, abs(weight))
+
+
+def _next_boundary(intercepts: np.ndarray, slopes: np.ndarray, start: np.ndarray, direction: int) -> np.ndarray:
+    """Return the first weight past ``start`` where each line's total crosses a rounding boundary."""
+
+    heading = slopes * direction
+    scaled = (intercepts + slopes * start) * 100
+    level = np.where(heading > 0, np.floor(scaled + 0.5) + 0.5, np.ceil(scaled - 0.5) - 0.5) / 100
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = (level - intercepts) / slopes
+        # Floating point error can put the boundary just behind the start; take the next one then.
+        behind = (weight - start) * direction <= 0
+        weight = np.where(behind, (level + np.sign(heading) * ROUNDING_STEP - intercepts) / slopes, weight)
+    return np.where(heading != 0, weight, direction * np.inf)
+
+
+def _contenders(intercepts: np.ndarray, slopes: np.ndarray, span: Sequence[float], depth: int) -> np.ndarray:
+    """Return the tools whose total comes within a rounding step of the leading ``depth`` somewhere in ``span``.
+
+    Each total is linear in the weight, so its extremes are at the ends of the
+    span, and the ``depth``-th best total never drops below the ``depth``-th
+    largest of the minima. Indices stay in ascending order.
+    """
+
+    if not depth:
+        return np.arange(intercepts.shape[0])
+    ends = intercepts[:, None] + slopes[:, None] * np.array(span, dtype=np.float64)[None, :]
+    floor = np.partition(ends.min(axis=1), -depth)[-depth]
+    return np.flatnonzero(ends.max(axis=1) >= floor - ORDER_WINDOW)
+
+
+def _sweep(
+    intercepts: np.ndarray,
+    slopes: np.ndarray,
+    start: float,
+    leading: List[int],
+    direction: int,
+    bound: float,
+    depth: int,
+) -> List[Dict[str, Any]]:
+    """Walk from ``start`` towards ``bound`` and record every change of the leading ranking.
+
+    The rounded ranking only changes where the total of a leading tool, or of
+    a tool within one rounding step of it, crosses a rounding boundary; the
+    sweep visits those weights in order and re-ranks just past each one.
+    """
+
+    breakpoints: List[Dict[str, Any]] = []
+    weight = start
+
+    for _ in range(MAX_SWEEP_STEPS):
+        if not leading:
+            break
+        members = np.array(leading)
+        intercept_gap = intercepts[members, None] - intercepts[None, :]
+        slope_gap = np.broadcast_to(slopes[members, None] - slopes[None, :], intercept_gap.shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            edges = (np.array([-ORDER_WINDOW, ORDER_WINDOW])[:, None, None] - intercept_gap) / slope_gap
+        parallel = slope_gap == 0
+        close = np.abs(intercept_gap) <= ORDER_WINDOW
+        lower = np.where(parallel, np.where(close, -np.inf, np.inf), edges.min(axis=0))
+        upper = np.where(parallel, np.where(close, np.inf, -np.inf), edges.max(axis=0))
+        if direction > 0:
+            window_start, window_end = np.maximum(lower, weight), np.minimum(upper, bound)
+        else:
+            window_start, window_end = np.minimum(upper, weight), np.maximum(lower, bound)
+
+        # Identical lines (a tool paired with itself, or duplicates) always tie.
+        relevant = (window_end - window_start) * direction > 0
+        relevant &= ~(parallel & (np.abs(intercept_gap) < 1e-12))
+        if not relevant.any():
+            break
+
+        window_start, window_end = window_start[relevant], window_end[relevant]
+        rows, columns = np.nonzero(relevant)
+        crossings = _next_boundary(intercepts[members[rows]], slopes[members[rows]], window_start, direction)
+        crossings = np.stack(
+            [crossings, _next_boundary(intercepts[columns], slopes[columns], window_start, direction)]
+        )
+        crossings = crossings.min(axis=0) if direction > 0 else crossings.max(axis=0)
+        crossings = crossings[(window_end - crossings) * direction >= 0]
+        if crossings.size == 0:
+            break
+
+        weight = float(crossings.min() if direction > 0 else crossings.max())
+        updated = _leading(intercepts + slopes * _probe(weight, direction), depth)
+        if updated != leading:
+            breakpoints.append({"weight": weight, "direction": direction, "before": leading, "after": updated})
+            leading = updated
+
+    return breakpoints
+
+
+def analyse_sensitivity(
+    tool_ids: Sequence[int],
+    values: np.ndarray,
+    weights: Dict[str, float],
+    min_weight: float = 0.1,
+    max_weight: float = 5.0,
+    depth: int = 3,
+) -> Dict[str, Any]:
+    """Return, per criterion, the weight interval keeping the leading ranking stable.
+
+    ``values`` is the ``tools x criteria`` matrix aligned with ``tool_ids``,
+    which should be in catalogue order. Rankings are compared the way the
+    engine ranks: on totals rounded to cents, ties kept in the given order.
+    """
+
+    depth = min(depth, len(tool_ids))
+    vector = weight_vector(weights)
+    totals = accumulate_totals(values, vector)
+    current = _leading(totals, depth)
+
+    report: List[Dict[str, Any]] = []
+    for column, key in enumerate(CRITERIA_KEYS):
+        slopes = values[:, column]
+        current_weight = float(vector[column])
+        intercepts = totals - slopes * current_weight
+
+        # The sweep only needs the tools that can reach the leading ranking in range.
+        span = (min(min_weight, current_weight), max(max_weight, current_weight))
+        contenders = _contenders(intercepts, slopes, span, depth)
+        intercepts, slopes = intercepts[contenders], slopes[contenders]
+        ids = [tool_ids[index] for index in contenders.tolist()]
+        leading_now = np.searchsorted(contenders, current).tolist()
+
+        breakpoints: List[Dict[str, Any]] = []
+        for direction, bound in ((-1, min_weight), (1, max_weight)):
+            leading = leading_now
+            if depth:
+                nudged = _leading(intercepts + slopes * _probe(current_weight, direction), depth)
+                if nudged != leading_now:
+                    breakpoints.append(
+                        {"weight": current_weight, "direction": direction, "before": leading_now, "after": nudged}
+                    )
+                    leading = nudged
+            breakpoints.extend(_sweep(intercepts, slopes, current_weight, leading, direction, bound, depth))
+
+        lower = max((item["weight"] for item in breakpoints if item["direction"] < 0), default=min_weight)
+        upper = min((item["weight"] for item in breakpoints if item["direction"] > 0), default=max_weight)
+
+        entries: List[Dict[str, Any]] = []
+        for item in sorted(breakpoints, key=lambda entry: entry["weight"]):
+            # Sweeps record rankings in travel direction; report them low -> high.
+            if item["direction"] < 0:
+                below, above = item["after"], item["before"]
+            else:
+                below, above = item["before"], item["after"]
+            entries.append(
+                {
+                    "weight": round(item["weight"], 6),
+                    "ranking_below": [ids[index] for index in below],
+                    "ranking_above": [ids[index] for index in above],
+                    "swapped_tool_ids": sorted(
+                        {ids[index] for index in set(below) ^ set(above)}
+                        | {ids[index] for index, other in zip(below, above) if index != other}
+                    ),
+                }
+            )
+
+        report.append(
+            {
+                "criterion": key,
+                "current_weight": current_weight,
+                "stable_min": round(lower, 6),
+                "stable_max": round(upper, 6),
+                "breakpoints": entries,
+            }
+        )
+
+    return {
+        "top_tool_ids": [tool_ids[index] for index in current],
+        "min_weight": min_weight,
+        "max_weight": max_weight,
+        "criteria": report,
+    }
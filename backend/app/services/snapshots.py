@@ -0,0 +1,206 @@
+"""Compact storage format for evaluation ``results_snapshot`` columns.
+
+Format 2 stores scored tools column-wise: one criteria-value array per tool,
+rationales as references into a per-snapshot string table, and the columnar
+body optionally compressed into a base64 blob. Snapshots written before the
+format existed (plain ``EvaluationResultPayload`` dumps) carry no ``format``
+key and are read unchanged.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import zlib
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.schemas.evaluation import EvaluationResultPayload
+from app.services.scoring_matrix import CRITERIA_KEYS
+
+try:  # optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+
+SNAPSHOT_FORMAT = 2
+CODECS = ("none", "zlib", "zstd")
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Snapshot is zstd-compressed but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def _resolve_codec(codec: str) -> str:
+    if codec not in CODECS:
+        raise ValueError(f"Unknown snapshot codec '{codec}'")
+    if codec == "zstd" and zstandard is None:
+        return "zlib"
+    return codec
+
+
+def _columnar(payload: EvaluationResultPayload) -> Dict[str, Any]:
+    rationales: List[str] = []
+    rationale_index: Dict[str, int] = {}
+    refs: List[List[int]] = []
+    values: List[List[float]] = []
+
+    for tool in payload.scored_tools:
+        tool_refs: List[int] = []
+        tool_values: List[float] = []
+        for key in CRITERIA_KEYS:
+            criterion = tool.criteria[key]
+            if criterion.rationale not in rationale_index:
+                rationale_index[criterion.rationale] = len(rationales)
+                rationales.append(criterion.rationale)
+            tool_refs.append(rationale_index[criterion.rationale])
+            tool_values.append(criterion.value)
+        refs.append(tool_refs)
+        values.append(tool_values)
+
+    # Rationales are normally the same for every tool; store one row then.
+    shared_refs = refs[0] if refs and all(row == refs[0] for row in refs) else None
+
+    tools = payload.scored_tools
+    return {
+        "default_weights": payload.default_weights,
+        "criteria": CRITERIA_KEYS,
+        "rationales": rationales,
+        "rationale_refs": shared_refs if shared_refs is not None else refs,
+        "shared_rationales": shared_refs is not None,
+        "tools": {
+            "tool_id": [tool.tool_id for tool in tools],
+            "tool_name": [tool.tool_name for tool in tools],
+            "total_score": [tool.total_score for tool in tools],
+            "normalized_score": [tool.normalized_score for tool in tools],
+            "rank": [tool.rank for tool in tools],
+            "values": values,
+            "summary": [tool.summary for tool in tools],
+            "recommended_use_cases": [tool.recommended_use_cases for tool in tools],
+        },
+        "recommended_tool_ids": payload.recommended_tool_ids,
+        "radar_categories": payload.radar_categories,
+        "bar_chart_data": payload.bar_chart_data,
+    }
+
+
+def encode_snapshot(payload: EvaluationResultPayload, codec: str | None = None) -> Dict[str, Any]:
+    """Return the stored representation of an engine result."""
+
+    codec = _resolve_codec(codec or get_settings().snapshot_codec)
+    body = _columnar(payload)
+    if codec == "none":
+        return {"format": SNAPSHOT_FORMAT, "codec": codec, "body": body}
+
+    raw = json.dumps(body, separators=(",", ":")).encode("utf-8")
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "codec": codec,
+        "data": base64.b64encode(_compress(raw, codec)).decode("ascii"),
+    }
+
+
+def _body(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    if snapshot.get("codec", "none") == "none":
+        return snapshot["body"]
+    raw = _decompress(base64.b64decode(snapshot["data"]), snapshot["codec"])
+    return json.loads(raw)
+
+
+def decode_snapshot(snapshot: Dict[str, Any] | None) -> Dict[str, Any]:
+    """Rehydrate a stored snapshot into the ``EvaluationResultPayload`` shape."""
+
+    snapshot = snapshot or {}
+    if "format" not in snapshot:
+        return snapshot
+
+    body = _body(snapshot)
+    tools = body["tools"]
+    criteria = body["criteria"]
+    rationales = body["rationales"]
+    refs = body["rationale_refs"]
+
+    scored_tools = []
+    for position, tool_id in enumerate(tools["tool_id"]):
+        tool_refs = refs if body["shared_rationales"] else refs[position]
+        scored_tools.append(
+            {
+                "tool_id": tool_id,
+                "tool_name": tools["tool_name"][position],
+                "total_score": tools["total_score"][position],
+                "normalized_score": tools["normalized_score"][position],
+                "rank": tools["rank"][position],
+                "criteria": {
+                    key: {"value": value, "rationale": rationales[ref]}
+                    for key, value, ref in zip(criteria, tools["values"][position], tool_refs)
+                },
+                "summary": tools["summary"][position],
+                "recommended_use_cases": tools["recommended_use_cases"][position],
+            }
+        )
+
+    return {
+        "default_weights": body["default_weights"],
+        "scored_tools": scored_tools,
+        "recommended_tool_ids": body["recommended_tool_ids"],
+        "radar_categories": body["radar_categories"],
+        "bar_chart_data": body["bar_chart_data"],
+    }
+
+
+def _tool_columns(snapshot: Dict[str, Any] | None) -> Dict[str, Any]:
+    """Return stored per-tool columns with ``values`` as a ``tools x criteria`` matrix.
+
+    Format 2 snapshots are read straight from their value arrays without
+    rebuilding the per-tool dictionaries.
+    """
+
+    snapshot = snapshot or {}
+    if "format" in snapshot:
+        tools = _body(snapshot)
+        criteria = tools["criteria"]
+        tools = tools["tools"]
+        columns = [criteria.index(key) for key in CRITERIA_KEYS]
+        values = np.array(tools["values"], dtype=np.float64).reshape(len(tools["tool_id"]), len(criteria))
+        return dict(tools, values=values[:, columns])
+
+    scored_tools: Sequence[Dict[str, Any]] = snapshot.get("scored_tools", [])
+    columns = {
+        field: [item[field] for item in scored_tools]
+        for field in ("tool_id", "tool_name", "total_score", "normalized_score", "rank")
+    }
+    columns["values"] = np.array(
+        [[item["criteria"][key]["value"] for key in CRITERIA_KEYS] for item in scored_tools],
+        dtype=np.float64,
+    ).reshape(len(scored_tools), len(CRITERIA_KEYS))
+    return columns
+
+
+def snapshot_matrix(snapshot: Dict[str, Any] | None) -> Tuple[List[int], List[str], np.ndarray]:
+    """Return stored tool ids, names and the ``tools x criteria`` value matrix."""
+
+    columns = _tool_columns(snapshot)
+    return list(columns["tool_id"]), list(columns["tool_name"]), columns["values"]
+
+
+def snapshot_scores(snapshot: Dict[str, Any] | None) -> Dict[str, Any]:
+    """Return stored tool ids and names, value matrix and the scores and ranks they were given."""
+
+    columns = _tool_columns(snapshot)
+    return {
+        field: columns[field]
+        for field in ("tool_id", "tool_name", "values", "total_score", "normalized_score", "rank")
+    }
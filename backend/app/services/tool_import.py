@@ -0,0 +1,271 @@
+"""Bulk, single-transaction catalogue import and sync from streamed JSON."""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import json
+from typing import Any, AsyncIterator, Dict, List, Sequence, Set, Tuple
+
+from fastapi import HTTPException, Request, status
+from pydantic import ValidationError
+from sqlalchemy import delete, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models import Tool
+from app.schemas.tool import ToolBase, ToolCreate
+
+
+IMPORT_MODES = ("replace", "upsert")
+
+# Rows written per executemany INSERT ... RETURNING.
+IMPORT_CHUNK_SIZE = 1000
+
+_UPSERT_DIALECTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+class CatalogueParseError(ValueError):
+    """Raised when an uploaded catalogue is not a JSON array or NDJSON of objects."""
+
+
+class CatalogueParser:
+    """Incremental parser for a JSON array or newline-delimited JSON objects.
+
+    Bytes are fed as they arrive and every complete top-level object is
+    returned as soon as it has been read, so only the current partial entry
+    is ever buffered.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._consumed = 0
+        self._array: bool | None = None
+        self._closed = False
+        self._after_entry = False
+        self._after_comma = False
+
+    def _skip(self, position: int) -> int:
+        while position < len(self._buffer) and self._buffer[position] in " \t\r\n":
+            position += 1
+        return position
+
+    def _drain(self, final: bool) -> List[Dict[str, Any]]:
+        documents: List[Dict[str, Any]] = []
+        position = self._skip(0)
+
+        if self._array is None and position < len(self._buffer):
+            self._array = self._buffer[position] == "["
+            if self._array:
+                position = self._skip(position + 1)
+
+        while position < len(self._buffer) and not self._closed:
+            if self._array:
+                char = self._buffer[position]
+                if char == "]" and not self._after_comma:
+                    self._closed = True
+                    position += 1
+                    break
+                if self._after_entry:
+                    if char != ",":
+                        raise CatalogueParseError("Expected ',' or ']' between array entries")
+                    self._after_entry = False
+                    self._after_comma = True
+                    position = self._skip(position + 1)
+                    continue
+            try:
+                document, end = self._decoder.raw_decode(self._buffer, position)
+            except json.JSONDecodeError as exc:
+                if final:
+                    raise CatalogueParseError(f"Invalid JSON near character {self._consumed + exc.pos}") from None
+                break
+            if not isinstance(document, dict):
+                raise CatalogueParseError("Catalogue entries must be JSON objects")
+            documents.append(document)
+            self._after_entry = True
+            self._after_comma = False
+            position = self._skip(end)
+
+        self._buffer = self._buffer[position:]
+        self._consumed += position
+        return documents
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        self._buffer += self._text.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Parse whatever remains and check the upload ended cleanly."""
+
+        self._buffer += self._text.decode(b"", final=True)
+        documents = self._drain(final=True)
+        if self._buffer.strip():
+            raise CatalogueParseError("Unexpected data after the catalogue")
+        if self._array and not self._closed:
+            raise CatalogueParseError("Unterminated JSON array")
+        return documents
+
+
+async def catalogue_entries(request: Request) -> AsyncIterator[ToolCreate]:
+    """Parse and validate catalogue entries as the request body streams in."""
+
+    parser = CatalogueParser()
+    position = 0
+
+    def validate(document: dict) -> ToolCreate:
+        try:
+            return ToolCreate.model_validate(document)
+        except ValidationError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Entry {position}: " + "; ".join(
+                    f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+                ),
+            ) from None
+
+    try:
+        async for chunk in request.stream():
+            for document in parser.feed(chunk):
+                yield validate(document)
+                position += 1
+        for document in parser.close():
+            yield validate(document)
+            position += 1
+    except CatalogueParseError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from None
+
+
+def tool_content_hash(entry: ToolBase) -> str:
+    """Return a stable SHA-256 over every ``ToolBase`` field of a tool."""
+
+    payload = entry.model_dump(include=set(ToolBase.model_fields))
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def stored_content_hash(tool: Tool) -> str:
+    """Hash a persisted tool's current content, for rows written before hashes were stored."""
+
+    return tool_content_hash(ToolBase.model_validate(tool, from_attributes=True))
+
+
+def clear_catalogue(session: Session) -> None:
+    session.execute(delete(Tool))
+
+
+def write_tools(session: Session, entries: Sequence[ToolCreate], mode: str = "replace") -> List[int]:
+    """Insert (or upsert by slug) one chunk of tools and return their ids in input order.
+
+    Runs inside the caller's transaction; nothing is committed here.
+    """
+
+    if not entries:
+        return []
+
+    # Core statements against the table skip the ORM bulk-insert bookkeeping.
+    table = Tool.__table__
+    rows = [dict(entry.model_dump(), content_hash=tool_content_hash(entry)) for entry in entries]
+    if mode == "upsert":
+        dialect = session.get_bind().dialect.name
+        if dialect not in _UPSERT_DIALECTS:
+            raise ValueError(f"Upsert import is not supported on {dialect}")
+        # One statement cannot touch the same row twice; the last entry wins.
+        rows = list({row["slug"]: row for row in rows}.values())
+        statement = _UPSERT_DIALECTS[dialect](table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.slug],
+            set_={column: statement.excluded[column] for column in rows[0] if column != "slug"},
+        )
+    else:
+        statement = insert(table)
+
+    result = session.execute(statement.returning(table.c.id, sort_by_parameter_order=True), rows)
+    return list(result.scalars())
+
+
+class CatalogueSync:
+    """Diff an incoming catalogue against the stored one by slug and content hash.
+
+    Only ``id``, ``slug`` and ``content_hash`` of stored tools are loaded;
+    incoming entries are hashed as they are added and just the changed ones
+    are kept, so an unchanged feed produces no writes at all.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._existing: Dict[str, Tuple[int, str]] = {}
+        self._backfill: Dict[int, str] = {}
+
+        unhashed: List[int] = []
+        for tool_id, slug, content_hash in session.query(Tool.id, Tool.slug, Tool.content_hash):
+            self._existing[slug] = (tool_id, content_hash)
+            if content_hash is None:
+                unhashed.append(tool_id)
+        # Rows that predate the hash column are hashed once from their content.
+        for start in range(0, len(unhashed), IMPORT_CHUNK_SIZE):
+            for tool in session.query(Tool).filter(Tool.id.in_(unhashed[start : start + IMPORT_CHUNK_SIZE])):
+                content_hash = stored_content_hash(tool)
+                self._existing[tool.slug] = (tool.id, content_hash)
+                self._backfill[tool.id] = content_hash
+            session.expunge_all()
+
+        self._seen: Set[str] = set()
+        self._inserts: Dict[str, ToolCreate] = {}
+        self._updates: Dict[str, ToolCreate] = {}
+        self._unchanged = 0
+
+    def add(self, entry: ToolCreate) -> None:
+        """Classify one incoming entry; a repeated slug replaces the earlier entry."""
+
+        if entry.slug in self._seen:
+            if entry.slug in self._existing and entry.slug not in self._updates:
+                self._unchanged -= 1
+            self._inserts.pop(entry.slug, None)
+            self._updates.pop(entry.slug, None)
+        self._seen.add(entry.slug)
+
+        stored = self._existing.get(entry.slug)
+        if stored is None:
+            self._inserts[entry.slug] = entry
+        elif stored[1] != tool_content_hash(entry):
+            self._updates[entry.slug] = entry
+        else:
+            self._unchanged += 1
+
+    def apply(self) -> Dict[str, Any]:
+        """Write the needed inserts, updates and deletes inside the caller's transaction."""
+
+        deleted = [slug for slug in self._existing if slug not in self._seen]
+        deleted_ids = [self._existing[slug][0] for slug in deleted]
+        for start in range(0, len(deleted_ids), IMPORT_CHUNK_SIZE):
+            chunk = deleted_ids[start : start + IMPORT_CHUNK_SIZE]
+            self._session.execute(delete(Tool).where(Tool.id.in_(chunk)))
+
+        updates = [
+            dict(entry.model_dump(), id=self._existing[slug][0], content_hash=tool_content_hash(entry))
+            for slug, entry in self._updates.items()
+        ]
+        # Unchanged rows that predate the hash column only get their hash recorded.
+        skipped = {row["id"] for row in updates}.union(deleted_ids)
+        hashes = [
+            {"id": tool_id, "content_hash": content_hash}
+            for tool_id, content_hash in self._backfill.items()
+            if tool_id not in skipped
+        ]
+        for rows in (updates, hashes):
+            for start in range(0, len(rows), IMPORT_CHUNK_SIZE):
+                self._session.execute(update(Tool), rows[start : start + IMPORT_CHUNK_SIZE])
+
+        inserts = list(self._inserts.values())
+        created_ids: List[int] = []
+        for start in range(0, len(inserts), IMPORT_CHUNK_SIZE):
+            created_ids += write_tools(self._session, inserts[start : start + IMPORT_CHUNK_SIZE])
+
+        return {
+            "created": [{"tool_id": tool_id, "slug": entry.slug} for tool_id, entry in zip(created_ids, inserts)],
+            "updated": [{"tool_id": self._existing[slug][0], "slug": slug} for slug in self._updates],
+            "deleted": [{"tool_id": self._existing[slug][0], "slug": slug} for slug in deleted],
+            "unchanged": self._unchanged,
+        }
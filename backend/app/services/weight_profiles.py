@@ -0,0 +1,148 @@
+"""Lookup table of weight profiles over the bucketed questionnaire answer space.
+
+``calculate_weights`` only looks at a handful of enumerated answers, two
+booleans and two sliders compared against fixed thresholds, so every answer
+set falls into one of a finite number of buckets. Each bucket's profile is
+computed once from a representative answer set and stored as a frozen vector.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from app.schemas.evaluation import EvaluationAnswerSet
+from app.services.scoring_matrix import CRITERIA_KEYS
+
+
+def _slider_bucket(value: int) -> str:
+    if value >= 70:
+        return ">=70"
+    if value >= 40:
+        return "40-69"
+    return "<40"
+
+
+# Field -> (bucketing function, representative answer per bucket). The
+# functions mirror exactly which comparisons calculate_weights performs,
+# including which answers are lower-cased before comparing.
+BUCKETS: Dict[str, Tuple[Any, Dict[Any, Any]]] = {
+    "project_type": (
+        lambda value: value.lower() if value.lower() in ("web", "mobile", "api") else "other",
+        {"web": "web", "mobile": "mobile", "api": "api", "other": "desktop"},
+    ),
+    "team_scripting_skill": (
+        lambda value: value.lower() if value.lower() in ("low", "medium") else "high",
+        {"low": "low", "medium": "medium", "high": "high"},
+    ),
+    "budget": (
+        lambda value: value if value in ("free", "< $500") else "other",
+        {"free": "free", "< $500": "< $500", "other": "> $500"},
+    ),
+    "test_run_frequency": (
+        lambda value: value.lower() if value.lower() in ("daily", "weekly") else "other",
+        {"daily": "daily", "weekly": "weekly", "other": "monthly"},
+    ),
+    "ci_cd_required": (bool, {True: True, False: False}),
+    "cross_browser_required": (bool, {True: True, False: False}),
+    "ai_automation_preference": (_slider_bucket, {"<40": 0, "40-69": 40, ">=70": 70}),
+    "reporting_importance": (_slider_bucket, {"<40": 0, "40-69": 40, ">=70": 70}),
+    "maintenance_team_size": (
+        lambda value: value if value in (">10", "1-3") else "other",
+        {">10": ">10", "1-3": "1-3", "other": "4-10"},
+    ),
+    "preferred_approach": (
+        lambda value: value.lower() if value.lower() in ("scriptless", "keyword-driven") else "hybrid",
+        {"scriptless": "scriptless", "keyword-driven": "keyword-driven", "hybrid": "hybrid"},
+    ),
+    "expected_duration": (
+        lambda value: value if value in (">1 year", "<6 months") else "other",
+        {">1 year": ">1 year", "<6 months": "<6 months", "other": "6-12 months"},
+    ),
+}
+
+BUCKET_FIELDS = list(BUCKETS)
+
+# Answers calculate_weights ignores; representatives need some value.
+_NEUTRAL_ANSWERS = {"primary_language": "other"}
+
+
+def answer_bucket(answers: EvaluationAnswerSet) -> Tuple[Any, ...]:
+    """Return the bucket an answer set falls into, in ``BUCKET_FIELDS`` order."""
+
+    return tuple(BUCKETS[field][0](getattr(answers, field)) for field in BUCKET_FIELDS)
+
+
+def representative_answers(bucket: Tuple[Any, ...]) -> EvaluationAnswerSet:
+    values = {field: BUCKETS[field][1][key] for field, key in zip(BUCKET_FIELDS, bucket)}
+    return EvaluationAnswerSet(**values, **_NEUTRAL_ANSWERS)
+
+
+def all_buckets() -> Iterator[Tuple[Any, ...]]:
+    return itertools.product(*(BUCKETS[field][1].keys() for field in BUCKET_FIELDS))
+
+
+class WeightProfileTable:
+    """Lazily filled mapping of answer buckets to frozen weight vectors."""
+
+    def __init__(self, calculate: Callable[[EvaluationAnswerSet], Dict[str, float]]) -> None:
+        self._calculate = calculate
+        self._profiles: Dict[Tuple[Any, ...], Tuple[float, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def _profile(self, bucket: Tuple[Any, ...]) -> Tuple[float, ...]:
+        profile = self._profiles.get(bucket)
+        if profile is None:
+            weights = self._calculate(representative_answers(bucket))
+            profile = tuple(weights[key] for key in CRITERIA_KEYS)
+            self._profiles[bucket] = profile
+        return profile
+
+    def lookup(self, answers: EvaluationAnswerSet) -> Dict[str, float]:
+        """Return the weight profile for an answer set as a fresh dictionary."""
+
+        return dict(zip(CRITERIA_KEYS, self._profile(answer_bucket(answers))))
+
+    def fill(self) -> None:
+        """Compute every bucket up front."""
+
+        for bucket in all_buckets():
+            self._profile(bucket)
+
+    def profiles(self) -> Iterator[Tuple[Dict[str, Any], Dict[str, float]]]:
+        """Yield every ``(bucket, weights)`` pair of the answer space, for audit exports."""
+
+        for bucket in all_buckets():
+            yield dict(zip(BUCKET_FIELDS, bucket)), dict(zip(CRITERIA_KEYS, self._profile(bucket)))
+
+    def verify(self, samples: int = 500, seed: int = 0) -> List[Dict[str, Any]]:
+        """Compare lookups with the wrapped function on random answer sets.
+
+        Samples mix representatives with slider boundaries, unlisted values
+        and case variants so bucketing mistakes surface. Returns mismatches.
+        """
+
+        rng = random.Random(seed)
+        choices: Dict[str, List[Any]] = {field: list(BUCKETS[field][1].values()) for field in BUCKET_FIELDS}
+        for field in ("ai_automation_preference", "reporting_importance"):
+            choices[field] = [0, 39, 40, 69, 70, 100]
+        for field in ("project_type", "team_scripting_skill", "test_run_frequency", "preferred_approach"):
+            choices[field] += [value.upper() for value in choices[field] if isinstance(value, str)]
+        for field in ("budget", "maintenance_team_size", "expected_duration"):
+            choices[field] += ["FREE", "unknown"]
+
+        mismatches: List[Dict[str, Any]] = []
+        for _ in range(samples):
+            answers = EvaluationAnswerSet(
+                **{field: rng.choice(options) for field, options in choices.items()},
+                **_NEUTRAL_ANSWERS,
+            )
+            expected = self._calculate(answers)
+            actual = self.lookup(answers)
+            if actual != expected:
+                mismatches.append({"answers": answers.model_dump(), "expected": expected, "actual": actual})
+        return mismatches
+
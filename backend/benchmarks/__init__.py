@@ -0,0 +1 @@
+"""Benchmarks for the scoring engine and the HTTP API."""
@@ -0,0 +1,47 @@
+"""End-to-end tier: drive the FastAPI app in-process with ``TestClient``."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+from app.schemas.evaluation import EvaluationAnswerSet
+from app.services.result_cache import result_cache
+
+from .timing import measure
+
+
+def bench_api(tools: List[Dict[str, Any]], answers: List[EvaluationAnswerSet]) -> Dict[str, Any]:
+    from app.main import app
+
+    headers = {"Authorization": f"Bearer {get_settings().secret_key}"}
+    bodies = [{"answers": answer_set.model_dump()} for answer_set in answers]
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/v1/tools/import/json",
+            content=json.dumps(tools),
+            headers={**headers, "Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+
+        def post(path: str, body: Dict[str, Any]) -> None:
+            client.post(path, json=body, headers=headers).raise_for_status()
+
+        def run_cold(body: Dict[str, Any]) -> None:
+            result_cache.clear()
+            post("/api/v1/evaluations/run", body)
+
+        results: Dict[str, Any] = {
+            "run_cold": measure(run_cold, bodies),
+            "run_warm": measure(lambda body: post("/api/v1/evaluations/run", body), bodies, warmup=len(bodies)),
+            "run_persist": measure(lambda body: post("/api/v1/evaluations/run", dict(body, persist=True)), bodies),
+            "list_tools": measure(lambda _: client.get("/api/v1/tools/").raise_for_status(), bodies),
+            "list_evaluations": measure(lambda _: client.get("/api/v1/evaluations/").raise_for_status(), bodies),
+        }
+    for name, stats in results.items():
+        stats["requests_per_second"] = stats.pop("per_second")
+    return results
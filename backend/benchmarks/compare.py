@@ -0,0 +1,50 @@
+"""Compare two benchmark result files and flag throughput regressions.
+
+    python -m benchmarks.compare base.json head.json --threshold 0.10
+
+Exits with status 1 when any measurement's throughput drops by more than
+the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def _throughputs(report: Dict[str, Any]) -> Iterator[Tuple[str, float]]:
+    for size, measurements in report.get("engine", {}).items():
+        for name, stats in measurements.items():
+            yield f"engine[{size}].{name}", stats["per_second"]
+    for name, stats in report.get("api", {}).items():
+        yield f"api.{name}", stats["requests_per_second"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative throughput drop")
+    args = parser.parse_args(argv)
+
+    base = dict(_throughputs(json.loads(args.base.read_text())))
+    head = dict(_throughputs(json.loads(args.head.read_text())))
+
+    regressions = 0
+    print(f"{'measurement':<40} {'base/s':>12} {'head/s':>12} {'change':>8}")
+    for name in sorted(base.keys() & head.keys()):
+        change = (head[name] - base[name]) / base[name] if base[name] else 0.0
+        flag = ""
+        if change < -args.threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{name:<40} {base[name]:>12.1f} {head[name]:>12.1f} {change:>+8.1%}{flag}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Scoring engine tier: weight calculation, scoring and ``EvaluationEngine.run``."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from sqlalchemy.orm import Session
+
+from app.core.database import Base, SessionLocal, engine
+from app.models import Tool
+from app.schemas.evaluation import EvaluationAnswerSet
+from app.schemas.tool import ToolCreate
+from app.services.catalogue_cache import bump_catalogue_version, get_catalogue
+from app.services.evaluation_service import (
+    EvaluationEngine,
+    calculate_weights,
+    compute_matrix_scores,
+    compute_scores,
+    resolve_weights,
+)
+from app.services.result_cache import result_cache
+from app.services.tool_import import IMPORT_CHUNK_SIZE, clear_catalogue, write_tools
+
+from .timing import measure
+
+
+def load_catalogue(session: Session, tools: List[Dict[str, Any]]) -> None:
+    """Replace the database catalogue with ``tools`` and invalidate cached snapshots."""
+
+    Base.metadata.create_all(bind=engine)
+    clear_catalogue(session)
+    entries = [ToolCreate(**tool) for tool in tools]
+    for start in range(0, len(entries), IMPORT_CHUNK_SIZE):
+        write_tools(session, entries[start : start + IMPORT_CHUNK_SIZE])
+    session.commit()
+    bump_catalogue_version()
+    result_cache.clear()
+
+
+def bench_engine(
+    tools: List[Dict[str, Any]],
+    answers: List[EvaluationAnswerSet],
+    reference_max_tools: int,
+) -> Dict[str, Any]:
+    session = SessionLocal.session_factory()
+    try:
+        load_catalogue(session, tools)
+        catalogue = get_catalogue(session)
+        weights = [resolve_weights(answer_set) for answer_set in answers]
+        pairs = list(zip(answers, weights))
+
+        results: Dict[str, Any] = {
+            "calculate_weights": measure(calculate_weights, answers),
+            "matrix_scores": measure(lambda pair: compute_matrix_scores(catalogue.matrix, *pair), pairs),
+        }
+        if len(tools) <= reference_max_tools:
+            orm_tools = session.query(Tool).order_by(Tool.overall_score.desc()).all()
+            results["compute_scores"] = measure(lambda pair: compute_scores(orm_tools, *pair), pairs)
+
+        def cold_run(answer_set: EvaluationAnswerSet) -> None:
+            result_cache.clear()
+            EvaluationEngine.run(get_catalogue(session), answer_set)
+
+        results["engine_run_cold"] = measure(cold_run, answers)
+        # Warm-up covers every input, so each timed call is a result cache hit.
+        results["engine_run_warm"] = measure(
+            lambda answer_set: EvaluationEngine.run(get_catalogue(session), answer_set), answers, warmup=len(answers)
+        )
+
+        def cold_top_k(answer_set: EvaluationAnswerSet) -> None:
+            result_cache.clear()
+            EvaluationEngine.run(get_catalogue(session), answer_set, top_k=10)
+
+        results["engine_run_top_k"] = measure(cold_top_k, answers)
+        return results
+    finally:
+        session.close()
@@ -0,0 +1,89 @@
+"""Run the benchmark suite and write the results as JSON.
+
+    python -m benchmarks.run --sizes 100,1000,10000 --output bench.json
+
+Runs against a throwaway SQLite database unless ``DATABASE_URL`` is set.
+Compare two result files with ``python -m benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,10000", help="comma-separated catalogue sizes")
+    parser.add_argument("--answers", type=int, default=200, help="answer sets per engine measurement")
+    parser.add_argument("--reference-max-tools", type=int, default=10000, help="skip compute_scores above this size")
+    parser.add_argument("--api-tools", type=int, default=1000, help="catalogue size for the end-to-end tier")
+    parser.add_argument("--api-requests", type=int, default=200, help="requests per end-to-end measurement")
+    parser.add_argument("--skip-api", action="store_true", help="only run the engine tier")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+
+    # The app binds its engine from settings at import time, so point it at a
+    # scratch database before anything from ``app`` is imported.
+    workdir = tempfile.mkdtemp(prefix="qa-benchmarks-")
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{workdir}/benchmarks.db")
+    os.environ.setdefault("WEIGHT_TABLE_SELF_CHECK", "false")
+
+    from .api import bench_api
+    from .engine import bench_engine
+    from .synthetic import random_answer_sets, synthetic_catalogue
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    answers = random_answer_sets(args.answers, seed=args.seed + 1)
+
+    report: Dict[str, Any] = {
+        "revision": _git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "parameters": {key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()},
+        "engine": {},
+    }
+
+    for size in sizes:
+        print(f"engine tier: {size} tools", file=sys.stderr)
+        report["engine"][str(size)] = bench_engine(
+            synthetic_catalogue(size, seed=args.seed), answers, args.reference_max_tools
+        )
+
+    if not args.skip_api:
+        print(f"api tier: {args.api_tools} tools", file=sys.stderr)
+        report["api"] = bench_api(
+            synthetic_catalogue(args.api_tools, seed=args.seed),
+            random_answer_sets(args.api_requests, seed=args.seed + 2),
+        )
+
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Synthetic catalogues and questionnaire answers shaped like the seed data."""
+
+from __future__ import annotations
+
+import copy
+import random
+from typing import Any, Dict, List
+
+from app.schemas.evaluation import EvaluationAnswerSet
+from app.seeds.tool_data import SEED_TOOLS
+
+
+PRICING_TIERS = ["free", "< $500", "> $500"]
+SKILL_LEVELS = ["low", "medium", "high"]
+LANGUAGES = ["javascript", "typescript", "python", "java", "c#", "ruby", "go"]
+RATED_FIELDS = [
+    "ai_capability",
+    "maintenance_effort",
+    "reporting_quality",
+    "execution_speed",
+    "analytics_depth",
+    "community_strength",
+]
+
+
+def synthetic_catalogue(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Return ``size`` tool payloads derived from ``SEED_TOOLS`` with randomised ratings."""
+
+    rng = random.Random(seed)
+    tools: List[Dict[str, Any]] = []
+    for index in range(size):
+        tool = copy.deepcopy(SEED_TOOLS[index % len(SEED_TOOLS)])
+        tool["name"] = f"{tool['name']} {index}"
+        tool["slug"] = f"{tool['slug']}-{index}"
+        tool["overall_score"] = round(rng.uniform(2.5, 5.0), 1)
+        tool["pricing_tier"] = rng.choice(PRICING_TIERS)
+        tool["recommended_team_skill"] = rng.choice(SKILL_LEVELS)
+        tool["ci_cd_support"] = rng.random() < 0.8
+        tool["supports_cross_browser"] = rng.random() < 0.7
+        for field in RATED_FIELDS:
+            tool[field] = rng.randint(1, 5)
+        tool["languages_supported"] = rng.sample(LANGUAGES, rng.randint(1, 4))
+        tool["criteria_scores"] = {key: rng.randint(1, 5) for key in tool["criteria_scores"]}
+        tools.append(tool)
+    return tools
+
+
+def random_answer_sets(count: int, seed: int = 1) -> List[EvaluationAnswerSet]:
+    """Return ``count`` questionnaire answer sets drawn from the frontend's options."""
+
+    rng = random.Random(seed)
+    return [
+        EvaluationAnswerSet(
+            project_type=rng.choice(["web", "mobile", "api", "desktop"]),
+            team_scripting_skill=rng.choice(SKILL_LEVELS),
+            primary_language=rng.choice(LANGUAGES),
+            budget=rng.choice(PRICING_TIERS),
+            test_run_frequency=rng.choice(["daily", "weekly", "monthly"]),
+            ci_cd_required=rng.random() < 0.5,
+            ai_automation_preference=rng.randint(0, 100),
+            maintenance_team_size=rng.choice(["1-3", "4-10", ">10"]),
+            cross_browser_required=rng.random() < 0.5,
+            reporting_importance=rng.randint(0, 100),
+            preferred_approach=rng.choice(["scriptless", "keyword-driven", "hybrid"]),
+            expected_duration=rng.choice(["<6 months", "6-12 months", ">1 year"]),
+        )
+        for _ in range(count)
+    ]
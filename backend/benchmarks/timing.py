@@ -0,0 +1,45 @@
+"""Timing and memory measurement helpers."""
+
+from __future__ import annotations
+
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Sequence
+
+
+def measure(call: Callable[[Any], Any], inputs: Sequence[Any], warmup: int = 1) -> Dict[str, float]:
+    """Call ``call`` once per input and summarise latency and throughput.
+
+    Peak memory is the largest traced allocation of a single call, measured
+    in a separate pass so tracing does not distort the timings.
+    """
+
+    for value in inputs[:warmup]:
+        call(value)
+
+    durations = []
+    started = time.perf_counter()
+    for value in inputs:
+        call_started = time.perf_counter()
+        call(value)
+        durations.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    peak = 0
+    for value in inputs[: min(len(inputs), 5)]:
+        tracemalloc.start()
+        call(value)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    durations.sort()
+    return {
+        "iterations": len(inputs),
+        "seconds": elapsed,
+        "per_second": len(inputs) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(durations) * 1000,
+        "p50_ms": durations[len(durations) // 2] * 1000,
+        "p95_ms": durations[min(len(durations) - 1, int(len(durations) * 0.95))] * 1000,
+        "peak_memory_kb": peak / 1024,
+    }
@@ -0,0 +1,87 @@
+"""Process scoring backend: work is spread over the workers and matches the in-process path.
+
+    python -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from app.services.scoring_matrix import CRITERIA_KEYS, ScoringMatrix
+from app.services.scoring_pool import ProcessScoringBackend, _PendingChunk
+from benchmarks.synthetic import random_answer_sets, synthetic_catalogue
+
+
+PROCESSES = 2
+
+
+class ProcessScoringBackendTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        tools = synthetic_catalogue(20_000)
+        cls.matrix = ScoringMatrix.from_tools(SimpleNamespace(id=index + 1, **tool) for index, tool in enumerate(tools))
+        cls.answer_sets = random_answer_sets(64)
+        cls.weights = [
+            {key: 1.0 + (index + column) % 3 for column, key in enumerate(CRITERIA_KEYS)}
+            for index in range(len(cls.answer_sets))
+        ]
+        cls.backend = ProcessScoringBackend(PROCESSES)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.backend.close()
+
+    def test_batch_is_split_across_workers(self) -> None:
+        for count, rows in ((64, 5), (64, len(self.matrix)), (1000, 5)):
+            chunks = -(-count // self.backend.chunk_size(count, rows))
+            self.assertGreaterEqual(chunks, PROCESSES, (count, rows))
+
+        workers = set()
+        collect = _PendingChunk.collect
+
+        def recording_collect(chunk: _PendingChunk):
+            ranked = collect(chunk)
+            workers.add(chunk.worker)
+            return ranked
+
+        with mock.patch.object(_PendingChunk, "collect", recording_collect):
+            ranked = list(
+                self.backend.rank_batch(self.matrix, self.answer_sets, self.weights, [None] * len(self.answer_sets))
+            )
+
+        self.assertEqual(len(ranked), len(self.answer_sets))
+        self.assertGreater(len(workers), 1)
+
+    def test_matches_inline_scores(self) -> None:
+        depths = [5] * len(self.answer_sets)
+        inline = self.matrix.score_batch(self.answer_sets, self.weights)
+        pooled = self.backend.rank_batch(self.matrix, self.answer_sets, self.weights, depths)
+        for expected, actual in zip(inline, pooled):
+            self.assertEqual(
+                [item.model_dump() for item in expected.breakdowns(5)],
+                [item.model_dump() for item in actual.breakdowns(5)],
+            )
+
+    def test_retired_catalogue_outlives_running_batches(self) -> None:
+        # Enough chunks that some are only submitted after the catalogue changes.
+        answer_sets = self.answer_sets * 32
+        weights = self.weights * 32
+        running = self.backend.rank_batch(self.matrix, answer_sets, weights, [5] * len(answer_sets))
+        first = next(running)
+
+        # Scoring another catalogue retires the segment the running batch still uses,
+        # and moves the workers onto the new one.
+        other = ScoringMatrix.from_tools(
+            SimpleNamespace(id=index + 1, **tool) for index, tool in enumerate(synthetic_catalogue(100, seed=1))
+        )
+        list(self.backend.rank_batch(other, self.answer_sets, self.weights, [5] * len(self.answer_sets)))
+
+        remaining = list(running)
+        self.assertEqual(len(remaining) + 1, len(answer_sets))
+        expected = self.matrix.score(answer_sets[-1], weights[-1])
+        self.assertEqual(remaining[-1].breakdowns(5), expected.breakdowns(5))
+
+if __name__ == "__main__":
+    unittest.main()